@@ -1,17 +1,102 @@
 import streamlit as st
 import pandas as pd
+import hashlib
 import io
 
 from app.layout import render_header
 from app.parsers import (parse_meeting_organizer, parse_uploaded_schedules)
-from app.scheduler import run_scheduler
+from app.scheduler import run_scheduler, feasibility_report
+from app.seller_index import build_seller_index
+from app.snapshot import load_snapshot, snapshot_bytes
+from app.cache import LRUCache, fingerprint
 from app.html_renderer import (
     render_supplier_html,
     render_rep_html,
-    build_combined_html,
+    render_all_supplier_html,
+    render_all_rep_html,
+    combined_html_volumes,
+    export_combined_html,
     render_request_summary_table
 )
 
+# Scheduler parameters used by the UI (part of the schedule cache key)
+CORE_SEEDS = 10
+ADDON_SEEDS = 10
+TIME_BUDGET = None      # seconds; when set, seed counts are ignored (anytime search)
+
+# Processes used to render Save-ALL pages (1 = render in-process)
+RENDER_WORKERS = 1
+
+# Schedule pages per Save-ALL file; more pages are split into volumes
+# and downloaded as a .zip (None = always one file)
+PAGES_PER_VOLUME = 250
+
+# Bounded caches shared by every session on this server
+CACHE_MAX_ENTRIES = 8
+PAGE_CACHE_MAX_BYTES = 64 * 1024 * 1024    # rendered schedule pages
+
+
+def workbook_hash(file_bytes):
+    return hashlib.sha256(file_bytes).hexdigest()
+
+
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def cached_parse(file_hash, _file_bytes):
+    """
+    parse_meeting_organizer + seller index, keyed by workbook content hash
+    (the bytes themselves are not hashed again by Streamlit).
+    """
+    suppliers_df, reps_df, preferences, sellers = parse_meeting_organizer(
+        io.BytesIO(_file_bytes)
+    )
+    return suppliers_df, reps_df, preferences, sellers, build_seller_index(sellers)
+
+
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def cached_schedule(
+    file_hash,
+    core_seeds,
+    addon_seeds,
+    time_budget,
+    _preferences,
+    _reps_df,
+    _sellers,
+    _seller_index
+):
+    """
+    run_scheduler keyed by workbook hash + scheduler parameters; the
+    parsed inputs are fully determined by file_hash.
+    """
+    return run_scheduler(
+        _preferences,
+        _reps_df,
+        _sellers,
+        core_seeds=core_seeds,
+        addon_seeds=addon_seeds,
+        seller_index=_seller_index,
+        input_key=file_hash,
+        time_budget=time_budget
+    )
+
+
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def cached_feasibility(file_hash, _preferences, _reps_df, _sellers, _seller_index):
+    """feasibility_report keyed by workbook hash (no seeds are run)."""
+    return feasibility_report(
+        _preferences,
+        _reps_df,
+        _sellers,
+        seller_index=_seller_index,
+        input_key=file_hash
+    )
+
+
+@st.cache_resource(show_spinner=False)
+def page_cache():
+    """Rendered supplier / rep pages, keyed by a fingerprint of what each shows."""
+    return LRUCache(max_entries=None, max_bytes=PAGE_CACHE_MAX_BYTES)
+
+
 def attach_substitutions(supplier_sched, supplier_summary):
     """
     Add a 'substitutions' column to supplier_sched by mapping:
@@ -234,7 +319,11 @@ def main():
     if not uploaded:
         return
 
-    suppliers_df, reps_df, preferences, sellers = parse_meeting_organizer(uploaded)
+    file_bytes = uploaded.getvalue()
+    file_hash = workbook_hash(file_bytes)
+    suppliers_df, reps_df, preferences, sellers, seller_index = cached_parse(
+        file_hash, file_bytes
+    )
 
     # ------------------------------------------------------------
     # Mode Selection
@@ -249,12 +338,31 @@ def main():
     # Scheduler Mode
     # ------------------------------------------------------------
     if mode == "Run Scheduler":
+        impossible = cached_feasibility(
+            file_hash, preferences, reps_df, sellers, seller_index
+        )
+
+        if impossible:
+            n_impossible = sum(len(v) for v in impossible.values())
+            with st.expander(f"{n_impossible} requests cannot be scheduled"):
+                for supplier, requests in impossible.items():
+                    for req in requests:
+                        st.markdown(
+                            f"**{supplier}** – {req['request_name']}: "
+                            + "; ".join(req["reasons"])
+                        )
+
         if st.button("Run Scheduler"):
             with st.spinner("Generating schedules… this may take a moment."):
-                supplier_sched, rep_sched, supplier_summary, validation = run_scheduler(
+                supplier_sched, rep_sched, supplier_summary, validation = cached_schedule(
+                    file_hash,
+                    CORE_SEEDS,
+                    ADDON_SEEDS,
+                    TIME_BUDGET,
                     preferences,
                     reps_df,
-                    sellers
+                    sellers,
+                    seller_index
                 )
 
                 for i in supplier_summary:
@@ -267,6 +375,9 @@ def main():
                 st.session_state["rep_sched"] = rep_sched
                 st.session_state["supplier_summary"] = supplier_summary
                 st.session_state["validation"] = validation
+                st.session_state["schedule_inputs"] = (
+                    suppliers_df, reps_df, preferences, sellers
+                )
 
                 missing = [
                     s for s in suppliers_df["Supplier"]
@@ -285,23 +396,47 @@ def main():
     # ------------------------------------------------------------
     if mode == "Upload Existing Schedules":
         uploaded_sched = st.file_uploader(
-            "Upload Scheduler Output Excel",
-            type=["xlsx"],
+            "Upload Scheduler Output (Excel or Snapshot)",
+            type=["xlsx", "sgf"],
             key="uploaded_schedules"
         )
 
         if uploaded_sched and st.button("Load Schedules"):
-            (
-                supplier_sched,
-                rep_sched,
-                supplier_summary,
-                validation
-            ) = parse_uploaded_schedules(uploaded_sched)
+            # Schedules are rendered with the inputs they were built from
+            schedule_inputs = (suppliers_df, reps_df, preferences, sellers)
+
+            if uploaded_sched.name.lower().endswith(".sgf"):
+                snap = load_snapshot(uploaded_sched)
+                supplier_sched = snap["supplier_sched"]
+                rep_sched = snap["rep_sched"]
+                supplier_summary = snap["supplier_summary"]
+                validation = snap["validation"]
+
+                if fingerprint(snap["suppliers_df"], snap["reps_df"]) != fingerprint(suppliers_df, reps_df):
+                    st.warning(
+                        "This snapshot was created from a different Meeting Organizer "
+                        "workbook; its own suppliers and sales reps are used."
+                    )
+
+                schedule_inputs = (
+                    snap["suppliers_df"],
+                    snap["reps_df"],
+                    snap["preferences"],
+                    snap["sellers_opp_df"]
+                )
+            else:
+                (
+                    supplier_sched,
+                    rep_sched,
+                    supplier_summary,
+                    validation
+                ) = parse_uploaded_schedules(uploaded_sched)
 
             st.session_state["supplier_sched"] = supplier_sched
             st.session_state["rep_sched"] = rep_sched
             st.session_state["supplier_summary"] = supplier_summary
             st.session_state["validation"] = validation
+            st.session_state["schedule_inputs"] = schedule_inputs
 
             st.success("Schedules loaded successfully.")
 
@@ -314,6 +449,9 @@ def main():
     supplier_sched = st.session_state["supplier_sched"]
     rep_sched = st.session_state["rep_sched"]
     supplier_summary = st.session_state["supplier_summary"]
+    suppliers_df, reps_df, preferences, sellers = st.session_state.get(
+        "schedule_inputs", (suppliers_df, reps_df, preferences, sellers)
+    )
 
     # ------------------------------------------------------------
     # Tabs
@@ -337,43 +475,32 @@ def main():
 
         with col_btn:
             if st.button("Save ALL Supplier Schedules (PDF)"):
-                pages = []
-                for supp in suppliers_df["Supplier"]:
-                    booth_s = suppliers_df.loc[
-                        suppliers_df["Supplier"] == supp,
-                        "Booth"
-                    ].iloc[0]
-
-                    df_s = supplier_sched[supplier_sched["supplier"] == supp]
-                    summary_s = supplier_summary.get(supp, {})
-
-                    pages.append(
-                        render_supplier_html(
-                            supp, booth_s, df_s, summary_s, reps_df
-                        )
+                with st.spinner("Preparing supplier schedules…"):
+                    pages = render_all_supplier_html(
+                        suppliers_df,
+                        supplier_sched,
+                        reps_df,
+                        workers=RENDER_WORKERS,
+                        bodies=True,
+                        cache=page_cache()
                     )
 
-                supplier_names = suppliers_df["Supplier"].tolist()
-
-                big_html = build_combined_html(
-                    pages,
-                    mode="Supplier",
-                    supplier_names=supplier_names
-                )
+                    file_name, data, mime = export_combined_html(
+                        combined_html_volumes(
+                            pages,
+                            PAGES_PER_VOLUME,
+                            mode="Supplier",
+                            supplier_names=suppliers_df["Supplier"].tolist()
+                        ),
+                        "SGF_Supplier_Schedules"
+                    )
 
-                st.components.v1.html(
-                    f"""
-                    <iframe id="print_all_suppliers" style="display:none;"></iframe>
-                    <script>
-                        const iframe = document.getElementById("print_all_suppliers");
-                        const doc = iframe.contentWindow.document;
-                        doc.open();
-                        doc.write(`{big_html.replace("`", "\\`")}`);
-                        doc.close();
-                        setTimeout(() => iframe.contentWindow.print(), 300);
-                    </script>
-                    """,
-                    height=0
+                st.download_button(
+                    label="Download Supplier Schedules",
+                    data=data,
+                    file_name=file_name,
+                    mime=mime,
+                    help="Open in a browser and print to PDF."
                 )
 
         booth_val = suppliers_df.loc[
@@ -390,13 +517,15 @@ def main():
             booth_val,
             df_supplier,
             supplier_summary[selected_supplier],
-            reps_df
+            reps_df,
+            cache=page_cache()
         )
 
         st.components.v1.html(html_supplier, height=950, scrolling=True)
 
         summary_html_block = render_request_summary_table(
-            supplier_summary[selected_supplier]
+            supplier_summary[selected_supplier],
+            cache=page_cache()
         )
         st.components.v1.html(summary_html_block, height=400, scrolling=True)
 
@@ -417,28 +546,28 @@ def main():
 
         with col_btn:
             if st.button("Save ALL Rep Schedules (PDF)"):
-                pages = []
-                for rep in meeting_reps:
-                    df_rep = rep_sched[rep_sched["rep"] == rep]
-                    pages.append(
-                        render_rep_html(rep, df_rep, suppliers_df, reps_df)
+                with st.spinner("Preparing rep schedules…"):
+                    pages = render_all_rep_html(
+                        meeting_reps,
+                        rep_sched,
+                        suppliers_df,
+                        reps_df,
+                        workers=RENDER_WORKERS,
+                        bodies=True,
+                        cache=page_cache()
                     )
 
-                big_html = build_combined_html(pages, mode="Rep")
-
-                st.components.v1.html(
-                    f"""
-                    <iframe id="print_all_reps" style="display:none;"></iframe>
-                    <script>
-                        const iframe = document.getElementById("print_all_reps");
-                        const doc = iframe.contentWindow.document;
-                        doc.open();
-                        doc.write(`{big_html.replace("`", "\\`")}`);
-                        doc.close();
-                        setTimeout(() => iframe.contentWindow.print(), 300);
-                    </script>
-                    """,
-                    height=0
+                    file_name, data, mime = export_combined_html(
+                        combined_html_volumes(pages, PAGES_PER_VOLUME, mode="Rep"),
+                        "SGF_Rep_Schedules"
+                    )
+
+                st.download_button(
+                    label="Download Rep Schedules",
+                    data=data,
+                    file_name=file_name,
+                    mime=mime,
+                    help="Open in a browser and print to PDF."
                 )
 
         df_rep_selected = rep_sched[rep_sched["rep"] == selected_rep]
@@ -447,7 +576,8 @@ def main():
             selected_rep,
             df_rep_selected,
             suppliers_df,
-            reps_df
+            reps_df,
+            cache=page_cache()
         )
 
         st.components.v1.html(html_rep, height=1100, scrolling=True)
@@ -481,6 +611,34 @@ def main():
                 mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
             )
 
+        st.markdown(
+            """
+            The snapshot stores the parsed inputs, both schedules and the full
+            request summary. Upload it under **Upload Existing Schedules** to
+            restore this run exactly.
+            """
+        )
+
+        if st.button("Prepare Snapshot"):
+            with st.spinner("Preparing snapshot…"):
+                snap_bytes = snapshot_bytes(
+                    suppliers_df=suppliers_df,
+                    reps_df=reps_df,
+                    preferences=preferences,
+                    sellers_opp_df=sellers,
+                    supplier_sched=supplier_sched,
+                    rep_sched=rep_sched,
+                    supplier_summary=supplier_summary,
+                    validation=st.session_state.get("validation", {})
+                )
+
+            st.download_button(
+                label="Download Schedule Snapshot",
+                data=snap_bytes,
+                file_name="SGF_Schedule_Snapshot.sgf",
+                mime="application/octet-stream"
+            )
+
 
 
 if __name__ == "__main__":
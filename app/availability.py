@@ -0,0 +1,75 @@
+import numpy as np
+from app.overlay import Overlay
+
+
+class Availability:
+    """
+    Busy matrix for a set of entities (suppliers or reps).
+
+    Rows are integer entity ids, columns are global slot indices (see
+    app.problem.TimeGrid). A True cell means the entity is already booked
+    in that slot.
+
+    fork() is copy-on-write at row level: the child shares the parent's
+    matrix and only copies the rows it books into, so branching costs
+    O(changed rows) instead of O(entities x slots).
+    """
+
+    def __init__(self, n_entities, n_slots):
+        self.busy = np.zeros((n_entities, n_slots), dtype=bool)
+        self._rows = None        # Overlay of copied rows, once forked
+        self._frozen = False
+
+    def _view(self, ids):
+        rows = self.busy[ids]
+        if self._rows:
+            for k, i in enumerate(ids):
+                row = self._rows.get(i)
+                if row is not None:
+                    rows[k] = row
+        return rows
+
+    def row(self, i):
+        if self._rows:
+            row = self._rows.get(i)
+            if row is not None:
+                return row
+        return self.busy[i]
+
+    def free_mask(self, ids):
+        """Boolean vector over slots: True where ALL entities are free."""
+        return ~self._view(ids).any(axis=0)
+
+    def free_matrix(self, ids):
+        """Boolean (len(ids) x slots) matrix: True where that entity is free."""
+        return ~self._view(ids)
+
+    def book(self, ids, slots):
+        self._set(ids, slots, True)
+
+    def release(self, ids, slots):
+        self._set(ids, slots, False)
+
+    def _set(self, ids, slots, value):
+        if self._frozen:
+            raise RuntimeError("Availability was forked; book into the fork instead.")
+
+        if self._rows is None:
+            self.busy[np.ix_(ids, slots)] = value
+            return
+
+        for i in ids:
+            row = self._rows.own.get(i)
+            if row is None:
+                row = self.row(i).copy()
+                self._rows[i] = row
+            row[list(slots)] = value
+
+    def fork(self):
+        self._frozen = True
+
+        child = Availability.__new__(Availability)
+        child.busy = self.busy
+        child._rows = Overlay() if self._rows is None else self._rows.fork()
+        child._frozen = False
+        return child
@@ -0,0 +1,210 @@
+from array import array
+import numpy as np
+import pandas as pd
+from app.problem import SESSION_LABELS
+
+
+# Booking kinds
+MEETING = 0
+INNOVATION = 1
+
+SUPPLIER_COLUMNS = [
+    "supplier", "booth", "day", "timeslot",
+    "session_type", "reps", "category", "total_opportunity"
+]
+REP_COLUMNS = [
+    "rep", "day", "timeslot", "supplier",
+    "booth", "session_type", "category", "total_opportunity"
+]
+
+
+def load_std(counts):
+    """Sample std of the non-zero loads, like value_counts().std()."""
+    counts = counts[counts > 0]
+    if len(counts) < 2:
+        return float("inf")
+    return float(counts.std(ddof=1))
+
+
+def balanced_load_std(counts):
+    """
+    Lowest load_std reachable by spreading the same total over the same
+    non-zero entries (every load floor or ceil of the mean).
+    """
+    counts = counts[counts > 0]
+    n = len(counts)
+    if n < 2:
+        return float("inf")
+    extra = int(counts.sum()) % n
+    return float(np.sqrt(extra * (n - extra) / (n * (n - 1))))
+
+
+class BookingLog:
+    """
+    Append-only booking log stored as typed integer column buffers.
+
+    One entry per booking: its kind, the meeting id (or Innovation
+    session index), and its slot / rep ids in flat arrays addressed by
+    cumulative end offsets. Phases append codes only; supplier_sched /
+    rep_sched DataFrames are built by to_frames() for the winning seed.
+
+    fork() shares the parent's entries as a read-only prefix; the child
+    only stores what it appends. cancel() hides an entry (own or
+    inherited) from bookings() and the load counts without rewriting
+    the buffers.
+    """
+
+    def __init__(self, parent=None):
+        self.parent = parent
+        self.parent_len = len(parent) if parent is not None else 0
+        self.kind = array("b")
+        self.ref = array("q")
+        self.slot_end = array("q")
+        self.rep_end = array("q")
+        self.slots = array("q")
+        self.reps = array("q")
+        self.cancelled = set(parent.cancelled) if parent is not None else set()
+        self._own_cancelled = []  # cancelled by this log, not by its parent
+        self._counts = None      # cached rep_load_counts, valid once forked
+
+    def __len__(self):
+        return self.parent_len + len(self.kind)
+
+    def add(self, kind, ref, slots, reps):
+        self.kind.append(kind)
+        self.ref.append(ref)
+        self.slots.extend(slots)
+        self.reps.extend(reps)
+        self.slot_end.append(len(self.slots))
+        self.rep_end.append(len(self.reps))
+        return len(self) - 1
+
+    def cancel(self, entry):
+        """Drop entry (an id returned by add) from the schedule."""
+        if entry in self.cancelled:
+            return
+        self.cancelled.add(entry)
+        self._own_cancelled.append(entry)
+
+    def fork(self):
+        return BookingLog(parent=self)
+
+    def entry(self, i):
+        """(kind, ref, slots, reps) of entry i, cancelled or not."""
+        if i < self.parent_len:
+            return self.parent.entry(i)
+
+        b = i - self.parent_len
+        s0 = self.slot_end[b - 1] if b else 0
+        r0 = self.rep_end[b - 1] if b else 0
+        return (
+            self.kind[b], self.ref[b],
+            self.slots[s0:self.slot_end[b]], self.reps[r0:self.rep_end[b]]
+        )
+
+    def _entries(self, limit=None):
+        # Every entry up to limit, cancelled ones included
+        if self.parent is not None:
+            yield from self.parent._entries(self.parent_len)
+
+        n = len(self.kind) if limit is None else limit - self.parent_len
+        s0 = r0 = 0
+        for b in range(n):
+            s1, r1 = self.slot_end[b], self.rep_end[b]
+            yield self.kind[b], self.ref[b], self.slots[s0:s1], self.reps[r0:r1]
+            s0, r0 = s1, r1
+
+    def bookings(self):
+        """Yield (kind, ref, slots, reps) in booking order."""
+        cancelled = self.cancelled
+
+        for i, booking in enumerate(self._entries()):
+            if i not in cancelled:
+                yield booking
+
+    # -----------------------------------------------------------------
+    # Scoring straight from the codes (no DataFrame)
+    # -----------------------------------------------------------------
+    def rep_load_counts(self, n_reps):
+        """Number of rep_sched rows per rep id."""
+        counts = np.zeros(n_reps, dtype=np.int64)
+
+        if self.parent is not None:
+            counts += self.parent._frozen_counts(n_reps)
+
+        if len(self.kind):
+            slot_end = np.frombuffer(self.slot_end, dtype=np.int64)
+            rep_end = np.frombuffer(self.rep_end, dtype=np.int64)
+            n_slots = np.diff(slot_end, prepend=0)
+            n_reps_per = np.diff(rep_end, prepend=0)
+
+            counts += np.bincount(
+                np.frombuffer(self.reps, dtype=np.int64),
+                weights=np.repeat(n_slots, n_reps_per),
+                minlength=n_reps
+            ).astype(np.int64)
+
+        for i in self._own_cancelled:
+            _, _, slots, reps = self.entry(i)
+            np.subtract.at(counts, list(reps), len(slots))
+
+        return counts
+
+    def _frozen_counts(self, n_reps):
+        # A forked log no longer changes, so its counts are computed once
+        if self._counts is None or len(self._counts) != n_reps:
+            self._counts = self.rep_load_counts(n_reps)
+        return self._counts
+
+    # -----------------------------------------------------------------
+    # Materialization
+    # -----------------------------------------------------------------
+    def to_frames(self, problem):
+        """
+        Build (supplier_sched, rep_sched) with the same rows, in the same
+        order, as the phases used to append them.
+        """
+        meetings = problem.meetings
+        sessions = problem.innovation_sessions
+        keys = problem.grid.keys
+
+        sup = {c: [] for c in SUPPLIER_COLUMNS}
+        rep = {c: [] for c in REP_COLUMNS}
+
+        for kind, ref, slots, reps in self.bookings():
+            rep_names = problem.rep_names(reps)
+
+            if kind == MEETING:
+                m = meetings[ref]
+                supplier = problem.suppliers[m.supplier]
+                attrs = (m.booth, SESSION_LABELS[m.kind], m.request_name, m.total_opportunity)
+            else:
+                supplier = sessions[ref]["supplier"]
+                attrs = ("", "Innovation Theater", "", "")
+
+            booth, session_type, category, tot_opp = attrs
+
+            for s in slots:
+                day, slot = keys[s]
+
+                if kind == MEETING:
+                    sup["supplier"].append(supplier)
+                    sup["booth"].append(booth)
+                    sup["day"].append(day)
+                    sup["timeslot"].append(slot)
+                    sup["session_type"].append(session_type)
+                    sup["reps"].append(rep_names)
+                    sup["category"].append(category)
+                    sup["total_opportunity"].append(tot_opp)
+
+                for r in rep_names:
+                    rep["rep"].append(r)
+                    rep["day"].append(day)
+                    rep["timeslot"].append(slot)
+                    rep["supplier"].append(supplier)
+                    rep["booth"].append(booth)
+                    rep["session_type"].append(session_type)
+                    rep["category"].append(category)
+                    rep["total_opportunity"].append(tot_opp)
+
+        return pd.DataFrame(sup), pd.DataFrame(rep)
@@ -0,0 +1,97 @@
+import hashlib
+import json
+import sys
+import threading
+from collections import OrderedDict
+import pandas as pd
+
+
+def json_default(x):
+    # numpy scalars, sets, timestamps, ... -> something stable
+    if hasattr(x, "item"):
+        return x.item()
+    if isinstance(x, (set, frozenset)):
+        return sorted(map(str, x))
+    return str(x)
+
+
+def fingerprint(*parts):
+    """
+    Content hash of scheduler inputs (DataFrames, dicts/lists, bytes).
+
+    Two calls with equal inputs give the same hex digest, so it can be
+    used as a cache key across Streamlit reruns.
+    """
+    h = hashlib.sha256()
+
+    for part in parts:
+        if isinstance(part, pd.DataFrame):
+            h.update(b"df")
+            h.update(json.dumps(list(map(str, part.columns))).encode())
+            h.update(pd.util.hash_pandas_object(part, index=True).to_numpy().tobytes())
+        elif isinstance(part, (bytes, bytearray, memoryview)):
+            h.update(b"bytes")
+            h.update(bytes(part))
+        else:
+            h.update(b"obj")
+            h.update(json.dumps(part, sort_keys=True, default=json_default).encode())
+
+    return h.hexdigest()
+
+
+class LRUCache:
+    """
+    Small least-recently-used cache, bounded by number of entries and,
+    optionally, by the total size of its values (size(value), in bytes).
+    Either bound may be None.
+
+    Safe to share between threads (Streamlit sessions): every read and
+    update of the entries holds the cache's lock.
+    """
+
+    def __init__(self, max_entries=8, max_bytes=None, size=sys.getsizeof):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.size = size
+        self.nbytes = 0
+        self._data = OrderedDict()     # key -> (value, size)
+        self._lock = threading.Lock()
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._data
+
+    def __len__(self):
+        with self._lock:
+            return len(self._data)
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key not in self._data:
+                return default
+            self._data.move_to_end(key)
+            return self._data[key][0]
+
+    def put(self, key, value):
+        # Sized outside the lock: size() may walk a large value
+        nbytes = self.size(value) if self.max_bytes is not None else 0
+
+        with self._lock:
+            if key in self._data:
+                self.nbytes -= self._data[key][1]
+
+            self._data[key] = (value, nbytes)
+            self._data.move_to_end(key)
+            self.nbytes += nbytes
+
+            while self._data and (
+                (self.max_entries is not None and len(self._data) > self.max_entries)
+                or (self.max_bytes is not None and self.nbytes > self.max_bytes)
+            ):
+                _, (_, evicted) = self._data.popitem(last=False)
+                self.nbytes -= evicted
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.nbytes = 0
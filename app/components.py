@@ -0,0 +1,71 @@
+# =====================================================================
+# Independent sub-problems
+#
+# Suppliers and reps only interact through meetings. Linking every
+# meeting's supplier with its fixed reps and candidate sellers splits
+# the problem into connected components that can be solved separately
+# (and concurrently), then merged into one ScheduleState.
+# Innovation Theater spans all workers and stays a shared stage.
+# =====================================================================
+
+def find_components(problem):
+    """
+    Meeting-id lists of the connected components (impossible meetings
+    excluded), largest first, each in meeting order.
+    """
+    n_suppliers = len(problem.suppliers)
+    parent = list(range(n_suppliers + len(problem.reps)))
+
+    def find(x):
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    meetings = [m for m in problem.meetings if m.id not in problem.impossible]
+
+    for m in meetings:
+        root = find(m.supplier)
+        for r in m.fixed + m.candidates:
+            other = find(n_suppliers + r)
+            if other != root:
+                parent[other] = root
+
+    groups = {}
+    for m in meetings:
+        groups.setdefault(find(m.supplier), []).append(m.id)
+
+    return sorted(groups.values(), key=lambda ids: (-len(ids), ids[0]))
+
+
+def solve_component(problem, state, meeting_ids, phases, rng, ordering="input"):
+    """
+    Run phases (build_phase2_* functions) for meeting_ids only, on a
+    fork of state. Returns [(meeting id, booked, reps, slots)] in
+    recording order; reps / slots are None when not booked.
+    """
+    sub = problem.restrict(meeting_ids)
+    child = state.fork()
+
+    for phase in phases:
+        phase(sub, child, rng, ordering)
+
+    result = []
+    for meeting_id, booked in child.new_events():
+        reps, slots = child.placement(meeting_id) if booked else (None, None)
+        result.append((meeting_id, booked, reps, slots))
+    return result
+
+
+def merge_components(problem, state, results):
+    """New fork of state with every component result replayed into it."""
+    merged = state.fork()
+
+    for result in results:
+        for meeting_id, booked, reps, slots in result:
+            m = problem.meetings[meeting_id]
+            if booked:
+                merged.book_meeting(m, reps, slots)
+            merged.record(m, booked)
+
+    return merged
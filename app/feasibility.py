@@ -0,0 +1,70 @@
+import numpy as np
+from app.problem import SESSION_LABELS
+from app.slot_search import window_starts
+
+
+# =====================================================================
+# Static feasibility analysis
+#
+# Finds meetings no seed can ever book, straight from the compiled
+# problem (after phase 1): named reps missing from Sales Reps, too few
+# sellers for the requested district / product line, or no slot the
+# supplier could use at all. These are left out of the seed search and
+# reported up front.
+# =====================================================================
+
+def find_impossible(problem):
+    """Meeting id -> list of reasons, for meetings that can never be booked."""
+    grid = problem.grid
+
+    # Supplier blocks are the only bookings every seed starts from
+    supplier_free = np.ones((len(problem.suppliers), grid.n_slots), dtype=bool)
+    for s, slot in problem.supplier_blocks:
+        supplier_free[s, slot] = False
+
+    entries = [e for meetings in problem.phase1.values() for e in meetings]
+    impossible = {}
+
+    for m in problem.meetings:
+        reasons = []
+
+        if m.missing:
+            reasons.append("not in Sales Reps: " + ", ".join(m.missing))
+
+        if m.seats and len(m.candidates) < m.seats:
+            spot = next(
+                a for a in entries[m.id]["requested_attendees"] if isinstance(a, dict)
+            )
+            where = spot["district"]
+            if spot.get("product_line"):
+                where += f" / {spot['product_line']}"
+            reasons.append(
+                f"{len(m.candidates)} of {m.seats} sellers available in {where}"
+            )
+
+        length, starts = problem.session_shape(m.kind)
+        if not window_starts(supplier_free[m.supplier], length, starts).any():
+            reasons.append("supplier has no open time slot for this session")
+
+        if reasons:
+            impossible[m.id] = reasons
+
+    return impossible
+
+
+def impossible_report(problem):
+    """
+    {supplier: [{"request_name", "session_type", "reasons"}]} for the
+    problem's impossible meetings, in request order.
+    """
+    report = {}
+
+    for meeting_id, reasons in sorted(problem.impossible.items()):
+        m = problem.meetings[meeting_id]
+        report.setdefault(problem.suppliers[m.supplier], []).append({
+            "request_name": m.request_name,
+            "session_type": SESSION_LABELS.get(m.kind, m.kind),
+            "reasons": reasons
+        })
+
+    return report
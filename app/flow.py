@@ -0,0 +1,80 @@
+from collections import deque
+
+
+class FlowNetwork:
+    """
+    Integer max-flow (Dinic) over nodes 0..n_nodes-1.
+
+    Edges are stored in flat arrays; edge e and its residual twin e ^ 1
+    are added together. max_flow() may be called again after adding
+    edges or raising capacities: it augments on top of the current flow.
+    """
+
+    def __init__(self, n_nodes):
+        self.adj = [[] for _ in range(n_nodes)]
+        self.to = []
+        self.cap = []
+
+    def add_edge(self, u, v, cap):
+        """Add u -> v with capacity cap; returns the edge id."""
+        e = len(self.to)
+        self.to += [v, u]
+        self.cap += [cap, 0]
+        self.adj[u].append(e)
+        self.adj[v].append(e + 1)
+        return e
+
+    def flow(self, e):
+        """Flow currently routed through edge e."""
+        return self.cap[e ^ 1]
+
+    def max_flow(self, source, sink):
+        """Augment to a maximum flow; returns the flow added by this call."""
+        total = 0
+
+        while True:
+            level = self._levels(source, sink)
+            if level[sink] < 0:
+                return total
+
+            it = [0] * len(self.adj)
+            while True:
+                pushed = self._push(source, sink, float("inf"), level, it)
+                if not pushed:
+                    break
+                total += pushed
+
+    def _levels(self, source, sink):
+        level = [-1] * len(self.adj)
+        level[source] = 0
+        queue = deque([source])
+
+        while queue:
+            u = queue.popleft()
+            for e in self.adj[u]:
+                v = self.to[e]
+                if self.cap[e] > 0 and level[v] < 0:
+                    level[v] = level[u] + 1
+                    queue.append(v)
+
+        return level
+
+    def _push(self, u, sink, limit, level, it):
+        if u == sink:
+            return limit
+
+        adj = self.adj[u]
+        while it[u] < len(adj):
+            e = adj[it[u]]
+            v = self.to[e]
+
+            if self.cap[e] > 0 and level[v] == level[u] + 1:
+                pushed = self._push(v, sink, min(limit, self.cap[e]), level, it)
+                if pushed:
+                    self.cap[e] -= pushed
+                    self.cap[e ^ 1] += pushed
+                    return pushed
+
+            it[u] += 1
+
+        return 0
@@ -1,3 +1,9 @@
+import io
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import chain
+from app.cache import fingerprint
 from app.utils import time_slots, blocks, act_session_times
 import pandas as pd
 
@@ -22,29 +28,27 @@ def _build_single_day_rows(day_name, data_map, supplier_name=None, *, mode):
       rep             → Time | Location | Session | Supplier | Opp. $
     """
 
-    html = ""
-    row_idx = 0
+    templates = _ROW_TEMPLATES[mode]
+    fixed_rows = _FIXED_ROWS[mode][day_name]
+    parts = []
     day_blocks = blocks.get(day_name, {})
-    slot_list = list(time_slots[day_name].keys())
+    markers = time_slots[day_name]
+    slot_list = _DAY_SLOTS[day_name]
     n = len(slot_list)
     i = 0
 
     while i < n:
         t = slot_list[i]
-        default_marker = time_slots[day_name][t]
-        bg = "#FFFFFF" if row_idx % 2 == 0 else "#F7F7F7"
+        default_marker = markers[t]
+        row_idx = len(parts)
+        bg = _ROW_BACKGROUNDS[row_idx % 2]
 
         # ----------------------------------
         # Lunch / Break
         # ----------------------------------
         if default_marker in ("LUNCH", "BREAK"):
-            cells = f"<td>{t}</td><td></td><td style='font-weight:600; color:#C63434;'>{default_marker}</td><td></td>"
-            if mode == "supplier_full" or mode == "rep":
-                cells += "<td></td>"
-
-            html += f"<tr style='background:{bg};'>{cells}</tr>"
+            parts.append(fixed_rows[t][row_idx % 2])
             i += 1
-            row_idx += 1
             continue
 
         # ----------------------------------
@@ -60,17 +64,7 @@ def _build_single_day_rows(day_name, data_map, supplier_name=None, *, mode):
                     j += 1
                 i = j
 
-                cells = f"""
-                    <td>{time_cell}</td>
-                    <td></td>
-                    <td>Innovation Theater Presentation</td>
-                    <td></td>
-                """
-                if mode == "supplier_full":
-                    cells += "<td></td>"
-
-                html += f"<tr style='background:{bg};'>{cells}</tr>"
-                row_idx += 1
+                parts.append(templates["innovation"].format(bg=bg, time=time_cell))
                 continue
 
         # ----------------------------------
@@ -79,13 +73,8 @@ def _build_single_day_rows(day_name, data_map, supplier_name=None, *, mode):
         val = data_map.get((day_name, t))
 
         if not val:
-            cells = f"<td>{t}</td><td></td><td>--AVAILABLE--</td><td></td>"
-            if mode in ("supplier_full", "rep"):
-                cells += "<td></td>"
-
-            html += f"<tr style='background:{bg};'>{cells}</tr>"
+            parts.append(fixed_rows[t][row_idx % 2])
             i += 1
-            row_idx += 1
             continue
 
         session = val["session_type"]
@@ -106,16 +95,7 @@ def _build_single_day_rows(day_name, data_map, supplier_name=None, *, mode):
                     break
             i = j
 
-            html += f"""
-            <tr style="background:{bg};">
-                <td>{time_cell}</td>
-                <td>TBD</td>
-                <td>Innovation Theater</td>
-                <td>{supplier}</td>
-                <td></td>
-            </tr>
-            """
-            row_idx += 1
+            parts.append(templates["innovation"].format(bg=bg, time=time_cell, supplier=supplier))
             continue
 
         # ----------------------------------
@@ -135,35 +115,26 @@ def _build_single_day_rows(day_name, data_map, supplier_name=None, *, mode):
         # ----------------------------------
         # Render rows
         # ----------------------------------
-        if mode.startswith("supplier"):
+        if mode == "rep":
+            opp_cell = "" if session in ("Power Pairing", "Innovation Theater") else _format_millions(val.get("opportunity", ""))
+            supplier = val.get("supplier", "")
+        else:
             opp_cell = ""
             if mode == "supplier_full" and session not in ("Power Pairing",):
                 opp_cell = _format_millions(val.get("opportunity", ""))
+            supplier = ""
 
-            cells = f"""
-                <td>{time_cell}</td>
-                <td>{session}</td>
-                <td>{val.get("category","")}</td>
-                <td>{val.get("rep","")}</td>
-            """
-            if mode == "supplier_full":
-                cells += f"<td>{opp_cell}</td>"
-
-        else:  # rep view
-            opp_cell = "" if session in ("Power Pairing", "Innovation Theater") else _format_millions(val.get("opportunity", ""))
-
-            cells = f"""
-                <td>{time_cell}</td>
-                <td>TBD</td>
-                <td>{session}</td>
-                <td>{val.get("supplier","")}</td>
-                <td>{opp_cell}</td>
-            """
+        parts.append(templates["meeting"].format(
+            bg=bg,
+            time=time_cell,
+            session=session,
+            category=val.get("category", ""),
+            reps=val.get("rep", ""),
+            supplier=supplier,
+            opp=opp_cell
+        ))
 
-        html += f"<tr style='background:{bg};'>{cells}</tr>"
-        row_idx += 1
-
-    return html
+    return "".join(parts)
 
 
 
@@ -281,28 +252,244 @@ td {
 .page-break { page-break-before: always; }
 """
 
+# =====================================================================
+#   Templates
+#
+# Page skeletons, day tables and row fragments are built once at
+# import and filled with str.format; pages are assembled with joins.
+# Page bodies are produced on their own, so the combined print
+# documents use them directly instead of splitting full pages.
+# =====================================================================
+PAGE_HEAD = f"""
+        <meta charset="UTF-8">
+        <style>{COMMON_CSS}</style>
+        <link href="https://fonts.googleapis.com/css2?family=Barlow:wght@300;400;500;600&display=swap" rel="stylesheet">
+"""
+
+# COMMON_CSS has braces, so the head is joined in rather than formatted
+_DOCUMENT_START = "<html>\n<head>" + PAGE_HEAD + "</head>\n<body>\n"
+_DOCUMENT_END = "\n</body>\n</html>\n"
+
+_DAY_SLOTS = {day: list(slots) for day, slots in time_slots.items()}
+
+_ROW_BACKGROUNDS = ("#FFFFFF", "#F7F7F7")
+
+
+def _document(body):
+    """Standalone page (shared head + body)."""
+    return "".join((_DOCUMENT_START, body, _DOCUMENT_END))
+
+
+def _row_template(columns, *cells):
+    """Table row template; cells are padded with empty ones to columns."""
+    cells = list(cells) + ["<td></td>"] * (columns - len(cells))
+    return "<tr style='background:{bg};'>" + "".join(cells) + "</tr>\n"
+
+
+_MARKER_CELLS = ("<td>{time}</td>", "<td></td>", "<td style='font-weight:600; color:#C63434;'>{marker}</td>")
+_AVAILABLE_CELLS = ("<td>{time}</td>", "<td></td>", "<td>--AVAILABLE--</td>")
+
+_ROW_TEMPLATES = {
+    "supplier_full": {
+        "marker": _row_template(5, *_MARKER_CELLS),
+        "available": _row_template(5, *_AVAILABLE_CELLS),
+        "innovation": _row_template(5, "<td>{time}</td>", "<td></td>", "<td>Innovation Theater Presentation</td>"),
+        "meeting": _row_template(
+            5, "<td>{time}</td>", "<td>{session}</td>", "<td>{category}</td>", "<td>{reps}</td>", "<td>{opp}</td>"
+        )
+    },
+    "supplier_light": {
+        "marker": _row_template(4, *_MARKER_CELLS),
+        "available": _row_template(4, *_AVAILABLE_CELLS),
+        "innovation": _row_template(4, "<td>{time}</td>", "<td></td>", "<td>Innovation Theater Presentation</td>"),
+        "meeting": _row_template(
+            4, "<td>{time}</td>", "<td>{session}</td>", "<td>{category}</td>", "<td>{reps}</td>"
+        )
+    },
+    "rep": {
+        "marker": _row_template(5, *_MARKER_CELLS),
+        "available": _row_template(5, *_AVAILABLE_CELLS),
+        "innovation": _row_template(
+            5, "<td>{time}</td>", "<td>TBD</td>", "<td>Innovation Theater</td>", "<td>{supplier}</td>"
+        ),
+        "meeting": _row_template(
+            5, "<td>{time}</td>", "<td>TBD</td>", "<td>{session}</td>", "<td>{supplier}</td>", "<td>{opp}</td>"
+        )
+    }
+}
+
+# Lunch / Break and --AVAILABLE-- rows do not depend on the schedule:
+# pre-rendered per mode, day and slot, for both row backgrounds
+_FIXED_ROWS = {
+    mode: {
+        day: {
+            t: tuple(
+                templates["marker" if marker in ("LUNCH", "BREAK") else "available"]
+                .format(bg=bg, time=t, marker=marker)
+                for bg in _ROW_BACKGROUNDS
+            )
+            for t, marker in time_slots[day].items()
+        }
+        for day in time_slots
+    }
+    for mode, templates in _ROW_TEMPLATES.items()
+}
+
+_DAY_TABLE = """
+        <div>
+            <div class="section-title">{{day}}</div>
+            <table>
+                <tr>{headers}</tr>
+                {{rows}}
+            </table>
+        </div>
+"""
+
+# Day table per mode, headers filled in
+_DAY_TABLES = {
+    "supplier_full": _DAY_TABLE.format(headers="""
+            <th style="width:15%;">Time</th>
+            <th style="width:12%;">Session</th>
+            <th style="width:28%;">Request</th>
+            <th style="width:35%;">Appointment With</th>
+            <th style='width:10%;'>Opp. $</th>"""),
+    "supplier_light": _DAY_TABLE.format(headers="""
+            <th style="width:15%;">Time</th>
+            <th style="width:20%;">Session</th>
+            <th style="width:28%;">Request</th>
+            <th style="width:27%;">Appointment With</th>"""),
+    "rep": _DAY_TABLE.format(headers="""
+                    <th style="width:18%;">Time</th>
+                    <th style="width:18%;">Location</th>
+                    <th style="width:18%;">Session</th>
+                    <th style="width:36%;">Supplier</th>
+                    <th style="width:10%;">Opp. $</th>""")
+}
+
+_PAGE_TITLE = """
+        <div class="title">2026 Supplier Growth Forum</div>
+        <div class="subtitle">February 23rd – 25th</div>
+"""
+
+_PRINT_BUTTON = """
+        <div class="print-container no-print">
+            <a class="print-button" onclick="window.print()">Save PDF</a>
+        </div>
+"""
+
+_SUPPLIER_BODY = _PAGE_TITLE + """
+        <div class="top-info">{name}</div>
+""" + _PRINT_BUTTON + """
+        <div class="flex-col" style="gap:10px; margin-top:10px;">
+            {days}
+        </div>
+
+        <div class='page-break'></div>
+        <br><br>
+
+        <div class="section-title" style="margin-top:18px;">Representative Roles</div>
+
+        <div class="flex-row" style="margin-top:4px;">
+            <div style="width:48%;">
+                <table>
+                    <tr>
+                        <th style="width:30%;">Name</th>
+                        <th style="width:70%;">Role</th>
+                    </tr>
+                    {left_roles}
+                </table>
+            </div>
+            <div style="width:48%;">
+                <table>
+                    <tr>
+                        <th style="width:30%;">Name</th>
+                        <th style="width:70%;">Role</th>
+                    </tr>
+                    {right_roles}
+                </table>
+            </div>
+        </div>
+
+        <div class="endnote" style="width:85%; margin:30px auto 10px auto;">
+            Representatives may have free slots. For additional availability,
+            please check with the Information Desk staff.
+        </div>
+"""
+
+_ROLE_ROW = """
+                    <tr style="background:{bg}; font-size:11px;">
+                        <td style="padding:5px; width:30%;">{name}</td>
+                        <td style="padding:5px; width:70%;">{role}</td>
+                    </tr>"""
+
+_ROLE_BACKGROUNDS = ("#FFFFFF", "#F2F2F2")
+
+_REP_BODY = _PAGE_TITLE + """
+        <div class="top-info">{name}</div>
+        <div class="top-info-small">{email}</div>
+""" + _PRINT_BUTTON + """
+        <div class="flex-col">
+            {days}
+        </div>
+"""
+
+_TOC_ROW = """
+                <tr>
+                    <td>{name}</td>
+                    <td style="text-align:right;">{page}</td>
+                </tr>"""
+
+_PAGE_BREAK = "<div class='page-break'></div>\n"
+
+# The summary is shown in its own frame, so it carries the shared head
+_SUMMARY_START = "<html>\n<head>" + PAGE_HEAD + "</head>\n<body style=\"background:white;\">\n"
+
+_SUMMARY_BODY = """
+        <div class="section-title" style="margin-top:4px; margin-bottom:4px;">
+            Request Summary
+        </div>
+
+        <table style="width:80%; margin:auto; border-collapse:collapse; font-size:12px;">
+            <tr>
+                <th style="width:55%;">Request</th>
+                <th style="width:30%;">Unavailable(s)</th>
+                <th style="width:15%;">Score</th>
+            </tr>
+            {rows}
+        </table>
+"""
+
+_SUMMARY_ROW = """
+        <tr style="background:{bg}; font-size:12px;">
+            <td style="padding:6px; width:55%;">{request}</td>
+            <td style="padding:6px; width:30%;">{unavailable}</td>
+            <td style="padding:6px; text-align:center; width:15%;">{score}</td>
+        </tr>"""
+
+_UNAVAILABLE = "<span style='color:#C63434;'>{}</span>"
+
 
 # =====================================================================
 #   SUPPLIER HTML
 # =====================================================================
-def render_supplier_html(supplier_name, booth, schedule_df, supplier_summary, reps_df):
-
-    has_major_sessions = (
-        schedule_df["session_type"]
-        .fillna("")
-        .str.lower()
-        .isin(["strategy", "planning"])
-        .any()
-    )
+def render_supplier_html(supplier_name, booth, schedule_df, supplier_summary, reps_df, cache=None):
+    return _document(_cached_body(
+        cache, _supplier_key, _supplier_body,
+        supplier_name, booth, schedule_df.to_dict("records"), rep_roles(reps_df)
+    ))
 
-    mode = "supplier_full" if has_major_sessions else "supplier_light"
 
-    col_widths = (
-        {"time":"15%","session":"12%","request":"28%","reps":"35%","opp":"10%"}
-        if mode == "supplier_full"
-        else {"time":"15%","session":"20%","request":"28%","reps":"27%"}
+def _supplier_body(supplier_name, booth, schedule_rows, roles):
+    """Supplier page body from its schedule rows (dicts) and a Rep Name -> Role map."""
+
+    has_major_sessions = any(
+        isinstance(r.get("session_type"), str)
+        and r["session_type"].lower() in ("strategy", "planning")
+        for r in schedule_rows
     )
 
+    mode = "supplier_full" if has_major_sessions else "supplier_light"
+
     data_map = {
         (r["day"], r["timeslot"]): {
             "rep": ", ".join(r["reps"]) if isinstance(r["reps"], list) else r["reps"],
@@ -311,222 +498,284 @@ def render_supplier_html(supplier_name, booth, schedule_df, supplier_summary, re
             "session_type": r.get("session_type", ""),
             "supplier": supplier_name
         }
-        for _, r in schedule_df.iterrows()
+        for r in schedule_rows
     }
 
-    day_blocks = []
-    for day in time_slots:
-        rows = _build_single_day_rows(day, data_map, supplier_name, mode=mode)
-
-        headers = f"""
-            <th style="width:{col_widths['time']};">Time</th>
-            <th style="width:{col_widths['session']};">Session</th>
-            <th style="width:{col_widths['request']};">Request</th>
-            <th style="width:{col_widths['reps']};">Appointment With</th>
-        """
-        if mode == "supplier_full":
-            headers += f"<th style='width:{col_widths['opp']};'>Opp. $</th>"
-
-        day_blocks.append(f"""
-        <div>
-            <div class="section-title">{day}</div>
-            <table>
-                <tr>{headers}</tr>
-                {rows}
-            </table>
-        </div>
-        """)
+    day_table = _DAY_TABLES[mode]
+    body_days = "".join(
+        day_table.format(
+            day=day,
+            rows=_build_single_day_rows(day, data_map, supplier_name, mode=mode)
+        )
+        for day in time_slots
+    )
 
     # --------------------------------------------------
     # Representative Roles Section
     # --------------------------------------------------
     all_reps = []
-    for _, r in schedule_df.iterrows():
+    for r in schedule_rows:
         if isinstance(r["reps"], list):
             all_reps.extend(r["reps"])
 
     all_reps = list(dict.fromkeys(all_reps))
 
-    role_rows = []
-    for rep in all_reps:
-        match = reps_df[reps_df["Rep Name"] == rep]
-        role = match["Role"].iloc[0] if len(match) > 0 else ""
-        role_rows.append((rep, role))
+    role_rows = [(rep, roles.get(rep, "")) for rep in all_reps]
 
     half = (len(role_rows) + 1) // 2
-    left_rows = role_rows[:half]
-    right_rows = role_rows[half:]
-
-    def build_role_table(rows):
-        html = ""
-        idx = 0
-        for name, role in rows:
-            bg = "#FFFFFF" if idx % 2 == 0 else "#F2F2F2"
-            html += f"""
-            <tr style="background:{bg}; font-size:11px;">
-                <td style="padding:5px; width:30%;">{name}</td>
-                <td style="padding:5px; width:70%;">{role}</td>
-            </tr>
-            """
-            idx += 1
-        return html
 
-    roles_html = f"""
-    <div class="section-title" style="margin-top:18px;">Representative Roles</div>
+    return _SUPPLIER_BODY.format(
+        name=supplier_name,
+        days=body_days,
+        left_roles=_role_rows(role_rows[:half]),
+        right_roles=_role_rows(role_rows[half:])
+    )
 
-    <div class="flex-row" style="margin-top:4px;">
-        <div style="width:48%;">
-            <table>
-                <tr>
-                    <th style="width:30%;">Name</th>
-                    <th style="width:70%;">Role</th>
-                </tr>
-                {build_role_table(left_rows)}
-            </table>
-        </div>
-        <div style="width:48%;">
-            <table>
-                <tr>
-                    <th style="width:30%;">Name</th>
-                    <th style="width:70%;">Role</th>
-                </tr>
-                {build_role_table(right_rows)}
-            </table>
-        </div>
-    </div>
-    """
 
-    note_html = """
-    <div class="endnote" style="width:85%; margin:30px auto 10px auto;">
-        Representatives may have free slots. For additional availability,
-        please check with the Information Desk staff.
-    </div>
-    """
+def _supplier_key(supplier_name, booth, schedule_rows, roles):
+    """Fingerprint of everything a supplier page shows."""
+    reps = sorted({
+        rep for r in schedule_rows if isinstance(r["reps"], list) for rep in r["reps"]
+    })
+    return fingerprint(
+        "supplier", supplier_name, booth, schedule_rows,
+        [[rep, roles.get(rep, "")] for rep in reps]
+    )
 
-    body_days = "".join(day_blocks)
 
-    return f"""
-    <html>
-    <head>
-        <meta charset="UTF-8">
-        <style>{COMMON_CSS}</style>
-        <link href="https://fonts.googleapis.com/css2?family=Barlow:wght@300;400;500;600&display=swap" rel="stylesheet">
-    </head>
+def _role_rows(rows):
+    return "".join(
+        _ROLE_ROW.format(bg=_ROLE_BACKGROUNDS[idx % 2], name=name, role=role)
+        for idx, (name, role) in enumerate(rows)
+    )
 
-    <body>
 
-        <div class="title">2026 Supplier Growth Forum</div>
-        <div class="subtitle">February 23rd – 25th</div>
-        <div class="top-info">{supplier_name}</div>
+# =====================================================================
+#   Batch rendering (Save ALL)
+# =====================================================================
+def rep_roles(reps_df):
+    """Rep Name -> Role, first row per rep."""
+    first = reps_df.drop_duplicates("Rep Name")
+    return dict(zip(first["Rep Name"], first["Role"]))
 
-        <div class="print-container no-print">
-            <a class="print-button" onclick="window.print()">Save PDF</a>
-        </div>
 
-        <div class="flex-col" style="gap:10px; margin-top:10px;">
-            {body_days}
-        </div>
+def rep_emails(reps_df):
+    """Rep Name -> Email ("" when missing), first row per rep."""
+    first = reps_df.drop_duplicates("Rep Name")
+    return dict(zip(first["Rep Name"], first["Email"].fillna("")))
 
-        <div class='page-break'></div>
-        <br><br>
 
-        {roles_html}
+def supplier_booths(suppliers_df):
+    """Supplier -> Booth, first row per supplier."""
+    first = suppliers_df.drop_duplicates("Supplier")
+    return dict(zip(first["Supplier"], first["Booth"]))
 
-        {note_html}
 
-    </body>
-    </html>
-    """
+def group_rows(schedule_df, column):
+    """Value of column -> list of row dicts, in one pass over schedule_df."""
+    columns = list(schedule_df.columns)
+    key = columns.index(column)
 
+    groups = {}
+    for values in zip(*(schedule_df[c].tolist() for c in columns)):
+        groups.setdefault(values[key], []).append(dict(zip(columns, values)))
+    return groups
 
 
-def render_request_summary_table(supplier_summary):
-    requested = supplier_summary.get("requested", [])
-    fulfilled = set(supplier_summary.get("fulfilled", []))
-    substitutions = supplier_summary.get("substitutions", {})
-    req_types = supplier_summary.get("req_types", {})
+def _render_supplier_job(maps, job):
+    supplier_name, booth, rows = job
+    return _supplier_body(supplier_name, booth, rows, maps["roles"])
 
-    summary_rows = ""
-    row_idx = 0
 
-    for req in requested:
-        row_bg = "#FFFFFF" if row_idx % 2 == 0 else "#F7F7F7"
+def _render_rep_job(maps, job):
+    rep_name, rows = job
+    return _rep_body(
+        rep_name,
+        maps["emails"].get(rep_name, ""),
+        rows,
+        maps["booths"]
+    )
 
-        is_fulfilled = req in fulfilled
-        subs = substitutions.get(req, [])
-        req_type = req_types.get(req, "Name")
 
-        # scoring
-        if req_type != "Name":
-            score = 5 if is_fulfilled else 0
-        else:
-            score = max(1, 5 - len(subs))
+# Lookup maps are shipped once per pool worker through the initializer.
+# Only pool workers use this global; in process the maps are passed to
+# the job directly, so concurrent renders (app sessions) do not share it.
+_RENDER_STATE = {}
 
-        # unavailable names in red
-        if subs:
-            subs_str = ", ".join(
-                f"<span style='color:#C63434;'>{s}</span>"
-                for s in subs
-            )
-        else:
-            subs_str = ""
 
-        summary_rows += f"""
-        <tr style="background:{row_bg}; font-size:12px;">
-            <td style="padding:6px; width:55%;">{req}</td>
-            <td style="padding:6px; width:30%;">{subs_str}</td>
-            <td style="padding:6px; text-align:center; width:15%;">{score}</td>
-        </tr>
-        """
+def _init_render_worker(maps):
+    _RENDER_STATE.clear()
+    _RENDER_STATE.update(maps)
 
-        row_idx += 1
 
-    # full HTML with CSS included
-    return f"""
-    <html>
-    <head>
-        <style>{COMMON_CSS}</style>
-        <link href="https://fonts.googleapis.com/css2?family=Barlow:wght@300;400;500;600&display=swap" rel="stylesheet">
-    </head>
+def _pooled_job(job_fn, job):
+    return job_fn(_RENDER_STATE, job)
 
-    <body style="background:white;">
 
-        <div class="section-title" style="margin-top:4px; margin-bottom:4px;">
-            Request Summary
-        </div>
+# ---------------------------------------------------------------------
+# Page cache: bodies are stored under a fingerprint of the entity's
+# schedule rows and the rep / booth data its page shows, so after an
+# edit or re-run only the entities that changed are rendered again.
+# The cache is an app.cache.LRUCache (bounded by max_bytes in the app).
+# ---------------------------------------------------------------------
+def _cached_body(cache, key_fn, body_fn, *args):
+    """body_fn(*args), through cache under key_fn(*args) when a cache is given."""
+    if cache is None:
+        return body_fn(*args)
+
+    key = key_fn(*args)
+    body = cache.get(key)
+    if body is None:
+        body = body_fn(*args)
+        cache.put(key, body)
+    return body
 
-        <table style="width:80%; margin:auto; border-collapse:collapse; font-size:12px;">
-            <tr>
-                <th style="width:55%;">Request</th>
-                <th style="width:30%;">Unavailable(s)</th>
-                <th style="width:15%;">Score</th>
-            </tr>
-            {summary_rows}
-        </table>
 
-    </body>
-    </html>
+def _render_pages(job_fn, jobs, maps, workers, keys=None, cache=None):
     """
+    job_fn over jobs, in order; spread over a process pool when
+    workers > 1. With a cache, only jobs whose key is missing are run.
+    """
+    if cache is None:
+        return _run_jobs(job_fn, jobs, maps, workers)
+
+    pages = [cache.get(key) for key in keys]
+    todo = [i for i, page in enumerate(pages) if page is None]
+
+    rendered = _run_jobs(job_fn, [jobs[i] for i in todo], maps, workers)
+    for i, page in zip(todo, rendered):
+        pages[i] = page
+        cache.put(keys[i], page)
+
+    return pages
+
+
+def _run_jobs(job_fn, jobs, maps, workers):
+    if workers == 1 or len(jobs) < 2:
+        return [job_fn(maps, job) for job in jobs]
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_render_worker,
+        initargs=(maps,)
+    ) as pool:
+        chunksize = max(1, len(jobs) // (4 * workers))
+        return list(pool.map(partial(_pooled_job, job_fn), jobs, chunksize=chunksize))
+
+
+def render_all_supplier_html(
+    suppliers_df, supplier_sched, reps_df, workers=1, bodies=False, cache=None
+):
+    """
+    Supplier pages for every supplier in suppliers_df, in that (TOC)
+    order. supplier_sched is grouped and the booth / role maps are built
+    once for all pages instead of once per supplier.
+    bodies=True returns page bodies for build_combined_html; with a
+    cache, unchanged pages are not rendered again.
+    """
+    names = suppliers_df["Supplier"].tolist()
+    booths = supplier_booths(suppliers_df)
+    roles = rep_roles(reps_df)
+    rows = group_rows(supplier_sched, "supplier")
+
+    jobs = [(name, booths[name], rows.get(name, [])) for name in names]
+    keys = None if cache is None else [_supplier_key(*job, roles) for job in jobs]
+
+    pages = _render_pages(
+        _render_supplier_job, jobs, {"roles": roles}, workers, keys, cache
+    )
+    return pages if bodies else [_document(p) for p in pages]
+
+
+def render_all_rep_html(
+    rep_names, rep_sched, suppliers_df, reps_df, workers=1, bodies=False, cache=None
+):
+    """
+    Rep pages for rep_names, in that order. rep_sched is grouped and the
+    email / booth maps are built once for all pages instead of per rep
+    and per schedule row.
+    bodies=True returns page bodies for build_combined_html; with a
+    cache, unchanged pages are not rendered again.
+    """
+    rows = group_rows(rep_sched, "rep")
+    jobs = [(name, rows.get(name, [])) for name in rep_names]
+
+    maps = {
+        "emails": rep_emails(reps_df),
+        "booths": supplier_booths(suppliers_df)
+    }
+    keys = None if cache is None else [
+        _rep_key(name, maps["emails"].get(name, ""), job_rows, maps["booths"])
+        for name, job_rows in jobs
+    ]
+    pages = _render_pages(_render_rep_job, jobs, maps, workers, keys, cache)
+    return pages if bodies else [_document(p) for p in pages]
+
+
+def render_request_summary_table(supplier_summary, cache=None):
+    return "".join((
+        _SUMMARY_START,
+        _cached_body(cache, _summary_key, _request_summary_html, supplier_summary),
+        _DOCUMENT_END
+    ))
+
+
+def _summary_key(supplier_summary):
+    return fingerprint("summary", supplier_summary)
+
+
+def _request_summary_html(supplier_summary):
+    """Request Summary body: one row per requested item."""
+    fulfilled = set(supplier_summary.get("fulfilled", []))
+    substitutions = supplier_summary.get("substitutions", {})
+    req_types = supplier_summary.get("req_types", {})
+
+    rows = []
+    for idx, req in enumerate(supplier_summary.get("requested", [])):
+        subs = substitutions.get(req, [])
+
+        # scoring
+        if req_types.get(req, "Name") != "Name":
+            score = 5 if req in fulfilled else 0
+        else:
+            score = max(1, 5 - len(subs))
+
+        rows.append(_SUMMARY_ROW.format(
+            bg=_ROW_BACKGROUNDS[idx % 2],
+            request=req,
+            # unavailable names in red
+            unavailable=", ".join(_UNAVAILABLE.format(s) for s in subs),
+            score=score
+        ))
+
+    return _SUMMARY_BODY.format(rows="".join(rows))
 
 
 # =====================================================================
 #   REP HTML
 # =====================================================================
-def render_rep_html(rep_name, schedule_df, suppliers_df, reps_df):
+def render_rep_html(rep_name, schedule_df, suppliers_df, reps_df, cache=None):
 
     rep_email = reps_df.loc[
         reps_df["Rep Name"] == rep_name, "Email"
     ].fillna("").iloc[0]
 
+    return _document(_cached_body(
+        cache, _rep_key, _rep_body,
+        rep_name, rep_email, schedule_df.to_dict("records"), supplier_booths(suppliers_df)
+    ))
+
+
+def _rep_body(rep_name, rep_email, schedule_rows, booths):
+    """Rep page body from its schedule rows (dicts) and a Supplier -> Booth map."""
+
     data_map = {}
-    for _, r in schedule_df.iterrows():
+    for r in schedule_rows:
         supplier = r.get("supplier")
         if supplier is None:
             data_map[(r["day"], r["timeslot"])] = None
         else:
-            booth = suppliers_df.loc[
-                suppliers_df["Supplier"] == supplier, "Booth"
-            ].iloc[0]
+            booth = booths[supplier]
             data_map[(r["day"], r["timeslot"])] = {
                 "supplier": supplier,
                 "booth": booth,
@@ -534,56 +783,24 @@ def render_rep_html(rep_name, schedule_df, suppliers_df, reps_df):
                 "opportunity": r.get("total_opportunity", "")
             }
 
-    days = list(time_slots.keys())
-    day_blocks = []
-
-    for day in days:
-        rows = _build_single_day_rows(day, data_map, mode="rep")
-        day_blocks.append(f"""
-        <div>
-            <div class="section-title">{day}</div>
-            <table>
-                <tr>
-                    <th style="width:18%;">Time</th>
-                    <th style="width:18%;">Location</th>
-                    <th style="width:18%;">Session</th>
-                    <th style="width:36%;">Supplier</th>
-                    <th style="width:10%;">Opp. $</th>
-                </tr>
-                {rows}
-            </table>
-        </div>
-        """)
-
-    body_days = "".join(day_blocks)
-
-    return f"""
-    <html>
-    <head>
-        <meta charset="UTF-8">
-        <style>{COMMON_CSS}</style>
-        <link href="https://fonts.googleapis.com/css2?family=Barlow:wght@300;400;500;600&display=swap" rel="stylesheet">
-    </head>
-
-    <body>
-
-        <div class="title">2026 Supplier Growth Forum</div>
-        <div class="subtitle">February 23rd – 25th</div>
+    day_table = _DAY_TABLES["rep"]
+    body_days = "".join(
+        day_table.format(day=day, rows=_build_single_day_rows(day, data_map, mode="rep"))
+        for day in time_slots
+    )
 
-        <div class="top-info">{rep_name}</div>
-        <div class="top-info-small">{rep_email}</div>
+    return _REP_BODY.format(name=rep_name, email=rep_email, days=body_days)
 
-        <div class="print-container no-print">
-            <a class="print-button" onclick="window.print()">Save PDF</a>
-        </div>
 
-        <div class="flex-col">
-            {body_days}
-        </div>
-
-    </body>
-    </html>
-    """
+def _rep_key(rep_name, rep_email, schedule_rows, booths):
+    """Fingerprint of everything a rep page shows."""
+    suppliers = sorted(
+        {r.get("supplier") for r in schedule_rows if r.get("supplier") is not None}, key=str
+    )
+    return fingerprint(
+        "rep", rep_name, rep_email, schedule_rows,
+        [[supplier, booths.get(supplier)] for supplier in suppliers]
+    )
 
 
 
@@ -698,6 +915,7 @@ def render_intro_page(logo_b64: str):
     """
 
 
+
 def render_supplier_toc_page(logo_b64, supplier_names, start_page):
     """
     Builds paginated Table of Contents pages for Supplier schedules.
@@ -725,14 +943,9 @@ def render_supplier_toc_page(logo_b64, supplier_names, start_page):
 
     for page_idx, chunk in enumerate(chunks):
 
-        rows_html = ""
-        for name, page_num in chunk:
-            rows_html += f"""
-                <tr>
-                    <td>{name}</td>
-                    <td style="text-align:right;">{page_num}</td>
-                </tr>
-            """
+        rows_html = "".join(
+            _TOC_ROW.format(name=name, page=page_num) for name, page_num in chunk
+        )
 
         page_html = f"""
         <div style="height:10px;"></div>
@@ -777,33 +990,44 @@ def render_supplier_toc_page(logo_b64, supplier_names, start_page):
 
 
 def build_combined_html(
-    html_pages,
+    page_bodies,
     logo_path="files/logos.png",
     mode="Supplier",
     supplier_names=None
 ):
     """
     Builds a printable HTML document with:
-    - TOC page
-    - Schedule pages
+    - TOC page (Supplier mode)
+    - Schedule pages, from page bodies (render_all_*_html(bodies=True))
     - Logic & Assumptions page (last)
     """
+    return "".join(iter_combined_html(page_bodies, logo_path, mode, supplier_names))
 
-    first = html_pages[0]
-    head = first.split("<head>")[1].split("</head>")[0]
 
-    logo_b64 = load_logo_base64(logo_path)
+def iter_combined_html(
+    page_bodies,
+    logo_path="files/logos.png",
+    mode="Supplier",
+    supplier_names=None,
+    toc=True,
+    logic=True
+):
+    """
+    Yield the build_combined_html document in chunks: head, TOC page,
+    one chunk per schedule page, Logic & Assumptions page, end.
+    toc / logic=False leave those pages out (inner volumes).
+    """
+    toc = toc and mode == "Supplier"
+    if toc and supplier_names is None:
+        raise ValueError("supplier_names must be provided for Supplier mode")
 
-    pages = []
+    logo_b64 = load_logo_base64(logo_path)
 
-    # -----------------------------
-    # SUPPLIER MODE
-    # -----------------------------
-    if mode == "Supplier":
+    yield "<html>\n<head>" + PAGE_HEAD + "</head>\n<body>\n"
 
-        if supplier_names is None:
-            raise ValueError("supplier_names must be provided for Supplier mode")
+    page_break = ""
 
+    if toc:
         # Page numbers:
         # 1 = TOC
         # 2..N = suppliers
@@ -813,36 +1037,71 @@ def build_combined_html(
             supplier_names=supplier_names,
             start_page=7
         )
+        yield f"<div>{toc_body}</div>"
+        page_break = _PAGE_BREAK
 
-        pages.append(f"<div>{toc_body}</div><div class='page-break'></div>")
+    for body in page_bodies:
+        yield f"{page_break}<div>{body}</div>"
+        page_break = _PAGE_BREAK
 
-        # Supplier pages
-        for html in html_pages:
-            body = html.split("<body>")[1].split("</body>")[0]
-            pages.append(f"<div>{body}</div><div class='page-break'></div>")
+    # Logic & Assumptions (last page, no page break after it)
+    if logic:
+        yield f"{page_break}<div>{render_intro_page(logo_b64)}</div>"
 
-        # Logic & Assumptions (last page, no page break)
-        logic_body = render_intro_page(logo_b64)
-        pages.append(f"<div>{logic_body}</div>")
+    yield "\n</body>\n</html>\n"
 
-    # -----------------------------
-    # REP MODE (placeholder)
-    # -----------------------------
-    else:
-        # Rep schedule pages
-        for html in html_pages:
-            body = html.split("<body>")[1].split("</body>")[0]
-            pages.append(f"<div>{body}</div><div class='page-break'></div>")
 
-        # Logic & Assumptions (last page, no page break)
-        logic_body = render_intro_page(logo_b64)
-        pages.append(f"<div>{logic_body}</div>")
+def combined_html_volumes(
+    page_bodies,
+    pages_per_volume=None,
+    logo_path="files/logos.png",
+    mode="Supplier",
+    supplier_names=None
+):
+    """
+    Split the combined document into volumes of at most pages_per_volume
+    schedule pages (a single volume when None). Yields one chunk
+    generator (iter_combined_html) per volume, so a volume is only built
+    while it is written: the TOC opens the first volume and Logic &
+    Assumptions closes the last.
+    """
+    page_bodies = list(page_bodies)
+    n = len(page_bodies)
+    size = pages_per_volume or max(n, 1)
+
+    for start in range(0, max(n, 1), size):
+        yield iter_combined_html(
+            page_bodies[start:start + size],
+            logo_path,
+            mode,
+            supplier_names,
+            toc=start == 0,
+            logic=start + size >= n
+        )
+
 
-    return f"""
-    <html>
-        <head>{head}</head>
-        <body>
-            {''.join(pages)}
-        </body>
-    </html>
+def export_combined_html(volumes, name):
+    """
+    (file name, bytes, mime type) to download volumes: one .html file for
+    a single volume, otherwise a .zip with one .html per volume. Volumes
+    are taken one at a time and their chunks encoded (and compressed) as
+    they are produced, so only the output itself is held in full.
     """
+    volumes = iter(volumes)
+    # Volumes are unstarted generators: peeking at two builds nothing
+    first = next(volumes)
+    second = next(volumes, None)
+    buffer = io.BytesIO()
+
+    if second is None:
+        for chunk in first:
+            buffer.write(chunk.encode("utf-8"))
+        return f"{name}.html", buffer.getvalue(), "text/html"
+
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        for k, chunks in enumerate(chain((first, second), volumes), start=1):
+            with archive.open(f"{name} - Volume {k}.html", "w") as f:
+                for chunk in chunks:
+                    f.write(chunk.encode("utf-8"))
+
+    return f"{name}.zip", buffer.getvalue(), "application/zip"
@@ -0,0 +1,366 @@
+import math
+import time
+import numpy as np
+from app.repair import MOVABLE_KINDS
+from app.slot_search import window_starts
+
+
+# =====================================================================
+# Simulated annealing over a finished ScheduleState
+#
+# Objective (lower is better), scored incrementally after every move:
+#   unfulfilled meetings, suppliers impacted and rep load std (the seed
+#   selection key), minus the share of total opportunity captured.
+# =====================================================================
+
+OBJECTIVE_WEIGHTS = {
+    "unfulfilled": 1000.0,
+    "suppliers": 100.0,
+    "rep_load_std": 1.0,
+    "opportunity": 10.0
+}
+
+# Trajectory points recorded per run (plus the first and last)
+TRAJECTORY_POINTS = 100
+
+
+class LoadStats:
+    """
+    Rep load counts with running sums, so the sample std over loaded
+    reps (value_counts().std()) updates in O(1) per changed rep.
+    """
+
+    def __init__(self, counts):
+        self.counts = counts.astype(np.int64)
+        loaded = self.counts[self.counts > 0]
+        self.n = len(loaded)
+        self.s1 = int(loaded.sum())
+        self.s2 = int((loaded * loaded).sum())
+
+    def add(self, rep, delta):
+        old = int(self.counts[rep])
+        new = old + delta
+        self.counts[rep] = new
+
+        if old > 0:
+            self.n -= 1
+            self.s1 -= old
+            self.s2 -= old * old
+        if new > 0:
+            self.n += 1
+            self.s1 += new
+            self.s2 += new * new
+
+    def std(self):
+        # Same convention as booking_log.load_std, the seed-selection key
+        if self.n < 2:
+            return float("inf")
+        var = (self.s2 - self.s1 * self.s1 / self.n) / (self.n - 1)
+        return math.sqrt(max(var, 0.0))
+
+
+class _Annealer:
+    """Moves on a ScheduleState with an undo journal and O(1) scoring."""
+
+    def __init__(self, problem, state, weights):
+        self.problem = problem
+        self.state = state
+        self.weights = weights
+        self.load = LoadStats(state.log.rep_load_counts(len(problem.reps)))
+
+        self.opportunity = np.nan_to_num(
+            np.array([m.total_opportunity for m in problem.meetings], dtype=float)
+        )
+        total = self.opportunity.sum()
+        self.opportunity_scale = 1.0 / total if total > 0 else 0.0
+        self.captured = sum(
+            self.opportunity[m.id] for m in problem.meetings if state.outcome(m.id)
+        )
+
+        # Unfulfilled meetings that could be booked, as a list + positions
+        # for O(1) sampling and updates
+        self.unfulfilled = []
+        self._position = {}
+        for m in problem.meetings:
+            if state.outcome(m.id) is False and not m.missing and len(m.candidates) >= m.seats:
+                self._set_unfulfilled(m, True)
+
+        self.journal = []
+
+    def _set_unfulfilled(self, m, value):
+        if value and m.id not in self._position:
+            self._position[m.id] = len(self.unfulfilled)
+            self.unfulfilled.append(m)
+        elif not value and m.id in self._position:
+            i = self._position.pop(m.id)
+            last = self.unfulfilled.pop()
+            if last.id != m.id:
+                self.unfulfilled[i] = last
+                self._position[last.id] = i
+
+    def objective(self):
+        w = self.weights
+        # A zero weight drops the term (0 * inf would be nan)
+        load = w["rep_load_std"] * self.load.std() if w["rep_load_std"] else 0.0
+        return float(
+            w["unfulfilled"] * self.state.n_unfulfilled
+            + w["suppliers"] * self.state.n_suppliers_unfulfilled
+            + load
+            - w["opportunity"] * self.captured * self.opportunity_scale
+        )
+
+    # -----------------------------------------------------------------
+    # Journaled primitives
+    # -----------------------------------------------------------------
+    def book(self, m, reps, slots):
+        self.state.book_meeting(m, reps, slots)
+        for r in reps:
+            self.load.add(r, len(slots))
+        self.journal.append(("book", m))
+
+    def cancel(self, m):
+        reps, slots = self.state.cancel_meeting(m)
+        for r in reps:
+            self.load.add(r, -len(slots))
+        self.journal.append(("cancel", m, reps, slots))
+        return reps, slots
+
+    def record(self, m, booked):
+        before = self.state.outcome(m.id)
+        if before == booked:
+            return
+        self._record(m, booked)
+        self.journal.append(("record", m, before))
+
+    def _record(self, m, booked):
+        self.state.record(m, booked)
+        self.captured += self.opportunity[m.id] * (1 if booked else -1)
+        self._set_unfulfilled(m, not booked)
+
+    def mark(self):
+        return len(self.journal)
+
+    def undo(self, mark):
+        while len(self.journal) > mark:
+            op = self.journal.pop()
+            if op[0] == "book":
+                reps, slots = self.state.cancel_meeting(op[1])
+                for r in reps:
+                    self.load.add(r, -len(slots))
+            elif op[0] == "cancel":
+                _, m, reps, slots = op
+                self.state.book_meeting(m, reps, slots)
+                for r in reps:
+                    self.load.add(r, len(slots))
+            else:
+                _, m, before = op
+                self._record(m, before)
+
+    # -----------------------------------------------------------------
+    # Placement
+    # -----------------------------------------------------------------
+    def place_random(self, m, rng):
+        """Book m with a random feasible seller group and slot."""
+        state = self.state
+        length, starts = self.problem.session_shape(m.kind)
+
+        base = (
+            state.supplier_busy.free_mask([m.supplier])
+            & state.rep_busy.free_mask(m.fixed)
+        )
+
+        if m.seats == 0:
+            common = window_starts(base, length, starts)
+            if not common.any():
+                return False
+            group = []
+        else:
+            masks = base & state.rep_busy.free_matrix(m.candidates)
+
+            if m.seats == 1:
+                feasible = window_starts(masks, length, starts)
+                options = np.flatnonzero(feasible.any(axis=1))
+                if not len(options):
+                    return False
+                k = int(rng.choice(options))
+                group, common = [m.candidates[k]], feasible[k]
+            else:
+                found = _random_group(masks & starts, m.seats, rng)
+                if found is None:
+                    return False
+                picks, common = found
+                group = [m.candidates[p] for p in picks]
+
+        start = int(rng.choice(np.flatnonzero(common)))
+        self.book(m, m.fixed + group, tuple(range(start, start + length)))
+        return True
+
+
+def _random_group(masks, seats, rng, tries=20):
+    """Random group of `seats` rows of masks sharing a slot, or None."""
+    alive = np.flatnonzero(masks.any(axis=1))
+    if len(alive) < seats:
+        return None
+
+    for _ in range(tries):
+        group = sorted(rng.sample(list(alive), seats))
+        common = np.logical_and.reduce(masks[group])
+        if common.any():
+            return tuple(int(g) for g in group), common
+
+    return None
+
+
+def optimize_schedule(
+    problem,
+    state,
+    rng,
+    iterations=2000,
+    time_budget=None,
+    start_temperature=5.0,
+    end_temperature=0.01,
+    weights=None
+):
+    """
+    Improve state in place with simulated annealing and leave it at the
+    best schedule seen.
+
+    Moves: re-book a Planning / Power Pairing meeting with a random seller
+    group and slot; book an unfulfilled meeting; or drop a booked meeting
+    to book an unfulfilled one, then try to re-book the dropped one.
+    Runs for `iterations` moves, or until time_budget seconds pass,
+    whichever comes first; either may be None (not both). The
+    temperature cools along the same budget, so a run cut short by the
+    clock still ends cold.
+
+    Returns the initial / best objective, move counts and the objective
+    trajectory as (iteration, current, best) points.
+    """
+    if iterations is None and time_budget is None:
+        raise ValueError("optimize_schedule needs iterations, time_budget or both")
+
+    weights = dict(OBJECTIVE_WEIGHTS, **(weights or {}))
+    sa = _Annealer(problem, state, weights)
+
+    movable = [m for m in problem.meetings if m.kind in MOVABLE_KINDS]
+    movable_by_supplier = {}
+    for m in movable:
+        movable_by_supplier.setdefault(m.supplier, []).append(m)
+
+    current = best = initial = sa.objective()
+    trajectory = [(0, current, best)]
+    recorded = 0
+    accepted = 0
+
+    start = time.monotonic()
+    log_cooling = math.log(end_temperature / start_temperature)
+
+    i = 0
+    while True:
+        progress = _progress(i, iterations, time_budget, start)
+
+        point = int(progress * TRAJECTORY_POINTS)
+        if point > recorded:
+            recorded = point
+            trajectory.append((i, current, best))
+
+        if progress >= 1.0:
+            break
+
+        temperature = start_temperature * math.exp(log_cooling * progress)
+        i += 1
+
+        mark = sa.mark()
+        moved = _random_move(sa, movable, movable_by_supplier, rng)
+
+        if moved:
+            candidate = sa.objective()
+            delta = candidate - current
+
+            if delta <= 0 or rng.random() < math.exp(-delta / temperature):
+                current = candidate
+                accepted += 1
+
+                if current < best - 1e-12:
+                    best = current
+                    sa.journal.clear()      # nothing to roll back past here
+            else:
+                sa.undo(mark)
+
+    # Roll back to the best schedule seen
+    sa.undo(0)
+
+    if trajectory[-1][0] != i:
+        trajectory.append((i, sa.objective(), best))
+
+    return {
+        "initial": initial,
+        "best": best,
+        "iterations": i,
+        "accepted": accepted,
+        "trajectory": trajectory
+    }
+
+
+def _progress(moves, iterations, time_budget, start):
+    """Share of the run used so far: of its moves or its time, whichever is larger."""
+    used = 0.0
+    if iterations is not None:
+        used = moves / iterations if iterations > 0 else 1.0
+    if time_budget is not None:
+        elapsed = time.monotonic() - start
+        used = max(used, elapsed / time_budget if time_budget > 0 else 1.0)
+    return min(used, 1.0)
+
+
+def _random_move(sa, movable, movable_by_supplier, rng):
+    state = sa.state
+    pick = rng.random()
+    mark = sa.mark()
+
+    if pick < 0.5 or not sa.unfulfilled:
+        # Relocate / swap sellers
+        if not movable:
+            return False
+
+        m = rng.choice(movable)
+        if state.placement(m.id) is None:
+            return False
+
+        sa.cancel(m)
+        if sa.place_random(m, rng):
+            return True
+        sa.undo(mark)
+        return False
+
+    target = rng.choice(sa.unfulfilled)
+
+    if pick < 0.75:
+        # Book an unfulfilled meeting as is
+        if sa.place_random(target, rng):
+            sa.record(target, True)
+            return True
+        return False
+
+    # Drop a booked meeting of the same supplier to make room
+    same_supplier = [
+        m for m in movable_by_supplier.get(target.supplier, [])
+        if m.id != target.id and state.placement(m.id) is not None
+    ]
+    if not same_supplier:
+        return False
+
+    dropped = rng.choice(same_supplier)
+
+    sa.cancel(dropped)
+    sa.record(dropped, False)
+
+    if not sa.place_random(target, rng):
+        sa.undo(mark)
+        return False
+
+    sa.record(target, True)
+    if sa.place_random(dropped, rng):
+        sa.record(dropped, True)
+
+    return True
@@ -0,0 +1,98 @@
+import heapq
+from app.slot_search import window_starts
+
+
+# =====================================================================
+# Meeting ordering for the greedy phases
+#
+# "input":       phase1 order (Power Pairings: highest opportunity first)
+# "constrained": most-constrained first. Each meeting is scored by its
+#                remaining flexibility on the live state, and tightest
+#                meetings are booked first; scores follow the bookings
+#                made along the way.
+# =====================================================================
+
+ORDERINGS = ("input", "constrained")
+
+
+def flexibility(problem, state, m):
+    """
+    Feasible seller options x feasible windows still open for m on
+    state; 0 means it can no longer be booked.
+    """
+    if m.missing or len(m.candidates) < m.seats:
+        return 0
+
+    length, starts = problem.session_shape(m.kind)
+
+    base = (
+        state.supplier_busy.free_mask([m.supplier])
+        & state.rep_busy.free_mask(m.fixed)
+    )
+    windows = int(window_starts(base, length, starts).sum())
+
+    if not m.seats or not windows:
+        return windows
+
+    sellers = window_starts(
+        base & state.rep_busy.free_matrix(m.candidates), length, starts
+    ).any(axis=1)
+
+    return windows * int(sellers.sum())
+
+
+def meeting_order(problem, state, meetings, ordering="input"):
+    """
+    Yield meetings in booking order. The caller books each meeting
+    before asking for the next one.
+
+    "constrained" keeps a heap of scores. A booking only changes the
+    flexibility of meetings sharing its supplier or one of its reps, so
+    after each yield those are re-scored and pushed again; entries whose
+    score is no longer current are skipped when popped. Ties keep input
+    order.
+    """
+    if ordering == "input":
+        yield from meetings
+        return
+
+    if ordering != "constrained":
+        raise ValueError(f"Unknown meeting ordering {ordering!r}; expected one of {ORDERINGS}")
+
+    meetings = list(meetings)
+    scores = {}                 # rank -> current score, while pending
+    by_supplier = {}
+    by_rep = {}
+
+    for rank, m in enumerate(meetings):
+        scores[rank] = flexibility(problem, state, m)
+        by_supplier.setdefault(m.supplier, []).append(rank)
+        for r in set(m.fixed) | set(m.candidates):
+            by_rep.setdefault(r, []).append(rank)
+
+    heap = [(score, rank, meetings[rank]) for rank, score in scores.items()]
+    heapq.heapify(heap)
+
+    while heap:
+        score, rank, m = heapq.heappop(heap)
+        if scores.get(rank) != score:
+            continue
+
+        del scores[rank]
+        yield m
+
+        placed = state.placement(m.id)
+        if placed is None:
+            continue
+
+        affected = set(by_supplier[m.supplier])
+        for r in placed[0]:
+            affected.update(by_rep.get(r, ()))
+
+        for other in affected:
+            if other not in scores:
+                continue
+            score = flexibility(problem, state, meetings[other])
+            if score != scores[other]:
+                scores[other] = score
+                heapq.heappush(heap, (score, other, meetings[other]))
@@ -0,0 +1,55 @@
+class Overlay:
+    """
+    Mapping of own changes on top of a frozen parent Overlay.
+
+    fork() is O(1): the child starts with no own entries and reads fall
+    through to its ancestors. The parent must not be written to once it
+    has been forked.
+    """
+
+    def __init__(self, parent=None):
+        self.parent = parent
+        self.own = {}
+
+    def get(self, key, default=None):
+        node = self
+        while node is not None:
+            if key in node.own:
+                return node.own[key]
+            node = node.parent
+        return default
+
+    def __contains__(self, key):
+        node = self
+        while node is not None:
+            if key in node.own:
+                return True
+            node = node.parent
+        return False
+
+    def __setitem__(self, key, value):
+        self.own[key] = value
+
+    def __bool__(self):
+        node = self
+        while node is not None:
+            if node.own:
+                return True
+            node = node.parent
+        return False
+
+    def items(self):
+        """Merged (key, value) pairs; newer layers win."""
+        chain = []
+        node = self
+        while node is not None:
+            chain.append(node.own)
+            node = node.parent
+
+        merged = {}
+        for own in reversed(chain):
+            merged.update(own)
+        return merged.items()
+
+    def fork(self):
+        return Overlay(self)
@@ -2,16 +2,19 @@ import pandas as pd
 import numpy as np
 
 
+EMPTY_ATTENDEES = ["", "-", "nan", "None"]
+
+
 # Utility: Clean attendees 
-def _parse_attendees(raw):
-    if raw is None or str(raw).strip() in ("", "-", "nan", "None"):
-        return []
-    parts = [p.strip() for p in str(raw).split(",") if p.strip()]
-    # If multiple names, return list of names
-    if len(parts) > 1:
-        return parts
-    # Exactly one thing; could be a name or district (ex: K5-6 San Diego)
-    return parts
+def _parse_attendees(col):
+    # One list per row: comma-separated names or a district (ex: K5-6 San Diego)
+    text = _clean_str(col)
+    names = text[~text.isin(EMPTY_ATTENDEES)].str.split(",").explode().str.strip()
+    names = names[names != ""]
+
+    attendees = pd.Series([[] for _ in range(len(col))], index=col.index, dtype=object)
+    attendees[names.index.unique()] = names.groupby(level=0, sort=False).agg(list)
+    return attendees
 
 
 # Clean & validate meeting definitions
@@ -32,13 +35,22 @@ def clean_and_validate_requests(preferences):
     return cleaned
 
 
+ORGANIZER_SHEETS = ["Meeting Requests", "Sales Reps", "Sales Rep District Oppty"]
+
+
+def _clean_str(col):
+    # str() per value (NaN -> "nan", like the row-wise parser did), then strip
+    return col.map(str).str.strip()
+
+
 # Main Parser
 def parse_meeting_organizer(file_path):
 
-    # Load sheets
-    req_df = pd.read_excel(file_path, sheet_name="Meeting Requests")
-    reps_df = pd.read_excel(file_path, sheet_name="Sales Reps")
-    sellers_df = pd.read_excel(file_path, sheet_name="Sales Rep District Oppty")
+    # Load all sheets in one pass (openpyxl read-only, workbook opened once)
+    sheets = pd.read_excel(file_path, sheet_name=ORGANIZER_SHEETS, engine="openpyxl")
+    req_df = sheets["Meeting Requests"]
+    reps_df = sheets["Sales Reps"]
+    sellers_df = sheets["Sales Rep District Oppty"]
 
     # Normalize sellers_opp_df
     sellers_opp_df = sellers_df.rename(columns={
@@ -93,9 +105,6 @@ def parse_meeting_organizer(file_path):
     # weight numeric fallback
     reps_df["Weight"] = pd.to_numeric(reps_df["Weight"], errors="coerce").fillna(1).astype(int)
 
-    # Build preferences dict
-    preferences = {}
-
     # convert pl1 to uppercase for matching seller product_line
     req_df["pl1"] = req_df["pl1"].astype(str).str.upper().fillna("")
 
@@ -107,29 +116,25 @@ def parse_meeting_organizer(file_path):
         pd.to_numeric(req_df["Acquisition Clean"], errors="coerce").fillna(0)
     )
 
-    for _, row in req_df.iterrows():
-
-        supplier = str(row["Supplier Name"]).strip()
-        meeting_num = int(row["Meeting #"])
-
-        attendees_raw = _parse_attendees(row["Request Clean"])
-        product_line = str(row["pl1"]).strip().upper()
-
-        total_opp = float(row["Penetration Clean"]) + float(row["Acquisition Clean"])
-
-        entry = {
-            "meeting_number": meeting_num,
-            "supplier_name": supplier,
-            "supplier_type": row["Supplier Type"],
-            "booth": row["Booth #"],
-            "request_name": row["Request Name"],
-            "session_type": str(row["Session Type"]).strip(),   # Strategy or Planning
-            "pl1": product_line,
-            "total_opportunity": total_opp,
-            "attendees_raw": attendees_raw
-        }
+    # Build preferences entries column-wise, then emit one dict per row
+    entries = pd.DataFrame({
+        "meeting_number": req_df["Meeting #"].astype(int),
+        "supplier_name": _clean_str(req_df["Supplier Name"]),
+        "supplier_type": req_df["Supplier Type"],
+        "booth": req_df["Booth #"],
+        "request_name": req_df["Request Name"],
+        "session_type": _clean_str(req_df["Session Type"]),   # Strategy or Planning
+        "pl1": _clean_str(req_df["pl1"]).str.upper(),
+        "total_opportunity": (
+            req_df["Penetration Clean"].astype(float)
+            + req_df["Acquisition Clean"].astype(float)
+        ),
+        "attendees_raw": _parse_attendees(req_df["Request Clean"])
+    })
 
-        preferences.setdefault(supplier, []).append(entry)
+    preferences = {}
+    for entry in entries.to_dict("records"):
+        preferences.setdefault(entry["supplier_name"], []).append(entry)
 
     # clean, sort, and reindex meetings
     cleaned_preferences = clean_and_validate_requests(preferences)
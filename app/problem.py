@@ -0,0 +1,257 @@
+import copy
+from collections import namedtuple
+import numpy as np
+from app.utils import time_slots, blocks, power_pairing_blocked
+
+
+class TimeGrid:
+    """
+    Integer time grid over time_slots.
+
+    Slot i is keys[i] = (day, "8:00 AM"-style label); slots are numbered
+    day by day in time_slots order, so consecutive ids within one day are
+    consecutive half-hours.
+    """
+
+    def __init__(self, slots_by_day=None):
+        slots_by_day = time_slots if slots_by_day is None else slots_by_day
+
+        self.days = list(slots_by_day.keys())
+        self.keys = []
+        self.day_bounds = []     # (first slot, one past last slot) per day
+        day_of = []
+
+        for d, (day, slots) in enumerate(slots_by_day.items()):
+            start = len(self.keys)
+            for label in slots:
+                self.keys.append((day, label))
+                day_of.append(d)
+            self.day_bounds.append((start, len(self.keys)))
+
+        self.index = {key: i for i, key in enumerate(self.keys)}
+        self.n_slots = len(self.keys)
+        self.day_of = np.array(day_of, dtype=np.int64)
+        self.lunch = np.array(
+            [slots_by_day[day][label] == "LUNCH" for day, label in self.keys],
+            dtype=bool
+        )
+        self.bookable = ~self.lunch
+
+        # Precomputed candidate slots / windows, in grid order
+        self.single_slots = np.flatnonzero(self.bookable).tolist()
+        self.pair_windows = self.windows(2)
+        self.pair_starts = self.start_mask(2)
+
+    def slot(self, day, label):
+        return self.index[(day, label)]
+
+    def mask(self, slot_ids):
+        out = np.zeros(self.n_slots, dtype=bool)
+        out[list(slot_ids)] = True
+        return out
+
+    def windows(self, length):
+        """
+        Every run of `length` consecutive bookable slots inside one day,
+        as tuples of slot ids.
+        """
+        out = []
+        for start, end in self.day_bounds:
+            for s in range(start, end - length + 1):
+                if self.bookable[s:s + length].all():
+                    out.append(tuple(range(s, s + length)))
+        return out
+
+    def start_mask(self, length):
+        """Mask of the slots that start one of windows(length)."""
+        return self.mask([w[0] for w in self.windows(length)])
+
+
+# One compiled meeting request. supplier / fixed / candidates are integer
+# ids; `fixed` reps always attend, `seats` more are picked from the
+# opportunity-ranked `candidates`. `missing` lists requested names that
+# are not in reps_df.
+Meeting = namedtuple("Meeting", [
+    "id",
+    "supplier",
+    "kind",
+    "request_name",
+    "booth",
+    "total_opportunity",
+    "fixed",
+    "candidates",
+    "seats",
+    "missing"
+])
+
+SESSION_LABELS = {
+    "strategy": "Strategy",
+    "planning": "Planning",
+    "power pairing": "Power Pairing"
+}
+
+
+class Problem:
+    """
+    Compact, seed-independent view of one scheduling input.
+
+    Suppliers, reps and meetings are interned to integer ids; names,
+    day strings and slot labels are only looked up again when schedule
+    rows are emitted.
+    """
+
+    def __init__(
+        self,
+        grid,
+        suppliers,
+        reps,
+        meetings,
+        supplier_blocks,
+        innovation_sessions,
+        workers,
+        phase1,
+        power_pairing_mask
+    ):
+        self.grid = grid
+        self.suppliers = suppliers
+        self.supplier_ids = {s: i for i, s in enumerate(suppliers)}
+        self.reps = reps
+        self.rep_ids = {r: i for i, r in enumerate(reps)}
+        self.meetings = meetings
+        self.supplier_blocks = supplier_blocks
+        self.innovation_sessions = innovation_sessions
+        self.workers = workers
+        self.phase1 = phase1
+        self.power_pairing_mask = power_pairing_mask   # slots Power Pairings may use
+        self.components = None    # independent meeting-id groups, see app.components
+
+        self.exclude({})
+
+    def exclude(self, impossible):
+        """
+        Leave meetings that can never be booked (meeting id -> reasons,
+        see app.feasibility) out of meetings_of(); seeds record them as
+        unfulfilled up front.
+        """
+        self.impossible = impossible
+        self._by_kind = {}
+        for m in self.meetings:
+            if m.id not in impossible:
+                self._by_kind.setdefault(m.kind, []).append(m)
+
+    def meetings_of(self, kind):
+        return self._by_kind.get(kind, [])
+
+    def restrict(self, meeting_ids):
+        """Copy whose meetings_of() only yields meeting_ids; shares everything else."""
+        sub = copy.copy(self)
+        keep = set(meeting_ids)
+        sub._by_kind = {
+            kind: [m for m in ms if m.id in keep]
+            for kind, ms in self._by_kind.items()
+        }
+        return sub
+
+    def session_shape(self, kind):
+        """(slots per session, mask of valid start slots) for a session kind."""
+        if kind == "strategy":
+            return 2, self.grid.pair_starts
+        if kind == "power pairing":
+            return 1, self.power_pairing_mask
+        return 1, self.grid.bookable
+
+    def rep_names(self, rep_ids):
+        return [self.reps[r] for r in rep_ids]
+
+
+def compile_problem(phase1, reps_df, seller_index, innovation_sessions, workers, grid=None):
+    """
+    Turn phase 1 output + reps_df + the seller index into a Problem.
+
+    innovation_sessions come from build_innovation_sessions_from_blocks()
+    and workers from get_innovation_workers(); both are resolved onto the
+    grid / rep ids here so seeds never translate them again.
+    """
+    grid = TimeGrid() if grid is None else grid
+
+    suppliers = list(phase1.keys())
+    supplier_ids = {s: i for i, s in enumerate(suppliers)}
+
+    reps = list(dict.fromkeys(reps_df["Rep Name"].tolist()))
+    rep_ids = {r: i for i, r in enumerate(reps)}
+
+    # Seller index ids -> rep ids (sellers missing from reps_df are dropped)
+    seller_to_rep = np.array(
+        [rep_ids.get(n, -1) for n in seller_index.names],
+        dtype=np.int64
+    )
+
+    meetings = []
+
+    for supplier, ms in phase1.items():
+        for m in ms:
+            requested = m["requested_attendees"]
+
+            names = [a for a in requested if isinstance(a, str)]
+            spots = [a for a in requested if isinstance(a, dict)]
+            fixed = [rep_ids[n] for n in names if n in rep_ids]
+
+            candidates = np.empty(0, dtype=np.int64)
+            seats = 0
+
+            if spots:
+                spot = spots[0]
+                ranked = seller_index.lookup(spot["district"], spot.get("product_line"))
+                candidates = seller_to_rep[ranked.ids]
+                # A named attendee cannot also fill a seller seat
+                candidates = candidates[(candidates >= 0) & ~np.isin(candidates, fixed)]
+                seats = spot.get("count", 1)
+
+            meetings.append(Meeting(
+                id=len(meetings),
+                supplier=supplier_ids[supplier],
+                kind=m["session_type"].strip().lower(),
+                request_name=m["request_name"],
+                booth=m["booth"],
+                total_opportunity=m["total_opportunity"],
+                fixed=fixed,
+                candidates=candidates.tolist(),
+                seats=seats,
+                missing=[n for n in names if n not in rep_ids]
+            ))
+
+    supplier_blocks = [
+        (supplier_ids[s], grid.slot(day, slot))
+        for day, blk in blocks.items()
+        for slot, blocked in blk.items()
+        for s in blocked
+        if s in supplier_ids
+    ]
+
+    sessions = [
+        {
+            "index": i,
+            "supplier": s["supplier"],
+            "day": s["day"],
+            "slots": s["slots"],
+            "slot_ids": [grid.slot(s["day"], t) for t in s["slots"]],
+            "capacity": s["capacity"]
+        }
+        for i, s in enumerate(innovation_sessions)
+    ]
+
+    return Problem(
+        grid=grid,
+        suppliers=suppliers,
+        reps=reps,
+        meetings=meetings,
+        supplier_blocks=supplier_blocks,
+        innovation_sessions=sessions,
+        workers=[rep_ids[w] for w in workers if w in rep_ids],
+        phase1=phase1,
+        power_pairing_mask=grid.bookable & ~grid.mask(
+            grid.slot(day, slot)
+            for day, slots in power_pairing_blocked.items()
+            for slot in slots
+        )
+    )
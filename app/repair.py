@@ -0,0 +1,240 @@
+from itertools import combinations, islice
+import numpy as np
+from app.slot_search import find_seller_group, window_starts
+
+
+# =====================================================================
+# Local-search repair
+#
+# Runs on a finished ScheduleState and tries to book its unfulfilled
+# meetings: first directly, then by ejecting the booked Planning /
+# Power Pairing meetings in the way (at most MAX_EJECTED) and
+# re-booking them elsewhere (another slot, or another seller from the
+# same district / product line).
+# =====================================================================
+
+# Meetings that may be moved to make room for another one
+MOVABLE_KINDS = ("planning", "power pairing")
+
+# Seller groups tried per meeting when looking for something to eject
+MAX_EJECTION_GROUPS = 20
+
+# Meetings that may be ejected to make room for one meeting
+MAX_EJECTED = 2
+
+
+def place_meeting(problem, state, m, rng):
+    """
+    Book m at a random feasible slot with its best-ranked feasible
+    seller group. Returns True when booked.
+    """
+    length, starts = problem.session_shape(m.kind)
+
+    base = (
+        state.supplier_busy.free_mask([m.supplier])
+        & state.rep_busy.free_mask(m.fixed)
+    )
+
+    if m.seats <= 1:
+        if m.seats:
+            groups = [[c] for c in m.candidates]
+            free = base & state.rep_busy.free_matrix(m.candidates)
+        else:
+            groups = [[]]
+            free = base[np.newaxis, :]
+
+        feasible = window_starts(free, length, starts)
+        options = np.flatnonzero(feasible.any(axis=1))
+
+        if not len(options):
+            return False
+
+        reps = m.fixed + groups[options[0]]
+        common = feasible[options[0]]
+    else:
+        found = find_seller_group(
+            base & starts, state.rep_busy.free_matrix(m.candidates), m.seats
+        )
+        if found is None:
+            return False
+
+        picks, common = found
+        reps = m.fixed + [m.candidates[p] for p in picks]
+
+    start = int(rng.choice(np.flatnonzero(common)))
+    state.book_meeting(m, reps, tuple(range(start, start + length)))
+    return True
+
+
+class _Occupancy:
+    """
+    Who holds each (entity, slot) cell: movable meetings by id, and a
+    "hard" busy matrix for everything that cannot move (supplier blocks,
+    Innovation Theater, Strategy).
+    """
+
+    def __init__(self, problem, state):
+        self.problem = problem
+        self.supplier = {}
+        self.rep = {}
+
+        self.supplier_hard = ~state.supplier_busy.free_matrix(range(len(problem.suppliers)))
+        self.rep_hard = ~state.rep_busy.free_matrix(range(len(problem.reps)))
+
+        for meeting_id, reps, slots in state.placements():
+            if problem.meetings[meeting_id].kind in MOVABLE_KINDS:
+                self.add(problem.meetings[meeting_id], reps, slots)
+
+    def add(self, m, reps, slots):
+        if m.kind not in MOVABLE_KINDS:
+            self.supplier_hard[m.supplier, list(slots)] = True
+            self.rep_hard[np.ix_(list(reps), list(slots))] = True
+            return
+
+        self.supplier_hard[m.supplier, list(slots)] = False
+        self.rep_hard[np.ix_(list(reps), list(slots))] = False
+
+        for s in slots:
+            self.supplier[(m.supplier, s)] = m.id
+            for r in reps:
+                self.rep[(r, s)] = m.id
+
+    def remove(self, m, reps, slots):
+        if m.kind not in MOVABLE_KINDS:
+            self.supplier_hard[m.supplier, list(slots)] = False
+            self.rep_hard[np.ix_(list(reps), list(slots))] = False
+            return
+
+        for s in slots:
+            self.supplier.pop((m.supplier, s), None)
+            for r in reps:
+                self.rep.pop((r, s), None)
+
+    def blockers(self, m, reps, slots):
+        """Ids of the movable meetings holding any cell m needs."""
+        found = set()
+
+        for s in slots:
+            b = self.supplier.get((m.supplier, s))
+            if b is not None and b != m.id:
+                found.add(b)
+            for r in reps:
+                b = self.rep.get((r, s))
+                if b is not None and b != m.id:
+                    found.add(b)
+
+        return found
+
+
+def _book(state, occ, m, reps, slots):
+    state.book_meeting(m, reps, slots)
+    occ.add(m, reps, slots)
+
+
+def _place(problem, state, occ, m, rng):
+    if not place_meeting(problem, state, m, rng):
+        return False
+    occ.add(m, *state.placement(m.id))
+    return True
+
+
+def _cancel(state, occ, m):
+    reps, slots = state.cancel_meeting(m)
+    occ.remove(m, reps, slots)
+    return reps, slots
+
+
+def _eject_for(problem, state, occ, m, rng):
+    """
+    Book m in a spot held by at most MAX_EJECTED movable meetings, then
+    re-book those elsewhere. Undone when any of them does not fit.
+    """
+    length, starts = problem.session_shape(m.kind)
+    meetings = problem.meetings
+
+    # Cells only movable meetings hold count as free here
+    base = ~occ.supplier_hard[m.supplier] & ~occ.rep_hard[m.fixed].any(axis=0)
+
+    for group in islice(combinations(m.candidates, m.seats), MAX_EJECTION_GROUPS):
+        reps = m.fixed + list(group)
+        free = base & ~occ.rep_hard[list(group)].any(axis=0)
+
+        candidates = np.flatnonzero(window_starts(free, length, starts)).tolist()
+        rng.shuffle(candidates)
+
+        for start in candidates:
+            slots = tuple(range(start, start + length))
+            blockers = occ.blockers(m, reps, slots)
+
+            if not blockers or len(blockers) > MAX_EJECTED:
+                continue
+
+            ejected = [meetings[b] for b in sorted(blockers)]
+            old = [_cancel(state, occ, b) for b in ejected]
+            _book(state, occ, m, reps, slots)
+
+            placed = []
+            for b in ejected:
+                if not _place(problem, state, occ, b, rng):
+                    break
+                placed.append(b)
+            else:
+                return True
+
+            # Undo in reverse order
+            for b in reversed(placed):
+                _cancel(state, occ, b)
+            _cancel(state, occ, m)
+            for b, (old_reps, old_slots) in zip(ejected, old):
+                _book(state, occ, b, old_reps, old_slots)
+
+    return False
+
+
+def repair_schedule(problem, state, rng, max_passes=2):
+    """
+    Book as many unfulfilled meetings of state as possible, in place.
+
+    Each pass tries every unfulfilled meeting (missing reps excepted)
+    directly, then with one ejection; passes repeat while they make
+    progress. Returns counts of what was attempted and repaired.
+    """
+    occ = _Occupancy(problem, state)
+
+    # Meetings short of named reps or sellers can never be booked
+    targets = [
+        m for m in problem.meetings
+        if state.outcome(m.id) is False
+        and not m.missing
+        and len(m.candidates) >= m.seats
+    ]
+
+    repaired = 0
+    ejections = 0
+
+    for _ in range(max_passes):
+        progress = False
+
+        for m in targets:
+            if state.outcome(m.id):
+                continue
+
+            if _place(problem, state, occ, m, rng):
+                pass
+            elif _eject_for(problem, state, occ, m, rng):
+                ejections += 1
+            else:
+                continue
+
+            state.record(m, True)
+            repaired += 1
+            progress = True
+
+        if not progress:
+            break
+
+    return {
+        "attempted": len(targets),
+        "repaired": repaired,
+        "ejections": ejections
+    }
@@ -1,10 +1,23 @@
 import re
-import pandas as pd
 import numpy as np
-from collections import defaultdict
+import os
 import random
-from copy import deepcopy
-from app.utils import time_slots, blocks
+import time
+from contextlib import ExitStack
+from concurrent.futures import ProcessPoolExecutor
+from app.utils import blocks
+from app.booking_log import load_std, balanced_load_std
+from app.flow import FlowNetwork
+from app.state import ScheduleState
+from app.cache import LRUCache, fingerprint
+from app.problem import compile_problem
+from app.feasibility import find_impossible, impossible_report
+from app.repair import repair_schedule
+from app.ordering import ORDERINGS, meeting_order
+from app.components import find_components, solve_component, merge_components
+from app.optimizer import optimize_schedule
+from app.seller_index import build_seller_index
+from app.slot_search import find_seller_group, first_free, window_starts
 
 def is_district_request(att_list):
     """
@@ -147,15 +160,10 @@ def build_phase1_requested_attendees(preferences, reps_df, sellers_opp_df):
     return new_pref
 
 def build_phase2_strategy_sessions(
-    phase1,
-    reps_df,
-    sellers_opp_df,
-    supplier_busy,
-    rep_busy,
-    supplier_rows,
-    rep_rows,
-    sup_summary,
-    rng
+    problem,
+    state,
+    rng,
+    ordering="input"
 ):
     """
     Schedule ONLY Strategy sessions using:
@@ -164,157 +172,54 @@ def build_phase2_strategy_sessions(
     Time windows are tried in RANDOMIZED order per meeting.
     """
 
-    def all_strategy_windows():
-        windows = []
-        for day, slots in time_slots.items():
-            slot_list = list(slots.keys())
-            for i in range(len(slot_list) - 1):
-                s1, s2 = slot_list[i], slot_list[i + 1]
-                if slots[s1] == "LUNCH" or slots[s2] == "LUNCH":
-                    continue
-                windows.append((day, s1, s2))
-        return windows
-
-    base_windows = all_strategy_windows()
-
-    for supplier, meetings in phase1.items():
-
-        for m in meetings:
-            if m["session_type"] != "Strategy":
-                continue
-
-            req_name = m["request_name"]
-            booth = m["booth"]
-            tot_opp = m["total_opportunity"]
-
-            requested = m["requested_attendees"]
-
-            leaders = [a for a in requested if isinstance(a, str)]
-            seller_spots = [a for a in requested if isinstance(a, dict)]
-
-            # Randomize time windows per meeting
-            windows = base_windows.copy()
-            rng.shuffle(windows)
-
-            # --------------------------------------------------
-            # CASE 1: Name-based Strategy (no seller spots)
-            # --------------------------------------------------
-            if not seller_spots:
-                required_reps = leaders
-                booked = False
-
-                for day, s1, s2 in windows:
-                    if supplier_busy[supplier][day][s1] or supplier_busy[supplier][day][s2]:
-                        continue
-                    if any(rep_busy[r][day][s1] or rep_busy[r][day][s2] for r in required_reps):
-                        continue
-
-                    _book_strategy(
-                        supplier, required_reps, day, s1, s2,
-                        booth, req_name, tot_opp,
-                        supplier_busy, rep_busy, supplier_rows, rep_rows
-                    )
-
-                    sup_summary[supplier]["fulfilled"].append(req_name)
-                    booked = True
-                    break
+    grid = problem.grid
+    length = 2
+    base_starts = [w[0] for w in grid.pair_windows]
 
-                if not booked:
-                    sup_summary[supplier]["unfulfilled"].append(req_name)
+    for m in meeting_order(problem, state, problem.meetings_of("strategy"), ordering):
 
-                continue
-
-            # --------------------------------------------------
-            # CASE 2: District-based Strategy (leader + seller)
-            # --------------------------------------------------
-            spot = seller_spots[0]
-            district = spot["district"].upper().strip()
-            product_line = spot.get("product_line")
-
-            candidates = sellers_opp_df[
-                sellers_opp_df["district"].str.upper() == district
-            ]
-
-            if product_line:
-                candidates = candidates[
-                    candidates["product_line"] == product_line.upper().strip()
-                ]
+        # Randomize time windows per meeting
+        starts = base_starts.copy()
+        rng.shuffle(starts)
 
-            candidates = candidates.sort_values("opportunity", ascending=False)
-
-            booked = False
-
-            for _, row in candidates.iterrows():
-                seller = row["name"]
-                required_reps = leaders + [seller]
+        booked = False
 
-                for day, s1, s2 in windows:
-                    if supplier_busy[supplier][day][s1] or supplier_busy[supplier][day][s2]:
-                        continue
-                    if any(rep_busy[r][day][s1] or rep_busy[r][day][s2] for r in required_reps):
-                        continue
+        if not m.missing:
+            base = (
+                state.supplier_busy.free_mask([m.supplier])
+                & state.rep_busy.free_mask(m.fixed)
+            )
+
+            # Name-based Strategy has no seller spot: only the named reps.
+            # District-based Strategy: leader (if any) + one ranked seller.
+            if m.seats:
+                sellers = [[seller] for seller in m.candidates]
+                free = base & state.rep_busy.free_matrix(m.candidates)
+            else:
+                sellers = [[]]
+                free = base[np.newaxis, :]
 
-                    _book_strategy(
-                        supplier, required_reps, day, s1, s2,
-                        booth, req_name, tot_opp,
-                        supplier_busy, rep_busy, supplier_rows, rep_rows
-                    )
+            # Feasible window starts for every option at once
+            feasible = window_starts(free, length, grid.pair_starts)
+            options = np.flatnonzero(feasible.any(axis=1))
 
-                    sup_summary[supplier]["fulfilled"].append(req_name)
-                    booked = True
-                    break
+            if len(options):
+                k = options[0]
+                start = first_free(starts, feasible[k])
 
-                if booked:
-                    break
+                state.book_meeting(
+                    m, m.fixed + sellers[k], tuple(range(start, start + length))
+                )
+                booked = True
 
-            if not booked:
-                sup_summary[supplier]["unfulfilled"].append(req_name)
+        state.record(m, booked)
 
-def _book_strategy(
-    supplier, reps, day, s1, s2,
-    booth, req_name, tot_opp,
-    supplier_busy, rep_busy, supplier_rows, rep_rows
-):
-    supplier_busy[supplier][day][s1] = True
-    supplier_busy[supplier][day][s2] = True
-
-    for r in reps:
-        rep_busy[r][day][s1] = True
-        rep_busy[r][day][s2] = True
-
-    for slot in (s1, s2):
-        supplier_rows.append({
-            "supplier": supplier,
-            "booth": booth,
-            "day": day,
-            "timeslot": slot,
-            "session_type": "Strategy",
-            "reps": reps,
-            "category": req_name,
-            "total_opportunity": tot_opp
-        })
-
-        for r in reps:
-            rep_rows.append({
-                "rep": r,
-                "day": day,
-                "timeslot": slot,
-                "supplier": supplier,
-                "booth": booth,
-                "session_type": "Strategy",
-                "category": req_name,
-                "total_opportunity": tot_opp
-            })
 
 def build_phase2_planning_sessions(
-    phase1,
-    sellers_opp_df,
-    supplier_busy,
-    rep_busy,
-    supplier_rows,
-    rep_rows,
-    sup_summary,
-    rng
+    problem,
+    state,
+    rng,
+    ordering="input"
 ):
     """
     Schedule ONLY Planning sessions using:
@@ -323,119 +228,37 @@ def build_phase2_planning_sessions(
     Time slots are tried in RANDOMIZED order per meeting.
     """
 
-    def all_planning_slots():
-        slots_out = []
-        for day, slots in time_slots.items():
-            for s in slots.keys():
-                if slots[s] == "LUNCH":
-                    continue
-                slots_out.append((day, s))
-        return slots_out
-
-    base_slots = all_planning_slots()
+    grid = problem.grid
+    base_slots = grid.single_slots
 
-    for supplier, meetings in phase1.items():
+    for m in meeting_order(problem, state, problem.meetings_of("planning"), ordering):
 
-        for m in meetings:
-            if m["session_type"] != "Planning":
-                continue
-
-            req_name = m["request_name"]
-            booth = m["booth"]
-            tot_opp = m["total_opportunity"]
-
-            requested = m["requested_attendees"]
-            spot = requested[0]  # Planning always has one seller_spot
-
-            district = spot["district"].upper().strip()
-            product_line = spot.get("product_line")
-            count_needed = spot.get("count", 2)
-
-            # Candidate sellers ordered by opportunity
-            candidates = sellers_opp_df[
-                sellers_opp_df["district"].str.upper() == district
-            ]
-
-            if product_line:
-                candidates = candidates[
-                    candidates["product_line"] == product_line.upper().strip()
-                ]
-
-            candidates = candidates.sort_values("opportunity", ascending=False)
-            seller_list = candidates["name"].tolist()
+        # Randomize slots per meeting
+        slots = base_slots.copy()
+        rng.shuffle(slots)
 
-            booked = False
-
-            # Randomize slots per meeting
-            slots = base_slots.copy()
-            rng.shuffle(slots)
-
-            # Try all seller pairs in priority order
-            for i in range(len(seller_list)):
-                for j in range(i + 1, len(seller_list)):
-                    sellers = [seller_list[i], seller_list[j]]
-
-                    if len(sellers) < count_needed:
-                        continue
-
-                    for day, s in slots:
-                        if supplier_busy[supplier][day][s]:
-                            continue
-                        if any(rep_busy[r][day][s] for r in sellers):
-                            continue
+        booked = False
 
-                        _book_planning(
-                            supplier, sellers, day, s,
-                            booth, req_name, tot_opp,
-                            supplier_busy, rep_busy,
-                            supplier_rows, rep_rows
-                        )
+        if not m.missing:
+            base = (
+                grid.bookable
+                & state.supplier_busy.free_mask([m.supplier])
+                & state.rep_busy.free_mask(m.fixed)
+            )
 
-                        sup_summary[supplier]["fulfilled"].append(req_name)
-                        booked = True
-                        break
+            # Best-ranked seller pair with a common free slot
+            found = find_seller_group(
+                base, state.rep_busy.free_matrix(m.candidates), m.seats
+            )
 
-                    if booked:
-                        break
-                if booked:
-                    break
+            if found is not None:
+                picks, common = found
+                required_reps = m.fixed + [m.candidates[p] for p in picks]
 
-            if not booked:
-                sup_summary[supplier]["unfulfilled"].append(req_name)
+                state.book_meeting(m, required_reps, (first_free(slots, common),))
+                booked = True
 
-def _book_planning(
-    supplier, reps, day, s,
-    booth, req_name, tot_opp,
-    supplier_busy, rep_busy,
-    supplier_rows, rep_rows
-):
-    supplier_busy[supplier][day][s] = True
-
-    for r in reps:
-        rep_busy[r][day][s] = True
-
-    supplier_rows.append({
-        "supplier": supplier,
-        "booth": booth,
-        "day": day,
-        "timeslot": s,
-        "session_type": "Planning",
-        "reps": reps,
-        "category": req_name,
-        "total_opportunity": tot_opp
-    })
-
-    for r in reps:
-        rep_rows.append({
-            "rep": r,
-            "day": day,
-            "timeslot": s,
-            "supplier": supplier,
-            "booth": booth,
-            "session_type": "Planning",
-            "category": req_name,
-            "total_opportunity": tot_opp
-        })
+        state.record(m, booked)
 
 
 def get_innovation_workers(reps_df):
@@ -447,7 +270,8 @@ def get_innovation_workers(reps_df):
 def build_innovation_sessions_from_blocks():
     """
     Build innovation sessions ONCE.
-    Each session has a hard capacity of 100 total reps.
+    Each session has a hard capacity of 85 total reps; seats taken are
+    counted per state (ScheduleState.innovation_count).
     """
 
     sessions = []
@@ -476,7 +300,6 @@ def build_innovation_sessions_from_blocks():
                 "supplier": supplier,
                 "day": day,
                 "slots": session_slots,
-                "assigned": set(),     # IMPORTANT: set, not list
                 "capacity": 85
             })
 
@@ -486,147 +309,168 @@ def build_innovation_sessions_from_blocks():
 
 
 
+def _innovation_eligibility(state, workers, sessions):
+    """(workers x sessions) bool: worker is free for every slot of the session."""
+    free = state.rep_busy.free_matrix(workers)
+    eligible = np.zeros((len(workers), len(sessions)), dtype=bool)
+
+    for j, session in enumerate(sessions):
+        eligible[:, j] = free[:, session["slot_ids"]].all(axis=1)
+
+    return eligible
+
+
+def _innovation_network(eligible, seats):
+    """
+    source -> worker (1) -> session (1, if eligible) -> sink (seats).
+
+    Returns the network, its source / sink nodes, the source edge of each
+    worker, the worker -> session edges as (worker, session, edge) and the
+    session -> sink edges.
+    """
+    n_workers, n_sessions = eligible.shape
+    source = n_workers + n_sessions
+    sink = source + 1
+
+    net = FlowNetwork(sink + 1)
+
+    source_edges = [None] * n_workers
+    assign_edges = [
+        (i, j, net.add_edge(i, n_workers + j, 1))
+        for i, j in zip(*np.nonzero(eligible))
+    ]
+    sink_edges = [
+        net.add_edge(n_workers + j, sink, int(seats[j]))
+        for j in range(n_sessions)
+    ]
+
+    return net, source, sink, source_edges, assign_edges, sink_edges
+
+
+def _assigned_sessions(net, assign_edges):
+    return {int(i): int(j) for i, j, e in assign_edges if net.flow(e)}
+
+
 def assign_minimum_innovation_sessions(
-    reps_df,
-    innovation_sessions,
-    rep_busy,
-    rep_rows,
+    problem,
+    state,
     rng
 ):
     """
     Assign exactly 1 Innovation Theater session per worker first,
-    spreading reps evenly across sessions in round-robin order.
+    spreading reps evenly across sessions.
+
+    Solved as a max-flow: every worker who can attend some session gets
+    one. Sessions are first capped at an even share of the workers, then
+    opened up to full capacity for whoever is still unassigned.
     """
 
-    workers = get_innovation_workers(reps_df)
+    workers = list(problem.workers)
+    innovation_sessions = list(problem.innovation_sessions)
 
     # Randomize order to avoid bias
     rng.shuffle(workers)
     rng.shuffle(innovation_sessions)
 
-    num_sessions = len(innovation_sessions)
-    session_idx = 0
+    if not workers or not innovation_sessions:
+        return
 
-    for rep in workers:
-        tried = 0
-        assigned = False
+    remaining = np.array([
+        s["capacity"] - state.innovation_count[s["index"]]
+        for s in innovation_sessions
+    ])
+    even_share = -(-len(workers) // len(innovation_sessions))
 
-        # Try sessions in round-robin order
-        while tried < num_sessions:
-            session = innovation_sessions[session_idx]
-            session_idx = (session_idx + 1) % num_sessions
-            tried += 1
+    eligible = _innovation_eligibility(state, workers, innovation_sessions)
+    net, source, sink, source_edges, assign_edges, sink_edges = _innovation_network(
+        eligible, np.minimum(remaining, even_share)
+    )
 
-            # Capacity check
-            if len(session["assigned"]) >= session["capacity"]:
-                continue
+    for i in range(len(workers)):
+        source_edges[i] = net.add_edge(source, i, 1)
 
-            day = session["day"]
-            slots = session["slots"]
+    net.max_flow(source, sink)
 
-            # Availability check
-            if any(rep_busy[rep][day].get(s, False) for s in slots):
-                continue
+    # Open the remaining seats
+    for j, e in enumerate(sink_edges):
+        net.cap[e] = int(remaining[j]) - net.flow(e)
 
-            # Assign rep
-            session["assigned"].add(rep)
-
-            for s in slots:
-                rep_busy[rep][day][s] = True
-                rep_rows.append({
-                    "rep": rep,
-                    "day": day,
-                    "timeslot": s,
-                    "supplier": session["supplier"],
-                    "booth": "",
-                    "session_type": "Innovation Theater",
-                    "category": "",
-                    "total_opportunity": ""
-                })
+    net.max_flow(source, sink)
 
-            assigned = True
-            break
+    assigned = _assigned_sessions(net, assign_edges)
 
-        if not assigned:
-            print(f"WARNING: {rep} received no Innovation session")
+    for i, rep in enumerate(workers):
+        if i in assigned:
+            state.book_innovation(innovation_sessions[assigned[i]], rep)
+        else:
+            print(f"WARNING: {problem.reps[rep]} received no Innovation session")
 
 
 def fill_innovation_sessions_to_capacity(
-    reps_df,
-    innovation_sessions,
-    rep_busy,
-    rep_rows,
+    problem,
+    state,
     rng
 ):
-    workers = get_innovation_workers(reps_df)
-
-    worker_counts = {
-        r: sum(
-            1 for row in rep_rows
-            if row["rep"] == r and row["session_type"] == "Innovation Theater"
-        )
-        for r in workers
-    }
-
-    round_num = 1
-
-    while True:
-        progress = False
+    """
+    Fill Innovation Theater sessions up to capacity.
 
-        for session in innovation_sessions:
-            if len(session["assigned"]) >= session["capacity"]:
-                continue
+    Each round is a max-flow giving every worker at most one more
+    session; least-loaded workers (total schedule rows) are routed first,
+    so the extra sessions also even out rep load. Rounds stop once no
+    seat can be filled.
+    """
 
-            day = session["day"]
-            slots = session["slots"]
+    workers = list(problem.workers)
+    rng.shuffle(workers)
 
-            for rep in workers:
-                if len(session["assigned"]) >= session["capacity"]:
-                    break
+    sessions = problem.innovation_sessions
+    load = state.log.rep_load_counts(len(problem.reps))[workers]
 
-                if worker_counts[rep] > round_num:
-                    continue
+    while True:
+        open_sessions = [
+            s for s in sessions
+            if state.innovation_count[s["index"]] < s["capacity"]
+        ]
+        if not open_sessions or not workers:
+            break
 
-                if rep in session["assigned"]:
-                    continue
+        remaining = [
+            s["capacity"] - state.innovation_count[s["index"]]
+            for s in open_sessions
+        ]
 
-                if any(rep_busy[rep][day].get(s, False) for s in slots):
-                    continue
+        eligible = _innovation_eligibility(state, workers, open_sessions)
+        net, source, sink, source_edges, assign_edges, sink_edges = _innovation_network(
+            eligible, remaining
+        )
 
-                session["assigned"].add(rep)
-                worker_counts[rep] += 1
-                progress = True
+        # Least-loaded workers first: flow into a source edge never
+        # drops, so earlier levels keep their seats
+        order = np.argsort(load, kind="stable")
+        levels = np.split(order, np.flatnonzero(np.diff(load[order])) + 1)
 
-                for s in slots:
-                    rep_busy[rep][day][s] = True
-                    rep_rows.append({
-                        "rep": rep,
-                        "day": day,
-                        "timeslot": s,
-                        "supplier": session["supplier"],
-                        "booth": "",
-                        "session_type": "Innovation Theater",
-                        "category": "",
-                        "total_opportunity": ""
-                    })
+        for level in levels:
+            for i in level:
+                if eligible[i].any():
+                    source_edges[i] = net.add_edge(source, int(i), 1)
+            net.max_flow(source, sink)
 
-        if not progress:
+        assigned = _assigned_sessions(net, assign_edges)
+        if not assigned:
             break
 
-        round_num += 1
-
-
+        for i, rep in enumerate(workers):
+            if i in assigned:
+                session = open_sessions[assigned[i]]
+                state.book_innovation(session, rep)
+                load[i] += len(session["slot_ids"])
 
 
 def build_phase2_power_pairings(
-    phase1,
-    sellers_opp_df,
-    supplier_busy,
-    rep_busy,
-    supplier_rows,
-    rep_rows,
-    sup_summary,
-    rng
+    problem,
+    state,
+    rng,
+    ordering="input"
 ):
     """
     Book Power Pairing sessions:
@@ -635,256 +479,490 @@ def build_phase2_power_pairings(
     - Slot chosen randomly from all valid options
 
     HARD CONSTRAINT:
-    - No Power Pairings on Tuesday, February 24th at 11:00 AM or 11:30 AM
+    - No Power Pairings in the power_pairing_blocked slots (app.utils),
+      compiled into problem.power_pairing_mask
     """
 
-    # -------------------------------------------------
-    # Hard-coded blocked window for Power Pairings
-    # -------------------------------------------------
-    BLOCKED_PP_DAY = "Tuesday, February 24th"
-    BLOCKED_PP_SLOTS = {"11:00 AM", "11:30 AM"}
-
-    # Collect all Power Pairing meetings
-    meetings = []
-    for supplier, ms in phase1.items():
-        for m in ms:
-            if m["session_type"].strip().lower() == "power pairing":
-                meetings.append(m)
-
     # Highest opportunity first
-    meetings.sort(key=lambda m: m["total_opportunity"], reverse=True)
+    meetings = sorted(
+        problem.meetings_of("power pairing"),
+        key=lambda m: m.total_opportunity,
+        reverse=True
+    )
+
+    for m in meeting_order(problem, state, meetings, ordering):
+        booked = False
 
-    for m in meetings:
-        supplier = m["supplier_name"]
-        booth = m["booth"]
-        req_name = m["request_name"]
-        tot_opp = m["total_opportunity"]
+        if m.missing:
+            state.record(m, booked)
+            continue
 
-        seller_spot = next(
-            a for a in m["requested_attendees"]
-            if isinstance(a, dict) and a.get("type") == "seller_spot"
+        base = (
+            problem.power_pairing_mask
+            & state.supplier_busy.free_mask([m.supplier])
+            & state.rep_busy.free_mask(m.fixed)
         )
 
-        district = seller_spot["district"].upper().strip()
-        product_line = seller_spot.get("product_line")
+        # Candidate sellers, highest opportunity first
+        found = find_seller_group(
+            base, state.rep_busy.free_matrix(m.candidates), m.seats
+        )
 
-        # Candidate sellers
-        sellers = sellers_opp_df[
-            sellers_opp_df["district"].str.upper() == district
-        ]
+        if found is not None:
+            picks, common = found
+            required_reps = m.fixed + [m.candidates[p] for p in picks]
 
-        if product_line:
-            sellers = sellers[
-                sellers["product_line"].str.upper() == product_line.upper()
-            ]
+            s = int(rng.choice(np.flatnonzero(common)))
 
-        sellers = sellers.sort_values("opportunity", ascending=False)
+            state.book_meeting(m, required_reps, (s,))
+            booked = True
 
-        booked = False
+        state.record(m, booked)
 
-        for _, row in sellers.iterrows():
-            seller = row["name"]
 
-            valid_slots = []
+# Phase 1 only depends on the inputs: memoize it across seeds and reruns
+_PHASE1_CACHE = LRUCache(max_entries=8)
 
-            for day, slots in time_slots.items():
-                for slot, label in slots.items():
 
-                    # Skip lunch
-                    if label == "LUNCH":
-                        continue
+def cached_phase1(preferences, reps_df, sellers_opp_df, input_key=None):
+    """
+    build_phase1_requested_attendees, computed once per input fingerprint.
 
-                    # Skip Power Pairing blocked window
-                    if (
-                        day == BLOCKED_PP_DAY
-                        and slot in BLOCKED_PP_SLOTS
-                    ):
-                        continue
+    input_key lets callers that already hashed the inputs (e.g. the
+    uploaded workbook bytes) skip fingerprinting.
+    """
+    if input_key is None:
+        input_key = fingerprint(preferences, reps_df, sellers_opp_df)
 
-                    if supplier_busy[supplier][day][slot]:
-                        continue
+    phase1 = _PHASE1_CACHE.get(input_key)
 
-                    if rep_busy[seller][day][slot]:
-                        continue
+    if phase1 is None:
+        phase1 = build_phase1_requested_attendees(preferences, reps_df, sellers_opp_df)
+        _PHASE1_CACHE.put(input_key, phase1)
 
-                    valid_slots.append((day, slot))
+    return phase1
 
-            if not valid_slots:
-                continue
 
-            day, slot = rng.choice(valid_slots)
+def prepare_problem(preferences, reps_df, sellers_opp_df, seller_index=None, input_key=None):
+    """
+    Phase 1 + compile step: everything the seeds share, built once.
+    Meetings no seed can book are found here and left out of the search.
+    """
+    if seller_index is None:
+        seller_index = build_seller_index(sellers_opp_df)
 
-            # Mark busy
-            supplier_busy[supplier][day][slot] = True
-            rep_busy[seller][day][slot] = True
+    phase1 = cached_phase1(preferences, reps_df, sellers_opp_df, input_key)
 
-            supplier_rows.append({
-                "supplier": supplier,
-                "booth": booth,
-                "day": day,
-                "timeslot": slot,
-                "session_type": "Power Pairing",
-                "reps": [seller],
-                "category": req_name,
-                "total_opportunity": tot_opp
-            })
+    problem = compile_problem(
+        phase1,
+        reps_df,
+        seller_index,
+        build_innovation_sessions_from_blocks(),
+        get_innovation_workers(reps_df)
+    )
+    problem.exclude(find_impossible(problem))
 
-            rep_rows.append({
-                "rep": seller,
-                "day": day,
-                "timeslot": slot,
-                "supplier": supplier,
-                "booth": booth,
-                "session_type": "Power Pairing",
-                "category": req_name,
-                "total_opportunity": tot_opp
-            })
+    return problem
 
-            sup_summary[supplier]["fulfilled"].append(req_name)
-            booked = True
-            break
 
-        if not booked:
-            sup_summary[supplier]["unfulfilled"].append(req_name)
+def feasibility_report(preferences, reps_df, sellers_opp_df, seller_index=None, input_key=None):
+    """
+    Requests that can never be scheduled, per supplier, without running
+    any seed (see app.feasibility.impossible_report).
+    """
+    problem = prepare_problem(
+        preferences, reps_df, sellers_opp_df, seller_index, input_key
+    )
+    return impossible_report(problem)
 
 
-def build_phase3_core_scheduler(preferences, reps_df, sellers_opp_df, seed):
+def build_phase3_core_scheduler(
+    preferences, reps_df, sellers_opp_df, seed, problem=None, ordering="input", pool=None
+):
     rng = random.Random(seed)
 
-    phase1 = build_phase1_requested_attendees(preferences, reps_df, sellers_opp_df)
+    if problem is None:
+        problem = prepare_problem(preferences, reps_df, sellers_opp_df)
 
-    supplier_rows = []
-    rep_rows = []
+    phase1 = problem.phase1
 
-    supplier_busy = {
-        s: {d: {t: False for t in time_slots[d]} for d in time_slots}
-        for s in preferences.keys()
-    }
+    # Supplier blocks are booked when the state is created
+    state = ScheduleState(problem)
 
-    rep_busy = {
-        r: {d: {t: False for t in time_slots[d]} for d in time_slots}
-        for r in reps_df["Rep Name"].tolist()
-    }
+    # 🔹 Pass A: guarantee 1 per worker
+    assign_minimum_innovation_sessions(problem, state, rng)
+
+    if problem.components:
+        # Strategy + Planning per independent component
+        state = _solve_components(
+            problem, state,
+            [build_phase2_strategy_sessions, build_phase2_planning_sessions],
+            f"core/{seed}", ordering, pool
+        )
+    else:
+        # Strategy
+        build_phase2_strategy_sessions(problem, state, rng, ordering)
 
-    for day, blk in blocks.items():
-        for slot, blocked in blk.items():
-            for s in blocked:
-                if s in supplier_busy:
-                    supplier_busy[s][day][slot] = True
-
-    sup_summary = {
-        s: {
-            "requested": [m["request_name"] for m in meetings],
-            "fulfilled": [],
-            "unfulfilled": [],
-            "unfulfilled_power_pairings": []
-        }
-        for s, meetings in phase1.items()
+        # Planning
+        build_phase2_planning_sessions(problem, state, rng, ordering)
+
+    return {
+        "seed": seed,
+        "phase1": phase1,
+        "problem": problem,
+        "state": state,
+        "validation": state.validation()
     }
 
-    # 🔹 Build innovation sessions ONCE
-    innovation_sessions = build_innovation_sessions_from_blocks()
 
-    # 🔹 Pass A: guarantee 1 per worker
-    assign_minimum_innovation_sessions(
-        reps_df,
-        innovation_sessions,
-        rep_busy,
-        rep_rows,
-        rng
-    )
 
-    # Strategy
-    build_phase2_strategy_sessions(
-        phase1, reps_df, sellers_opp_df,
-        supplier_busy, rep_busy,
-        supplier_rows, rep_rows,
-        sup_summary, rng
-    )
+def extend_with_addons(
+    core_result, reps_df, sellers_opp_df, seed, ordering="input", pool=None, fill=True
+):
+    """
+    Power Pairings and the Innovation Theater fill (pass B) on a fork
+    of the core state. fill=False stops before pass B; the result's rng
+    then finishes it (fill_innovation_sessions_to_capacity) as the full
+    extension would.
+    """
+    rng = random.Random(seed)
 
-    # Planning
-    build_phase2_planning_sessions(
-        phase1, sellers_opp_df,
-        supplier_busy, rep_busy,
-        supplier_rows, rep_rows,
-        sup_summary, rng
-    )
+    # Copy-on-write branch of the core state: O(bookings made here)
+    state = core_result["state"].fork()
+    problem = core_result["problem"]
 
-    validation = {
-        "total_unfulfilled": sum(len(v["unfulfilled"]) for v in sup_summary.values()),
-        "unfulfilled_detail": {
-            s: v["unfulfilled"]
-            for s, v in sup_summary.items()
-            if v["unfulfilled"]
-        }
-    }
+    # Power Pairings
+    if problem.components:
+        state = _solve_components(
+            problem, state, [build_phase2_power_pairings],
+            f"addon/{seed}", ordering, pool
+        )
+    else:
+        build_phase2_power_pairings(problem, state, rng, ordering)
 
+    # 🔹 Pass B: fill innovation to capacity
+    if fill:
+        fill_innovation_sessions_to_capacity(problem, state, rng)
+
+    # DataFrames are only built for the winning seed (materialize_schedules)
     return {
         "seed": seed,
-        "phase1": phase1,
-        "supplier_rows": supplier_rows,
-        "rep_rows": rep_rows,
-        "supplier_busy": supplier_busy,
-        "rep_busy": rep_busy,
-        "innovation_sessions": innovation_sessions,
-        "summary": sup_summary,
-        "validation": validation
+        "problem": problem,
+        "state": state,
+        "rng": rng
     }
 
 
+def _solve_components(problem, state, phases, seed_key, ordering, pool=None):
+    """
+    Run phases per component of problem.components (each with its own
+    seeded rng), over pool when given, and merge into a fork of state.
+    """
+    components = problem.components
+    keys = [f"{seed_key}/{i}" for i in range(len(components))]
 
-def extend_with_addons(core_result, reps_df, sellers_opp_df, seed):
-    rng = random.Random(seed)
+    if pool is None or len(components) < 2:
+        results = [
+            solve_component(problem, state, ids, phases, random.Random(key), ordering)
+            for ids, key in zip(components, keys)
+        ]
+    else:
+        supplier_busy, rep_busy = state.busy_matrices()
+        n = len(components)
+        results = list(pool.map(
+            _run_component,
+            [supplier_busy] * n, [rep_busy] * n,
+            components, [phases] * n, keys, [ordering] * n
+        ))
 
-    supplier_rows = list(core_result["supplier_rows"])
-    rep_rows = list(core_result["rep_rows"])
+    return merge_components(problem, state, results)
 
-    supplier_busy = deepcopy(core_result["supplier_busy"])
-    rep_busy = deepcopy(core_result["rep_busy"])
-    innovation_sessions = core_result["innovation_sessions"]
 
-    sup_summary = deepcopy(core_result["summary"])
-    phase1 = core_result["phase1"]
+def materialize_schedules(extended):
+    """(supplier_sched, rep_sched, summary) for an extend_with_addons result."""
+    state = extended["state"]
+    supplier_sched, rep_sched = state.log.to_frames(extended["problem"])
+    return supplier_sched, rep_sched, state.summary()
 
-    # Power Pairings
-    build_phase2_power_pairings(
-        phase1, sellers_opp_df,
-        supplier_busy, rep_busy,
-        supplier_rows, rep_rows,
-        sup_summary, rng
-    )
 
-    # 🔹 Pass B: fill innovation to 100
-    # fill_innovation_sessions_to_capacity(
-    #     reps_df,
-    #     innovation_sessions,
-    #     rep_busy,
-    #     rep_rows,
-    #     rng
-    # )
+def _core_diagnostics(seed, result):
+    state = result["state"]
+    return {
+        "seed": seed,
+        "total_unfulfilled": state.n_unfulfilled,
+        "num_suppliers_unfulfilled": state.n_suppliers_unfulfilled,
+        # Meetings no seed can book are unfulfilled in every schedule
+        "unfulfilled_floor": len(result["problem"].impossible)
+    }
+
 
+def _addon_diagnostics(seed, extended):
+    state = extended["state"]
+    counts = state.log.rep_load_counts(len(extended["problem"].reps))
     return {
         "seed": seed,
-        "supplier_sched": pd.DataFrame(supplier_rows),
-        "rep_sched": pd.DataFrame(rep_rows),
-        "summary": sup_summary
+        "total_unfulfilled": state.n_unfulfilled,
+        "num_suppliers_unfulfilled": state.n_suppliers_unfulfilled,
+        "unfulfilled_floor": len(extended["problem"].impossible),
+        "rep_load_std": load_std(counts),
+        # Best std any seed could reach with this load
+        "rep_load_std_floor": balanced_load_std(counts)
     }
 
 
+def _core_key(d):
+    # Primary: fewer unfulfilled, secondary: fewer suppliers impacted
+    return (d["total_unfulfilled"], d["num_suppliers_unfulfilled"])
+
+
+def _addon_key(d):
+    # Tertiary: smoother rep load
+    return _core_key(d) + (d["rep_load_std"],)
+
+
+def _core_is_optimal(d):
+    # Every meeting that can be booked is booked
+    return d["total_unfulfilled"] <= d["unfulfilled_floor"]
+
+
+def _addon_is_optimal(d):
+    # Every bookable meeting booked and rep load already as even as it can be
+    return (
+        _core_is_optimal(d)
+        and d["rep_load_std"] <= d["rep_load_std_floor"] + 1e-9
+    )
+
+
+def _select_best(diagnostics, key):
+    """
+    Lowest key wins; ties go to the lowest seed, so the choice does not
+    depend on the order in which seeds finished.
+    """
+    return min(diagnostics, key=lambda d: (key(d), d["seed"]))
+
+
+# -----------------------------------------------------------------
+# Process pool workers: inputs are shipped once per worker through
+# the pool initializer, tasks only carry seeds.
+# -----------------------------------------------------------------
+_WORKER_STATE = {}
+
+
+def _init_seed_worker(preferences, reps_df, sellers_opp_df, problem, ordering):
+    _WORKER_STATE.clear()
+    _WORKER_STATE["inputs"] = (preferences, reps_df, sellers_opp_df)
+    _WORKER_STATE["problem"] = problem
+    _WORKER_STATE["ordering"] = ordering
+    _WORKER_STATE["core"] = {}
+
+
+def _worker_core_result(core_seed):
+    cache = _WORKER_STATE["core"]
+    if core_seed not in cache:
+        cache.clear()
+        cache[core_seed] = build_phase3_core_scheduler(
+            *_WORKER_STATE["inputs"], core_seed,
+            problem=_WORKER_STATE["problem"],
+            ordering=_WORKER_STATE["ordering"]
+        )
+    return cache[core_seed]
+
+
+def _run_component(supplier_busy, rep_busy, meeting_ids, phases, key, ordering):
+    problem = _WORKER_STATE["problem"]
+    state = ScheduleState.from_busy(problem, supplier_busy, rep_busy)
+    return solve_component(problem, state, meeting_ids, phases, random.Random(key), ordering)
+
+
+def _run_core_seed(seed):
+    return _core_diagnostics(seed, _worker_core_result(seed))
+
+
+def _run_addon_seed(core_seed, seed):
+    _, reps_df, sellers_opp_df = _WORKER_STATE["inputs"]
+    extended = extend_with_addons(
+        _worker_core_result(core_seed), reps_df, sellers_opp_df, seed,
+        ordering=_WORKER_STATE["ordering"]
+    )
+    return _addon_diagnostics(seed, extended)
+
+
+def run_scheduler(
+    preferences,
+    reps_df,
+    sellers_opp_df,
+    core_seeds=10,
+    addon_seeds=10,
+    workers=1,
+    return_diagnostics=False,
+    seller_index=None,
+    input_key=None,
+    time_budget=None,
+    repair=True,
+    optimize_iterations=0,
+    optimize_time=None,
+    ordering="input",
+    decompose=False
+):
+    """
+    Seed search over the core scheduler, then over the add-on phase
+    for the best core result.
+
+    time_budget (seconds) switches to anytime mode: seeds keep being
+    generated until the budget runs out (ANYTIME_CORE_SHARE of it for
+    core seeds, the rest for add-on seeds), and core_seeds / addon_seeds
+    are ignored. A phase ends early once its best result cannot be
+    improved (only meetings no seed can book left unfulfilled; for
+    add-ons, also the lowest possible rep load std). The seed running
+    at the deadline is finished, so the budget can be overrun by one
+    seed.
+
+    repair runs a local-search pass (app.repair) on the selected
+    schedule to book meetings the greedy phases left unfulfilled,
+    before its Innovation Theater sessions are filled to capacity.
+
+    ordering picks the order the greedy phases book meetings in
+    (app.ordering): "input", or "constrained" for most-constrained first.
+
+    decompose splits the meetings into independent supplier / rep
+    components (app.components) solved separately after the shared
+    Innovation Theater stage. With workers > 1 the components, rather
+    than the seeds, are spread over the process pool (in anytime mode
+    seeds still are, and components run inside each seed worker).
+
+    optimize_iterations > 0 and / or optimize_time (seconds) then run
+    simulated annealing (app.optimizer) on it until either budget is
+    used up; its objective trajectory is in diagnostics["optimize"].
+
+    workers=1 runs seeds one after another; workers > 1 (or None for one
+    per CPU) fans seeds out over a process pool. Workers only report
+    diagnostics, and the winning seeds are rebuilt here, so both modes
+    return the same schedule.
+
+    seller_index may be passed in when the caller already built it for
+    these inputs. Phase 1 and the compiled problem are built once here
+    and shared by all seeds; phase 1 is also memoized per input_key
+    (an input fingerprint, computed here when not given).
+    """
+    if ordering not in ORDERINGS:
+        raise ValueError(f"Unknown meeting ordering {ordering!r}; expected one of {ORDERINGS}")
+
+    problem = prepare_problem(
+        preferences, reps_df, sellers_opp_df, seller_index, input_key
+    )
+
+    if problem.impossible:
+        print(f"{len(problem.impossible)} meetings can never be scheduled:")
+        for supplier, requests in impossible_report(problem).items():
+            for req in requests:
+                print(f"  {supplier} / {req['request_name']}: {'; '.join(req['reasons'])}")
+
+    if decompose:
+        problem.components = find_components(problem)
+        print(
+            f"Solving {len(problem.components)} independent components "
+            f"(sizes {[len(c) for c in problem.components]})"
+        )
+
+    search = None
+
+    if time_budget is not None:
+        core_best, core_diagnostics, extended_best, addon_diagnostics, search = _search_anytime(
+            preferences, reps_df, sellers_opp_df, time_budget, workers, problem, ordering
+        )
+    elif workers == 1:
+        core_best, core_diagnostics, extended_best, addon_diagnostics = _search_sequential(
+            preferences, reps_df, sellers_opp_df, core_seeds, addon_seeds, problem, ordering
+        )
+    elif decompose:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_seed_worker,
+            initargs=(preferences, reps_df, sellers_opp_df, problem, ordering)
+        ) as pool:
+            core_best, core_diagnostics, extended_best, addon_diagnostics = _search_sequential(
+                preferences, reps_df, sellers_opp_df, core_seeds, addon_seeds,
+                problem, ordering, pool
+            )
+    else:
+        core_best, core_diagnostics, extended_best, addon_diagnostics = _search_parallel(
+            preferences, reps_df, sellers_opp_df, core_seeds, addon_seeds, workers, problem, ordering
+        )
+
+    best = _addon_diagnostics(extended_best["seed"], extended_best)
+
+    print(
+        f"Selected best extension seed {extended_best['seed']} "
+        f"(unfulfilled={best['total_unfulfilled']}, "
+        f"suppliers={best['num_suppliers_unfulfilled']})"
+    )
+
+    repair_stats = None
+
+    if repair:
+        # Repair goes before the Innovation Theater fill: filler seats
+        # cannot be moved, so they take what repair leaves free
+        extended_best = extend_with_addons(
+            core_best, reps_df, sellers_opp_df, extended_best["seed"],
+            ordering=ordering, fill=False
+        )
+        repair_stats = repair_schedule(
+            problem, extended_best["state"], random.Random(extended_best["seed"])
+        )
+        print(
+            f"Repair booked {repair_stats['repaired']} of "
+            f"{repair_stats['attempted']} unfulfilled meetings"
+        )
+        fill_innovation_sessions_to_capacity(
+            problem, extended_best["state"], extended_best["rng"]
+        )
+
+    optimize_report = None
+
+    if optimize_iterations or optimize_time is not None:
+        optimize_report = optimize_schedule(
+            problem, extended_best["state"], random.Random(extended_best["seed"]),
+            iterations=optimize_iterations or None, time_budget=optimize_time
+        )
+        print(
+            f"Optimizer objective {optimize_report['initial']:.3f} -> "
+            f"{optimize_report['best']:.3f} after {optimize_report['iterations']} moves"
+        )
+
+    supplier_sched, rep_sched, summary = materialize_schedules(extended_best)
+
+    # Validation covers the core session kinds, as core_best["validation"]
+    # does, but after repair
+    state = extended_best["state"]
+    validation = state.validation(state.summary(kinds=CORE_KINDS))
+
+    outputs = (
+        supplier_sched,
+        rep_sched,
+        summary,
+        validation,
+        # core_best["phase1"]
+    )
 
-def count_unfulfilled(summary):
-    total = 0
-    suppliers = 0
+    if return_diagnostics:
+        diagnostics = {
+            "core": core_diagnostics,
+            "addon": addon_diagnostics
+        }
+        if search is not None:
+            diagnostics["search"] = search
+        if repair_stats is not None:
+            diagnostics["repair"] = repair_stats
+        if optimize_report is not None:
+            diagnostics["optimize"] = optimize_report
+        return outputs + (diagnostics,)
 
-    for s, v in summary.items():
-        n = len(v.get("unfulfilled", []))
-        if n > 0:
-            suppliers += 1
-            total += n
+    return outputs
 
-    return total, suppliers
 
-def run_scheduler(preferences, reps_df, sellers_opp_df, core_seeds=10, addon_seeds=10):
+def _search_sequential(
+    preferences, reps_df, sellers_opp_df, core_seeds, addon_seeds, problem, ordering, pool=None
+):
     core_best = None
     core_diagnostics = []
 
@@ -893,83 +971,180 @@ def run_scheduler(preferences, reps_df, sellers_opp_df, core_seeds=10, addon_see
         print(f"Running core scheduler seed {seed}")
 
         result = build_phase3_core_scheduler(
-            preferences, reps_df, sellers_opp_df, seed
+            preferences, reps_df, sellers_opp_df, seed,
+            problem=problem, ordering=ordering, pool=pool
         )
+        core_diagnostics.append(_core_diagnostics(seed, result))
 
-        total_un = result["validation"]["total_unfulfilled"]
-        num_suppliers_un = len(result["validation"]["unfulfilled_detail"])
-
-        core_diagnostics.append({
-            "seed": seed,
-            "total_unfulfilled": total_un,
-            "num_suppliers_unfulfilled": num_suppliers_un
-        })
-
-        if core_best is None:
-            core_best = result
-            continue
-
-        prev_un = core_best["validation"]["total_unfulfilled"]
-        prev_sup = len(core_best["validation"]["unfulfilled_detail"])
-
-        if (total_un < prev_un) or (
-            total_un == prev_un and num_suppliers_un < prev_sup
-        ):
+        if _select_best(core_diagnostics, _core_key)["seed"] == seed:
             core_best = result
 
     print(f"Selected best core seed {core_best['seed']}")
 
     # Phase B: Extension seed search
     extended_best = None
+    addon_diagnostics = []
 
     for seed in range(addon_seeds):
         print(f"Running extension seed {seed}")
 
         extended = extend_with_addons(
-            core_best, reps_df, sellers_opp_df, seed
+            core_best, reps_df, sellers_opp_df, seed, ordering=ordering, pool=pool
         )
+        addon_diagnostics.append(_addon_diagnostics(seed, extended))
 
-        total_un, suppliers_un = count_unfulfilled(extended["summary"])
-
-        if extended_best is None:
-            extended_best = extended
-            best_un = total_un
-            best_sup = suppliers_un
-            best_var = extended["rep_sched"]["rep"].value_counts().std()
-            continue
-
-        # Primary: fewer unfulfilled
-        if total_un < best_un:
+        if _select_best(addon_diagnostics, _addon_key)["seed"] == seed:
             extended_best = extended
-            best_un = total_un
-            best_sup = suppliers_un
-            best_var = extended["rep_sched"]["rep"].value_counts().std()
-            continue
 
-        # Secondary: fewer suppliers impacted
-        if total_un == best_un and suppliers_un < best_sup:
-            extended_best = extended
-            best_sup = suppliers_un
-            best_var = extended["rep_sched"]["rep"].value_counts().std()
-            continue
+    return core_best, core_diagnostics, extended_best, addon_diagnostics
 
-        # Optional tertiary: smoother rep load
-        if total_un == best_un and suppliers_un == best_sup:
-            rep_var = extended["rep_sched"]["rep"].value_counts().std()
-            if rep_var < best_var:
-                extended_best = extended
-                best_var = rep_var
 
-    print(
-        f"Selected best extension seed {extended_best['seed']} "
-        f"(unfulfilled={best_un}, suppliers={best_sup})"
+def _search_parallel(
+    preferences, reps_df, sellers_opp_df, core_seeds, addon_seeds, workers, problem, ordering
+):
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_seed_worker,
+        initargs=(preferences, reps_df, sellers_opp_df, problem, ordering)
+    ) as pool:
+
+        # Phase A: Core seed search
+        print(f"Running {core_seeds} core scheduler seeds in parallel")
+        core_diagnostics = list(pool.map(_run_core_seed, range(core_seeds)))
+        core_seed = _select_best(core_diagnostics, _core_key)["seed"]
+
+        print(f"Selected best core seed {core_seed}")
+
+        # Phase B: Extension seed search
+        print(f"Running {addon_seeds} extension seeds in parallel")
+        addon_diagnostics = list(pool.map(
+            _run_addon_seed,
+            [core_seed] * addon_seeds,
+            range(addon_seeds)
+        ))
+        addon_seed = _select_best(addon_diagnostics, _addon_key)["seed"]
+
+    # Rebuild the winners locally (seeded, so identical to the worker runs)
+    core_best = build_phase3_core_scheduler(
+        preferences, reps_df, sellers_opp_df, core_seed,
+        problem=problem, ordering=ordering
     )
-
-    return (
-        extended_best["supplier_sched"],
-        extended_best["rep_sched"],
-        extended_best["summary"],
-        core_best["validation"],
-        # core_best["phase1"]
+    extended_best = extend_with_addons(
+        core_best, reps_df, sellers_opp_df, addon_seed, ordering=ordering
     )
 
+    return core_best, core_diagnostics, extended_best, addon_diagnostics
+
+
+# Session kinds scheduled by the core phase (reported in validation)
+CORE_KINDS = ("strategy", "planning")
+
+
+# Share of an anytime time_budget spent on core seeds
+ANYTIME_CORE_SHARE = 0.5
+
+
+def _search_anytime(
+    preferences, reps_df, sellers_opp_df, time_budget, workers, problem, ordering
+):
+    start = time.monotonic()
+    core_deadline = start + time_budget * ANYTIME_CORE_SHARE
+    deadline = start + time_budget
+
+    def run_phase(run_batch, batch_size, key, is_optimal, phase_deadline):
+        diagnostics = []
+        seed = 0
+
+        while True:
+            diagnostics += run_batch(range(seed, seed + batch_size))
+            seed += batch_size
+
+            best = _select_best(diagnostics, key)
+            if is_optimal(best):
+                return best, diagnostics, "optimal"
+            if time.monotonic() >= phase_deadline:
+                return best, diagnostics, "deadline"
+
+    with ExitStack() as stack:
+        if workers == 1:
+            pool = None
+            batch_size = 1
+        else:
+            pool = stack.enter_context(ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_seed_worker,
+                initargs=(preferences, reps_df, sellers_opp_df, problem, ordering)
+            ))
+            batch_size = workers or os.cpu_count() or 1
+
+        # In process, each phase keeps its best result so far. Pool
+        # workers only send diagnostics back, so their winners are
+        # rebuilt here (seeded, so identical to the worker runs).
+        kept = {}
+
+        def keep(phase, key, d, result):
+            held = kept.get(phase)
+            if held is None or _select_best([held[0], d], key) is d:
+                kept[phase] = (d, result)
+            return d
+
+        # Phase A: Core seed search
+        def run_core(seeds):
+            if pool is not None:
+                return list(pool.map(_run_core_seed, seeds))
+            diagnostics = []
+            for seed in seeds:
+                result = build_phase3_core_scheduler(
+                    preferences, reps_df, sellers_opp_df, seed, problem=problem, ordering=ordering
+                )
+                diagnostics.append(keep("core", _core_key, _core_diagnostics(seed, result), result))
+            return diagnostics
+
+        print(f"Running core scheduler seeds for up to {time_budget * ANYTIME_CORE_SHARE:.1f}s")
+        core, core_diagnostics, core_stop = run_phase(
+            run_core, batch_size, _core_key, _core_is_optimal, core_deadline
+        )
+        print(f"Selected best core seed {core['seed']} of {len(core_diagnostics)}")
+
+        if "core" in kept:
+            core_best = kept["core"][1]
+        else:
+            core_best = build_phase3_core_scheduler(
+                preferences, reps_df, sellers_opp_df, core["seed"],
+                problem=problem, ordering=ordering
+            )
+
+        # Phase B: Extension seed search, with whatever time is left
+        def run_addon(seeds):
+            if pool is not None:
+                return list(pool.map(_run_addon_seed, [core["seed"]] * len(seeds), seeds))
+            diagnostics = []
+            for seed in seeds:
+                extended = extend_with_addons(
+                    core_best, reps_df, sellers_opp_df, seed, ordering=ordering
+                )
+                diagnostics.append(
+                    keep("addon", _addon_key, _addon_diagnostics(seed, extended), extended)
+                )
+            return diagnostics
+
+        print(f"Running extension seeds for up to {max(0.0, deadline - time.monotonic()):.1f}s")
+        addon, addon_diagnostics, addon_stop = run_phase(
+            run_addon, batch_size, _addon_key, _addon_is_optimal, deadline
+        )
+
+    if "addon" in kept:
+        extended_best = kept["addon"][1]
+    else:
+        extended_best = extend_with_addons(
+            core_best, reps_df, sellers_opp_df, addon["seed"], ordering=ordering
+        )
+
+    search = {
+        "time_budget": time_budget,
+        "elapsed": time.monotonic() - start,
+        "core_stop": core_stop,
+        "addon_stop": addon_stop
+    }
+
+    return core_best, core_diagnostics, extended_best, addon_diagnostics, search
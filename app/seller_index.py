@@ -0,0 +1,57 @@
+from collections import namedtuple
+import numpy as np
+
+
+RankedSellers = namedtuple("RankedSellers", ["ids", "opportunity"])
+
+_EMPTY = RankedSellers(np.empty(0, dtype=np.int64), np.empty(0, dtype=float))
+
+
+class SellerIndex:
+    """
+    Sellers pre-ranked by opportunity for every district and every
+    (district, product_line) pair in sellers_opp_df.
+
+    Built once per input; lookups return de-duplicated seller id arrays
+    (highest opportunity first) and never touch pandas again.
+    """
+
+    def __init__(self, sellers_opp_df):
+        df = sellers_opp_df[["district", "name", "product_line", "opportunity"]].dropna(
+            subset=["name"]
+        )
+        df = df.assign(district=df["district"].astype(str).str.upper())
+
+        # Stable sort so equal opportunities keep workbook order
+        df = df.sort_values("opportunity", ascending=False, kind="mergesort")
+
+        self.names = list(dict.fromkeys(df["name"].tolist()))
+        self.ids = {n: i for i, n in enumerate(self.names)}
+
+        self._ranked = {}
+
+        for district, grp in df.groupby("district", sort=False):
+            self._ranked[(district, None)] = self._rank(grp)
+
+        for (district, pl), grp in df.groupby(["district", "product_line"], sort=False):
+            self._ranked[(district, pl)] = self._rank(grp)
+
+    def _rank(self, grp):
+        # First occurrence of a name is its highest-opportunity row
+        grp = grp.drop_duplicates(subset=["name"], keep="first")
+        return RankedSellers(
+            np.array([self.ids[n] for n in grp["name"]], dtype=np.int64),
+            grp["opportunity"].to_numpy(dtype=float)
+        )
+
+    def lookup(self, district, product_line=None):
+        """Ranked seller ids + opportunity scores for a seller spot."""
+        key = (
+            district.upper().strip(),
+            product_line.upper().strip() if product_line else None
+        )
+        return self._ranked.get(key, _EMPTY)
+
+
+def build_seller_index(sellers_opp_df):
+    return SellerIndex(sellers_opp_df)
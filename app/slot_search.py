@@ -0,0 +1,83 @@
+from itertools import combinations
+import numpy as np
+
+
+# =====================================================================
+# Mask-based slot / seller search
+#
+# Masks are boolean vectors over TimeGrid slot ids (True = usable).
+# Search routines intersect masks instead of probing slot by slot.
+# =====================================================================
+
+def first_free(order, free):
+    """
+    First slot of `order` (slot ids, e.g. shuffled) that is set in free,
+    or None. With a shuffled order this is a uniform pick over free.
+    """
+    order = np.asarray(order, dtype=np.int64)
+    hits = order[free[order]]
+    return int(hits[0]) if len(hits) else None
+
+
+def find_seller_group(base, seller_free, seats):
+    """
+    Best-ranked group of `seats` sellers sharing at least one slot.
+
+    base:        slot mask every attendee must fit (supplier, fixed reps,
+                 bookable slots)
+    seller_free: (sellers x slots) free matrix, sellers in rank order
+    seats:       number of sellers to pick
+
+    Groups are considered in itertools.combinations() order over the
+    ranked sellers. Returns (seller positions, common slot mask) or None.
+    """
+    if seats == 0:
+        return ((), base) if base.any() else None
+
+    # Prune sellers with no overlap with the supplier / fixed reps
+    masks = seller_free & base
+    alive = np.flatnonzero(masks.any(axis=1))
+
+    if len(alive) < seats:
+        return None
+
+    masks = masks[alive]
+
+    if seats == 1:
+        return (int(alive[0]),), masks[0]
+
+    if seats == 2:
+        # overlap[i, j] > 0 <=> sellers i and j share a free slot;
+        # row-major order over the upper triangle is combinations() order
+        as_int = masks.astype(np.int32)
+        overlap = np.triu(as_int @ as_int.T, k=1)
+        hits = np.flatnonzero(overlap)
+
+        if not len(hits):
+            return None
+
+        i, j = divmod(int(hits[0]), len(alive))
+        return (int(alive[i]), int(alive[j])), masks[i] & masks[j]
+
+    for group in combinations(range(len(alive)), seats):
+        common = np.logical_and.reduce(masks[list(group)])
+        if common.any():
+            return tuple(int(alive[g]) for g in group), common
+
+    return None
+
+
+def window_starts(free, length, starts):
+    """
+    Mask of window starts s where free[..., s:s + length] is all True.
+
+    starts is the grid's static mask of valid starts (TimeGrid.start_mask:
+    windows stay inside one day and skip lunch). free is a slot mask or a
+    (rows x slots) matrix; each extra slot is one shifted AND.
+    """
+    ok = free & starts
+
+    for k in range(1, length):
+        ok[..., :-k] &= free[..., k:]
+
+    return ok
@@ -0,0 +1,151 @@
+import io
+import json
+import zipfile
+import numpy as np
+import pandas as pd
+from app.cache import json_default
+
+
+# =====================================================================
+#   Binary snapshot of parsed inputs + schedule outputs
+#
+#   A zip archive (no pickle) holding:
+#     manifest.json         format/version, frame layouts, dict outputs
+#     <frame>/<col>.npy     numeric / bool / datetime columns
+#   Object and string columns are stored as JSON lists in the manifest,
+#   so list cells (e.g. supplier_sched["reps"]) round-trip exactly.
+# =====================================================================
+SNAPSHOT_FORMAT = "sgf-snapshot"
+SNAPSHOT_VERSION = 1
+
+FRAMES = ["suppliers_df", "reps_df", "sellers_opp_df", "supplier_sched", "rep_sched"]
+OBJECTS = ["preferences", "supplier_summary", "validation"]
+
+
+def _is_npy_column(col):
+    return isinstance(col.dtype, np.dtype) and col.dtype.kind in "biufcmM"
+
+
+def _write_frame(zf, name, df):
+    layout = {"columns": []}
+
+    if isinstance(df.index, pd.RangeIndex):
+        layout["index"] = {
+            "start": df.index.start, "stop": df.index.stop, "step": df.index.step
+        }
+    else:
+        layout["index"] = {"values": df.index.tolist()}
+
+    for i, (col_name, col) in enumerate(df.items()):
+        entry = {"name": col_name, "dtype": str(col.dtype)}
+
+        if _is_npy_column(col):
+            buf = io.BytesIO()
+            np.save(buf, col.to_numpy(), allow_pickle=False)
+            entry["file"] = f"{name}/{i}.npy"
+            zf.writestr(entry["file"], buf.getvalue())
+        else:
+            entry["values"] = [None if v is pd.NA else v for v in col.tolist()]
+
+        layout["columns"].append(entry)
+
+    return layout
+
+
+def _read_frame(zf, layout):
+    idx = layout["index"]
+    if "values" in idx:
+        index = pd.Index(idx["values"])
+    else:
+        index = pd.RangeIndex(idx["start"], idx["stop"], idx["step"])
+
+    data = {}
+    for entry in layout["columns"]:
+        if "file" in entry:
+            values = np.load(io.BytesIO(zf.read(entry["file"])), allow_pickle=False)
+            data[entry["name"]] = pd.Series(values, index=index)
+        elif entry["dtype"] == "object":
+            values = np.empty(len(entry["values"]), dtype=object)
+            values[:] = entry["values"]
+            data[entry["name"]] = pd.Series(values, index=index, dtype=object)
+        else:
+            data[entry["name"]] = pd.Series(entry["values"], index=index, dtype=entry["dtype"])
+
+    return pd.DataFrame(data, index=index)
+
+
+def save_snapshot(
+    file,
+    suppliers_df,
+    reps_df,
+    preferences,
+    sellers_opp_df,
+    supplier_sched,
+    rep_sched,
+    supplier_summary,
+    validation
+):
+    """
+    Write a snapshot to a path or binary file object.
+    """
+    frames = {
+        "suppliers_df": suppliers_df,
+        "reps_df": reps_df,
+        "sellers_opp_df": sellers_opp_df,
+        "supplier_sched": supplier_sched,
+        "rep_sched": rep_sched
+    }
+    objects = {
+        "preferences": preferences,
+        "supplier_summary": supplier_summary,
+        "validation": validation
+    }
+
+    with zipfile.ZipFile(file, "w", compression=zipfile.ZIP_STORED) as zf:
+        manifest = {
+            "format": SNAPSHOT_FORMAT,
+            "version": SNAPSHOT_VERSION,
+            "frames": {name: _write_frame(zf, name, df) for name, df in frames.items()},
+            "objects": objects
+        }
+        zf.writestr("manifest.json", json.dumps(manifest, default=json_default))
+
+
+def snapshot_bytes(**kwargs):
+    buf = io.BytesIO()
+    save_snapshot(buf, **kwargs)
+    return buf.getvalue()
+
+
+def load_snapshot(file):
+    """
+    Read a snapshot written by save_snapshot.
+
+    Returns a dict with the parsed inputs (suppliers_df, reps_df,
+    preferences, sellers_opp_df) and the schedule outputs
+    (supplier_sched, rep_sched, supplier_summary, validation).
+    """
+    try:
+        zf = zipfile.ZipFile(file)
+    except zipfile.BadZipFile:
+        raise ValueError("Uploaded file is not a schedule snapshot.")
+
+    with zf:
+        try:
+            manifest = json.loads(zf.read("manifest.json"))
+        except KeyError:
+            raise ValueError("Uploaded file is not a schedule snapshot.")
+
+        if manifest.get("format") != SNAPSHOT_FORMAT:
+            raise ValueError("Uploaded file is not a schedule snapshot.")
+
+        if manifest.get("version") != SNAPSHOT_VERSION:
+            raise ValueError(
+                f"Unsupported snapshot version {manifest.get('version')} "
+                f"(expected {SNAPSHOT_VERSION})."
+            )
+
+        out = {name: _read_frame(zf, manifest["frames"][name]) for name in FRAMES}
+
+    out.update({name: manifest["objects"][name] for name in OBJECTS})
+    return out
@@ -0,0 +1,200 @@
+import numpy as np
+from app.availability import Availability
+from app.booking_log import BookingLog, MEETING, INNOVATION
+from app.overlay import Overlay
+from app.feasibility import impossible_report
+
+
+class ScheduleState:
+    """
+    Everything one seed changes: supplier / rep availability, the booking
+    log, per-meeting outcomes and Innovation Theater attendance.
+
+    fork() branches a new state from this one in O(changes): availability
+    is copy-on-write per row, the log and the outcome journal share this
+    state's entries as a prefix, and counters are copied. Once forked, a
+    state is read-only.
+    """
+
+    def __init__(self, problem):
+        n_slots = problem.grid.n_slots
+
+        self.problem = problem
+        self.supplier_busy = Availability(len(problem.suppliers), n_slots)
+        self.rep_busy = Availability(len(problem.reps), n_slots)
+        self.log = BookingLog()
+        self.innovation_count = np.zeros(len(problem.innovation_sessions), dtype=np.int64)
+        self._placement = Overlay()               # meeting id -> (log entry, reps, slots) or None
+
+        # Outcome journal: (meeting id, booked) in recording order
+        self._events = []
+        self._events_parent = None
+        self._events_base = 0                     # parent's journal length
+        self._events_len = 0
+        self._latest = Overlay()                  # meeting id -> (event #, booked)
+        self._unfulfilled_by_supplier = Overlay() # supplier id -> count
+        self.n_unfulfilled = 0
+        self.n_suppliers_unfulfilled = 0
+
+        for s, slot in problem.supplier_blocks:
+            self.supplier_busy.book([s], [slot])
+
+        # Meetings no seed can book are unfulfilled from the start
+        for meeting_id in problem.impossible:
+            self.record(problem.meetings[meeting_id], False)
+
+    @classmethod
+    def from_busy(cls, problem, supplier_busy, rep_busy):
+        """
+        Fresh state with the given busy matrices (see busy_matrices) and
+        nothing in its log, e.g. to continue a state in another process.
+        """
+        state = cls(problem)
+        state.supplier_busy.busy[:] = supplier_busy
+        state.rep_busy.busy[:] = rep_busy
+        return state
+
+    def busy_matrices(self):
+        """(supplier, rep) busy matrices as plain arrays."""
+        return (
+            ~self.supplier_busy.free_matrix(range(len(self.problem.suppliers))),
+            ~self.rep_busy.free_matrix(range(len(self.problem.reps)))
+        )
+
+    def fork(self):
+        child = ScheduleState.__new__(ScheduleState)
+        child.problem = self.problem
+        child.supplier_busy = self.supplier_busy.fork()
+        child.rep_busy = self.rep_busy.fork()
+        child.log = self.log.fork()
+        child.innovation_count = self.innovation_count.copy()
+        child._placement = self._placement.fork()
+
+        child._events = []
+        child._events_parent = self
+        child._events_base = self._events_len
+        child._events_len = self._events_len
+        child._latest = self._latest.fork()
+        child._unfulfilled_by_supplier = self._unfulfilled_by_supplier.fork()
+        child.n_unfulfilled = self.n_unfulfilled
+        child.n_suppliers_unfulfilled = self.n_suppliers_unfulfilled
+        return child
+
+    # -----------------------------------------------------------------
+    # Bookings
+    # -----------------------------------------------------------------
+    def book_meeting(self, m, reps, slots):
+        self.supplier_busy.book([m.supplier], slots)
+        self.rep_busy.book(reps, slots)
+        entry = self.log.add(MEETING, m.id, slots, reps)
+        self._placement[m.id] = (entry, list(reps), list(slots))
+
+    def cancel_meeting(self, m):
+        """Undo book_meeting for m; returns its (reps, slots)."""
+        entry, reps, slots = self._placement.get(m.id)
+        self.supplier_busy.release([m.supplier], slots)
+        self.rep_busy.release(reps, slots)
+        self.log.cancel(entry)
+        self._placement[m.id] = None
+        return reps, slots
+
+    def placement(self, meeting_id):
+        """(reps, slots) of a booked meeting, else None."""
+        placed = self._placement.get(meeting_id)
+        return None if placed is None else placed[1:]
+
+    def placements(self):
+        """Yield (meeting id, reps, slots) for every booked meeting."""
+        for meeting_id, placed in self._placement.items():
+            if placed is not None:
+                yield meeting_id, placed[1], placed[2]
+
+    def book_innovation(self, session, rep):
+        self.rep_busy.book([rep], session["slot_ids"])
+        self.log.add(INNOVATION, session["index"], session["slot_ids"], [rep])
+        self.innovation_count[session["index"]] += 1
+
+    # -----------------------------------------------------------------
+    # Outcomes
+    # -----------------------------------------------------------------
+    def record(self, m, booked):
+        prev = self._latest.get(m.id)
+        was_unfulfilled = prev is not None and not prev[1]
+
+        self._latest[m.id] = (self._events_len, booked)
+        self._events.append((m.id, booked))
+        self._events_len += 1
+
+        if was_unfulfilled != (not booked):
+            self._adjust_unfulfilled(m.supplier, -1 if was_unfulfilled else 1)
+
+    def _adjust_unfulfilled(self, supplier, delta):
+        before = self._unfulfilled_by_supplier.get(supplier, 0)
+        after = before + delta
+        self._unfulfilled_by_supplier[supplier] = after
+        self.n_unfulfilled += delta
+
+        if before == 0 and after > 0:
+            self.n_suppliers_unfulfilled += 1
+        elif before > 0 and after == 0:
+            self.n_suppliers_unfulfilled -= 1
+
+    def outcome(self, meeting_id):
+        """True / False once recorded (booked or not), else None."""
+        latest = self._latest.get(meeting_id)
+        return None if latest is None else latest[1]
+
+    def new_events(self):
+        """(meeting id, booked) recorded by this state itself (not inherited)."""
+        return list(self._events)
+
+    def events(self, limit=None):
+        """Yield (meeting id, booked) in recording order."""
+        limit = self._events_len if limit is None else limit
+        base = self._events_base
+
+        if self._events_parent is not None:
+            yield from self._events_parent.events(min(limit, base))
+
+        yield from self._events[:max(0, limit - base)]
+
+    def summary(self, kinds=None):
+        """
+        Per-supplier summary in the run_scheduler output format; a meeting
+        recorded more than once is listed by its latest outcome. kinds
+        limits fulfilled / unfulfilled to those session kinds.
+        """
+        problem = self.problem
+
+        sup_summary = {
+            s: {
+                "requested": [m["request_name"] for m in meetings],
+                "fulfilled": [],
+                "unfulfilled": [],
+                "unfulfilled_power_pairings": []
+            }
+            for s, meetings in problem.phase1.items()
+        }
+
+        for i, (meeting_id, booked) in enumerate(self.events()):
+            if self._latest.get(meeting_id)[0] != i:
+                continue
+            m = problem.meetings[meeting_id]
+            if kinds is not None and m.kind not in kinds:
+                continue
+            key = "fulfilled" if booked else "unfulfilled"
+            sup_summary[problem.suppliers[m.supplier]][key].append(m.request_name)
+
+        return sup_summary
+
+    def validation(self, sup_summary=None):
+        sup_summary = self.summary() if sup_summary is None else sup_summary
+        return {
+            "total_unfulfilled": sum(len(v["unfulfilled"]) for v in sup_summary.values()),
+            "unfulfilled_detail": {
+                s: v["unfulfilled"]
+                for s, v in sup_summary.items()
+                if v["unfulfilled"]
+            },
+            "impossible": impossible_report(self.problem)
+        }
@@ -57,6 +57,12 @@ blocks = {
 }
 
 
+# Hard constraint: no Power Pairings in these slots
+power_pairing_blocked = {
+    "Tuesday, February 24th": ["11:00 AM", "11:30 AM"]
+}
+
+
 act_session_times = {
     "Norton": "9:00 AM",
     "Kimberly-Clark": "9:45 AM",
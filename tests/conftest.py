@@ -0,0 +1,142 @@
+import os
+import random
+import sys
+import numpy as np
+import pandas as pd
+import pytest
+
+# Tests import the app package from the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.booking_log import MEETING  # noqa: E402
+from app.parsers import parse_meeting_organizer  # noqa: E402
+
+# Suppliers with Innovation Theater blocks (app.utils.blocks)
+BLOCKED_SUPPLIERS = [
+    "Norton", "Kimberly-Clark", "Apex Tool Group", "Kennametal", "Parker Hannifin", "3M",
+    "Sandvik Coromant", "Milwaukee", "OSG", "Ansell", "Mitutoyo", "Master Fluid Solutions"
+]
+PRODUCT_LINES = ["CUTTING TOOLS", "SAFETY", "ABRASIVES", "MRO"]
+
+
+def write_organizer(path, n_suppliers=18, regions="KSE", seed=1):
+    """
+    Small synthetic Meeting Organizer workbook. Suppliers only request
+    reps of one region, so each region is an independent component.
+    """
+    rng = random.Random(seed)
+    districts = [f"{r}{a}-{b}" for r in regions for a in range(1, 3) for b in range(1, 3)]
+
+    reps, sellers = [], []
+    for d in districts:
+        reps.append({
+            "Name": f"Leader {d}", "Leader Name": "", "Leader?": "Y", "Segment": "Core",
+            "Region": "R", "District": d, "Email": f"lead{d}@x.com",
+            "Role": "District Leader", "Weight": 1, "Seller": "N"
+        })
+        for k in range(rng.randint(3, 6)):
+            name = f"Seller {d} {k}"
+            reps.append({
+                "Name": name, "Leader Name": f"Leader {d}", "Leader?": "N", "Segment": "Core",
+                "Region": "R", "District": d, "Email": f"s{d}{k}@x.com",
+                "Role": "Seller", "Weight": 1, "Seller": "Y"
+            })
+            for pl in rng.sample(PRODUCT_LINES, 2):
+                sellers.append({
+                    "District": d, "Name": name, "Product Line": pl.title(),
+                    "Opportunity": f"${rng.randint(1000, 900000):,}"
+                })
+
+    suppliers = BLOCKED_SUPPLIERS + [f"Supplier {i}" for i in range(n_suppliers - len(BLOCKED_SUPPLIERS))]
+    rows = []
+    for i, supplier in enumerate(suppliers):
+        kind = rng.choice(["Peak", "Accelerating", "Rising"])
+        region = regions[i % len(regions)]
+        local = [d for d in districts if d[0] == region]
+
+        for m in range(1, {"Peak": 10, "Accelerating": 12, "Rising": 12}[kind] + 1):
+            if kind == "Rising":
+                session = "Power Pairing"
+            else:
+                session = "Strategy" if m <= (4 if kind == "Peak" else 2) else "Planning"
+
+            if session == "Strategy" and rng.random() < 0.3:
+                names = [r["Name"] for r in reps if r["District"][0] == region]
+                request = ", ".join(rng.sample(names, 2))
+            else:
+                request = rng.choice(local)
+
+            rows.append({
+                "Supplier Name": supplier, "Supplier Type": kind, "Booth #": 100 + i,
+                "Meeting #": m, "Request Clean": request,
+                "pl1": rng.choice(PRODUCT_LINES + [None]),
+                "Penetration Clean": rng.randint(0, 500000),
+                "Acquisition Clean": rng.randint(0, 100000),
+                "Request Name": f"{supplier} {session} {m}", "Session Type": session
+            })
+
+    with pd.ExcelWriter(path) as writer:
+        pd.DataFrame(rows).to_excel(writer, sheet_name="Meeting Requests", index=False)
+        pd.DataFrame(reps).to_excel(writer, sheet_name="Sales Reps", index=False)
+        pd.DataFrame(sellers).to_excel(writer, sheet_name="Sales Rep District Oppty", index=False)
+
+
+def assert_valid_state(state):
+    """
+    Busy matrices, booking log, placements and outcomes of state agree,
+    no cell is booked twice and no Innovation session is over capacity.
+    """
+    problem = state.problem
+    supplier_busy, rep_busy = state.busy_matrices()
+    supplier_use = np.zeros(supplier_busy.shape, dtype=int)
+    rep_use = np.zeros(rep_busy.shape, dtype=int)
+    seated = np.zeros(len(problem.innovation_sessions), dtype=int)
+    booked = {}
+
+    for s, slot in problem.supplier_blocks:
+        supplier_use[s, slot] += 1
+
+    for kind, ref, slots, reps in state.log.bookings():
+        slots, reps = list(slots), list(reps)
+        if kind == MEETING:
+            booked[ref] = (reps, slots)
+            supplier_use[problem.meetings[ref].supplier, slots] += 1
+        else:
+            seated[ref] += 1
+        rep_use[np.ix_(reps, slots)] += 1
+
+    assert supplier_use.max() <= 1
+    assert rep_use.max() <= 1
+    assert (supplier_busy == (supplier_use > 0)).all()
+    assert (rep_busy == (rep_use > 0)).all()
+
+    assert booked == {i: (list(reps), list(slots)) for i, reps, slots in state.placements()}
+    assert all(state.outcome(i) for i in booked)
+    assert state.n_unfulfilled == sum(state.outcome(m.id) is False for m in problem.meetings)
+
+    assert (seated == state.innovation_count).all()
+    assert all(seated[s["index"]] <= s["capacity"] for s in problem.innovation_sessions)
+
+
+@pytest.fixture
+def check_state():
+    return assert_valid_state
+
+
+@pytest.fixture(scope="session")
+def organizer(tmp_path_factory):
+    """(suppliers_df, reps_df, preferences, sellers_opp_df) of the synthetic workbook."""
+    path = tmp_path_factory.mktemp("organizer") / "organizer.xlsx"
+    write_organizer(path)
+    return parse_meeting_organizer(path)
+
+
+@pytest.fixture(scope="session")
+def contested_organizer(tmp_path_factory):
+    """
+    Denser workbook (30 suppliers over 2 regions): the greedy phases
+    leave bookable meetings unfulfilled, so repair has work to do.
+    """
+    path = tmp_path_factory.mktemp("contested") / "organizer.xlsx"
+    write_organizer(path, n_suppliers=30, regions="KS", seed=2)
+    return parse_meeting_organizer(path)
@@ -0,0 +1,35 @@
+import numpy as np
+import pytest
+from app.availability import Availability
+
+
+def test_fork_books_multi_slot_tuple():
+    parent = Availability(3, 10)
+    parent.book([0], [1])
+
+    child = parent.fork()
+    child.book([1], (2, 3))             # Strategy sessions book slot tuples
+
+    assert child.row(1)[[2, 3]].all()
+    assert child.row(0)[1]
+    assert not parent.row(1).any()      # parent untouched
+
+
+def test_fork_is_copy_on_write():
+    parent = Availability(2, 4)
+    child = parent.fork()
+    grandchild = child.fork()
+
+    grandchild.book([0, 1], (0, 1))
+
+    assert np.array_equal(grandchild.free_mask([0, 1]), [False, False, True, True])
+    assert child.free_mask([0, 1]).all()
+    assert parent.free_mask([0, 1]).all()
+
+
+def test_forked_parent_is_frozen():
+    parent = Availability(1, 2)
+    parent.fork()
+
+    with pytest.raises(RuntimeError):
+        parent.book([0], (0,))
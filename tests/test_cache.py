@@ -0,0 +1,57 @@
+import sys
+import threading
+import pandas as pd
+from app.cache import LRUCache, fingerprint
+
+
+def test_fingerprint_is_content_based():
+    df = pd.DataFrame({"a": [1, 2], "b": ["x", "y"]})
+    assert fingerprint(df, {"k": 1}) == fingerprint(df.copy(), {"k": 1})
+    assert fingerprint(df) != fingerprint(df.rename(columns={"b": "c"}))
+
+
+def test_evicts_least_recently_used():
+    cache = LRUCache(max_entries=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+    cache.put("c", 3)
+
+    assert "a" in cache and "c" in cache
+    assert "b" not in cache
+
+
+def test_byte_bound():
+    cache = LRUCache(max_entries=None, max_bytes=9, size=len)
+    cache.put("a", "xxxx")
+    cache.put("b", "yyyy")
+    cache.put("a", "zzzzzz")        # replaces, then evicts b
+
+    assert cache.get("a") == "zzzzzz"
+    assert "b" not in cache
+    assert cache.nbytes == 6
+
+
+def test_shared_between_threads():
+    cache = LRUCache(max_entries=50, max_bytes=400, size=len)
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+
+    def work(t):
+        for i in range(2000):
+            key = (t * 7 + i) % 120
+            if cache.get(key) is None:
+                cache.put(key, "x" * (key % 13))
+
+    try:
+        threads = [threading.Thread(target=work, args=(t,)) for t in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+    finally:
+        sys.setswitchinterval(interval)
+
+    values = [v for v, _ in cache._data.values()]
+    assert len(values) <= 50
+    assert cache.nbytes == sum(map(len, values)) <= 400
@@ -0,0 +1,80 @@
+import random
+import pytest
+from app.components import find_components, merge_components, solve_component
+from app.scheduler import (
+    assign_minimum_innovation_sessions,
+    build_phase2_planning_sessions,
+    build_phase2_strategy_sessions,
+    prepare_problem,
+    run_scheduler
+)
+from app.state import ScheduleState
+
+PHASES = [build_phase2_strategy_sessions, build_phase2_planning_sessions]
+
+
+@pytest.fixture(scope="module")
+def problem(organizer):
+    _, reps_df, preferences, sellers = organizer
+    return prepare_problem(preferences, reps_df, sellers)
+
+
+def _schedule(state):
+    placements = sorted((i, list(reps), list(slots)) for i, reps, slots in state.placements())
+    outcomes = {m.id: state.outcome(m.id) for m in state.problem.meetings}
+    return placements, outcomes, state.n_unfulfilled, state.n_suppliers_unfulfilled
+
+
+def test_components_partition_meetings(problem):
+    components = find_components(problem)
+    assert len(components) == 3
+
+    ids = [i for ids in components for i in ids]
+    assert sorted(ids) == sorted(m.id for m in problem.meetings if m.id not in problem.impossible)
+
+    # No supplier or rep is shared between components
+    owner = {}
+    for c, ids in enumerate(components):
+        for i in ids:
+            m = problem.meetings[i]
+            for node in [("s", m.supplier)] + [("r", r) for r in m.fixed + m.candidates]:
+                assert owner.setdefault(node, c) == c
+
+
+@pytest.mark.parametrize("ordering", ["input", "constrained"])
+def test_merged_components_match_one_state(problem, check_state, ordering):
+    state = ScheduleState(problem)
+    assign_minimum_innovation_sessions(problem, state, random.Random(0))
+    components = find_components(problem)
+
+    results = [
+        solve_component(problem, state, ids, PHASES, random.Random(i), ordering)
+        for i, ids in enumerate(components)
+    ]
+    merged = merge_components(problem, state, results)
+
+    # The same components solved one after another on a single state
+    direct = state.fork()
+    for i, ids in enumerate(components):
+        sub = problem.restrict(ids)
+        rng = random.Random(i)
+        for phase in PHASES:
+            phase(sub, direct, rng, ordering)
+
+    assert _schedule(merged) == _schedule(direct)
+    check_state(merged)
+
+
+def test_decomposed_pool_matches_in_process(organizer):
+    _, reps_df, preferences, sellers = organizer
+
+    outputs = [
+        run_scheduler(preferences, reps_df, sellers, 2, 2, workers=workers, decompose=True)
+        for workers in (1, 2)
+    ]
+
+    (s1, r1, summary1, v1), (s2, r2, summary2, v2) = outputs
+    assert s1.equals(s2)
+    assert r1.equals(r2)
+    assert summary1 == summary2
+    assert v1 == v2
@@ -0,0 +1,83 @@
+import pandas as pd
+import pytest
+from app.feasibility import find_impossible, impossible_report
+from app.problem import compile_problem
+from app.seller_index import build_seller_index
+
+SELLERS = pd.DataFrame({
+    "district": ["K1", "K1", "K2"],
+    "name": ["Seller A", "Seller B", "Seller C"],
+    "product_line": ["MRO", "SAFETY", "MRO"],
+    "opportunity": [10.0, 30.0, 20.0]
+})
+REPS = pd.DataFrame({"Rep Name": ["Leader K1", "Seller A", "Seller B", "Seller C"]})
+
+
+def _problem(session, attendees, supplier="Acme"):
+    phase1 = {supplier: [{
+        "request_name": f"{supplier} 1", "session_type": session, "booth": 1,
+        "total_opportunity": 0.0, "requested_attendees": attendees
+    }]}
+    return compile_problem(phase1, REPS, build_seller_index(SELLERS), [], [])
+
+
+def _spot(district, count, product_line=None):
+    return {"type": "seller_spot", "district": district, "product_line": product_line, "count": count}
+
+
+@pytest.mark.parametrize("session, attendees, reasons", [
+    ("Planning", ["Seller A"], []),
+    ("Planning", [_spot("K1", 2)], []),
+    ("Strategy", ["Leader K1", _spot("K1", 1, "MRO")], []),
+    ("Power Pairing", ["Nobody"], ["not in Sales Reps: Nobody"]),
+    ("Strategy", ["Nobody", "Else", "Seller A"], ["not in Sales Reps: Nobody, Else"]),
+    ("Planning", [_spot("K1", 2, "MRO")], ["1 of 2 sellers available in K1 / MRO"]),
+    ("Planning", [_spot("K9", 1)], ["0 of 1 sellers available in K9"]),
+    # The named leader cannot also take the seller seat
+    ("Strategy", ["Seller C", _spot("K2", 1)], ["0 of 1 sellers available in K2"]),
+    (
+        "Planning", ["Nobody", _spot("K2", 2)],
+        ["not in Sales Reps: Nobody", "1 of 2 sellers available in K2"]
+    )
+])
+def test_find_impossible_reasons(session, attendees, reasons):
+    problem = _problem(session, attendees)
+    found = find_impossible(problem)
+
+    assert found.get(0, []) == reasons
+
+
+@pytest.mark.parametrize("session, blocked", [
+    ("Planning", "all"),
+    ("Strategy", "all"),
+    # Only single free slots left: no 2-slot Strategy window
+    ("Strategy", "odd"),
+])
+def test_supplier_without_open_slot(session, blocked):
+    problem = _problem(session, ["Seller A"])
+    grid = problem.grid
+    slots = range(grid.n_slots) if blocked == "all" else range(1, grid.n_slots, 2)
+    problem.supplier_blocks = [(0, s) for s in slots]
+
+    assert find_impossible(problem) == {0: ["supplier has no open time slot for this session"]}
+
+
+def test_planning_fits_between_single_blocks():
+    problem = _problem("Planning", ["Seller A"])
+    problem.supplier_blocks = [(0, s) for s in range(1, problem.grid.n_slots, 2)]
+
+    assert find_impossible(problem) == {}
+
+
+def test_report_groups_by_supplier():
+    problem = _problem("Power Pairing", ["Nobody"])
+    problem.exclude(find_impossible(problem))
+
+    assert impossible_report(problem) == {
+        "Acme": [{
+            "request_name": "Acme 1",
+            "session_type": "Power Pairing",
+            "reasons": ["not in Sales Reps: Nobody"]
+        }]
+    }
+    assert problem.meetings_of("power pairing") == []
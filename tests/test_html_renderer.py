@@ -0,0 +1,145 @@
+import io
+import os
+import zipfile
+from inspect import GEN_SUSPENDED, getgeneratorstate
+import pytest
+from app import html_renderer
+from app.html_renderer import (
+    build_combined_html,
+    combined_html_volumes,
+    export_combined_html,
+    iter_combined_html,
+    load_logo_base64,
+    render_all_rep_html,
+    render_all_supplier_html,
+    render_intro_page,
+    render_request_summary_table
+)
+from app.scheduler import run_scheduler
+
+LOGO = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "files", "logos.png")
+
+
+@pytest.fixture(scope="module")
+def schedule(organizer):
+    suppliers_df, reps_df, preferences, sellers = organizer
+    supplier_sched, rep_sched, summary, _ = run_scheduler(preferences, reps_df, sellers, 1, 1)
+    return suppliers_df, reps_df, supplier_sched, rep_sched, summary
+
+
+def _render(schedule):
+    suppliers_df, reps_df, supplier_sched, rep_sched, _ = schedule
+    reps = sorted(rep_sched["rep"].unique())
+    return (
+        render_all_supplier_html(suppliers_df, supplier_sched, reps_df),
+        render_all_rep_html(reps, rep_sched, suppliers_df, reps_df)
+    )
+
+
+def test_in_process_render_ignores_worker_state(schedule, monkeypatch):
+    expected = _render(schedule)
+
+    # Maps left behind by another render must neither be used nor replaced
+    stale = {"roles": {}, "emails": {}, "booths": {}}
+    monkeypatch.setattr(html_renderer, "_RENDER_STATE", dict(stale))
+
+    assert _render(schedule) == expected
+    assert html_renderer._RENDER_STATE == stale
+
+
+def test_request_summary_rows():
+    summary = {
+        "requested": ["Acme 1", "Acme 2", "Acme 3"],
+        "fulfilled": ["Acme 1", "Acme 3"],
+        "substitutions": {"Acme 1": ["Seller {A}", "Seller B"]},
+        "req_types": {"Acme 2": "District", "Acme 3": "District"}
+    }
+    html = render_request_summary_table(summary)
+
+    assert html.count("<style>") == 1
+    assert html.count("<tr style=") == 3
+    # Named requests lose a point per unavailable rep, district spots are all or nothing
+    assert ">Acme 1</td>" in html and "<span style='color:#C63434;'>Seller {A}</span>, " in html
+    scores = [row.split("text-align:center; width:15%;\">")[1][0] for row in html.split("<tr style=")[1:]]
+    assert scores == ["3", "0", "5"]
+    assert "#F7F7F7" in html.split("<tr style=")[2]
+
+
+@pytest.fixture(scope="module")
+def supplier_bodies(schedule):
+    suppliers_df, reps_df, supplier_sched, _, _ = schedule
+    names = suppliers_df["Supplier"].tolist()
+    return names, render_all_supplier_html(suppliers_df, supplier_sched, reps_df, bodies=True)
+
+
+def test_chunks_join_to_combined_document(supplier_bodies):
+    names, bodies = supplier_bodies
+    document = build_combined_html(bodies, LOGO, supplier_names=names)
+
+    assert "".join(iter_combined_html(bodies, LOGO, supplier_names=names)) == document
+    assert "".join(iter_combined_html(bodies, LOGO, mode="Rep")) == build_combined_html(
+        bodies, LOGO, mode="Rep"
+    )
+
+
+def test_volumes_split_pages(supplier_bodies):
+    names, bodies = supplier_bodies
+    intro = render_intro_page(load_logo_base64(LOGO))
+
+    volumes = ["".join(v) for v in combined_html_volumes(bodies, 5, LOGO, supplier_names=names)]
+    assert len(volumes) == -(-len(bodies) // 5)
+
+    # TOC opens the first volume, Logic & Assumptions closes the last
+    assert ["Table of Contents" in v for v in volumes] == [True] + [False] * (len(volumes) - 1)
+    assert [intro in v for v in volumes] == [False] * (len(volumes) - 1) + [True]
+
+    for k, volume in enumerate(volumes):
+        for body in bodies[k * 5:(k + 1) * 5]:
+            assert f"<div>{body}</div>" in volume
+
+    single = list(combined_html_volumes(bodies, None, LOGO, supplier_names=names))
+    assert len(single) == 1
+    assert "".join(single[0]) == build_combined_html(bodies, LOGO, supplier_names=names)
+
+
+def test_export_single_volume_is_html(supplier_bodies):
+    names, bodies = supplier_bodies
+
+    file_name, data, mime = export_combined_html(
+        combined_html_volumes(bodies, None, LOGO, supplier_names=names), "Suppliers"
+    )
+
+    assert (file_name, mime) == ("Suppliers.html", "text/html")
+    assert data.decode("utf-8") == build_combined_html(bodies, LOGO, supplier_names=names)
+
+
+def test_export_volumes_as_zip(supplier_bodies):
+    names, bodies = supplier_bodies
+    volumes = ["".join(v) for v in combined_html_volumes(bodies, 5, LOGO, supplier_names=names)]
+
+    file_name, data, mime = export_combined_html(
+        combined_html_volumes(bodies, 5, LOGO, supplier_names=names), "Suppliers"
+    )
+    assert (file_name, mime) == ("Suppliers.zip", "application/zip")
+
+    with zipfile.ZipFile(io.BytesIO(data)) as archive:
+        assert archive.namelist() == [
+            f"Suppliers - Volume {k}.html" for k in range(1, len(volumes) + 1)
+        ]
+        assert [archive.read(n).decode("utf-8") for n in archive.namelist()] == volumes
+
+
+def test_export_writes_one_volume_at_a_time(supplier_bodies):
+    names, bodies = supplier_bodies
+    produced = []
+
+    def volumes():
+        for chunks in combined_html_volumes(bodies, 5, LOGO, supplier_names=names):
+            # Earlier volumes are either written out or not started yet
+            assert GEN_SUSPENDED not in [getgeneratorstate(v) for v in produced]
+            produced.append(chunks)
+            yield chunks
+
+    export_combined_html(volumes(), "Suppliers")
+
+    assert len(produced) == -(-len(bodies) // 5) > 2
@@ -0,0 +1,65 @@
+import random
+from collections import Counter
+from app.booking_log import INNOVATION
+from app.flow import FlowNetwork
+from app.scheduler import (
+    assign_minimum_innovation_sessions,
+    fill_innovation_sessions_to_capacity,
+    prepare_problem
+)
+from app.state import ScheduleState
+
+
+def test_max_flow_small_graph():
+    # s=0, t=5
+    net = FlowNetwork(6)
+    for u, v, cap in [
+        (0, 1, 16), (0, 2, 13), (1, 3, 12), (2, 1, 4), (2, 4, 14),
+        (3, 2, 9), (3, 5, 20), (4, 3, 7), (4, 5, 4)
+    ]:
+        net.add_edge(u, v, cap)
+
+    assert net.max_flow(0, 5) == 23
+    assert net.max_flow(0, 5) == 0      # already maximal
+
+
+def test_max_flow_augments_after_raising_capacity():
+    net = FlowNetwork(3)
+    first = net.add_edge(0, 1, 1)
+    second = net.add_edge(1, 2, 5)
+
+    assert net.max_flow(0, 2) == 1
+
+    net.cap[first] += 2
+    assert net.max_flow(0, 2) == 2
+    assert net.flow(first) == 3
+    assert net.flow(second) == 3
+
+
+def _booked_cells(state):
+    cells = Counter()
+    for _, _, slots, reps in state.log.bookings():
+        for r in reps:
+            for s in slots:
+                cells[(r, s)] += 1
+    return cells
+
+
+def test_innovation_seating(organizer):
+    _, reps_df, preferences, sellers = organizer
+    problem = prepare_problem(preferences, reps_df, sellers)
+    state = ScheduleState(problem)
+
+    assign_minimum_innovation_sessions(problem, state, random.Random(0))
+
+    seated = Counter(
+        r for kind, _, _, reps in state.log.bookings() if kind == INNOVATION for r in reps
+    )
+    assert set(seated) == set(problem.workers)
+    assert all(n == 1 for n in seated.values())
+
+    fill_innovation_sessions_to_capacity(problem, state, random.Random(0))
+
+    for s in problem.innovation_sessions:
+        assert state.innovation_count[s["index"]] <= s["capacity"]
+    assert max(_booked_cells(state).values()) == 1
@@ -0,0 +1,140 @@
+import random
+import time
+import numpy as np
+import pytest
+from app import optimizer
+from app.booking_log import load_std
+from app.optimizer import LoadStats, OBJECTIVE_WEIGHTS, _Annealer, _random_move, optimize_schedule
+from app.repair import MOVABLE_KINDS
+from app.scheduler import (
+    build_phase3_core_scheduler,
+    extend_with_addons,
+    prepare_problem,
+    run_scheduler
+)
+
+
+@pytest.fixture(scope="module")
+def extend(contested_organizer):
+    """Fresh extensions of one core schedule of the contested workbook."""
+    _, reps_df, preferences, sellers = contested_organizer
+    problem = prepare_problem(preferences, reps_df, sellers)
+    core = build_phase3_core_scheduler(preferences, reps_df, sellers, 0, problem=problem)
+    return lambda seed: extend_with_addons(core, reps_df, sellers, seed)
+
+
+def _snapshot(state):
+    return (
+        sorted((i, list(reps), list(slots)) for i, reps, slots in state.placements()),
+        [m.copy() for m in state.busy_matrices()],
+        {m.id: state.outcome(m.id) for m in state.problem.meetings},
+        state.n_unfulfilled,
+        state.n_suppliers_unfulfilled
+    )
+
+
+def _assert_same(a, b):
+    assert a[0] == b[0]
+    assert all((x == y).all() for x, y in zip(a[1], b[1]))
+    assert a[2:] == b[2:]
+
+
+def test_load_stats_matches_value_counts_std():
+    counts = np.array([0, 3, 5, 0, 2, 7])
+    stats = LoadStats(counts)
+    stats.add(0, 4)
+    stats.add(2, -5)
+
+    loaded = stats.counts[stats.counts > 0]
+    assert stats.std() == pytest.approx(loaded.std(ddof=1))
+
+
+@pytest.mark.parametrize("counts", [[0, 3, 5, 2], [4, 4], [0, 0, 7], [0, 0], []])
+def test_load_stats_matches_selection_key(counts):
+    counts = np.array(counts, dtype=np.int64)
+    assert LoadStats(counts).std() == pytest.approx(load_std(counts))
+
+
+def test_undo_restores_state(extend, check_state):
+    state = extend(0)["state"]
+    problem = state.problem
+    sa = _Annealer(problem, state, OBJECTIVE_WEIGHTS)
+
+    movable = [m for m in problem.meetings if m.kind in MOVABLE_KINDS]
+    by_supplier = {}
+    for m in movable:
+        by_supplier.setdefault(m.supplier, []).append(m)
+
+    before = _snapshot(state)
+    objective = sa.objective()
+    rng = random.Random(0)
+
+    moved = sum(_random_move(sa, movable, by_supplier, rng) for _ in range(200))
+    assert moved
+    check_state(state)
+
+    sa.undo(0)
+
+    _assert_same(_snapshot(state), before)
+    assert sa.objective() == pytest.approx(objective)
+    check_state(state)
+
+
+def test_optimize_leaves_best_schedule(extend, check_state):
+    state = extend(1)["state"]
+    problem = state.problem
+
+    report = optimize_schedule(problem, state, random.Random(0), iterations=500)
+
+    assert report["best"] <= report["initial"]
+    assert report["accepted"]
+    check_state(state)
+
+    # The state is rolled back to the best schedule seen
+    rescored = _Annealer(problem, state, OBJECTIVE_WEIGHTS).objective()
+    assert rescored == pytest.approx(report["best"])
+
+
+@pytest.mark.parametrize("moves, iterations, time_budget, elapsed, expected", [
+    (50, 200, None, 0.0, 0.25),
+    (50, 200, 10.0, 5.0, 0.5),      # the clock runs out first
+    (150, 200, 10.0, 5.0, 0.75),    # the moves run out first
+    (0, None, 4.0, 1.0, 0.25),
+    (0, 0, None, 0.0, 1.0),
+    (9, None, 0.0, 0.0, 1.0)
+])
+def test_progress_follows_the_tighter_budget(
+    monkeypatch, moves, iterations, time_budget, elapsed, expected
+):
+    monkeypatch.setattr(optimizer.time, "monotonic", lambda: 100.0 + elapsed)
+    assert optimizer._progress(moves, iterations, time_budget, 100.0) == pytest.approx(expected)
+
+
+def test_needs_a_budget(extend):
+    state = extend(0)["state"]
+    with pytest.raises(ValueError):
+        optimize_schedule(state.problem, state, random.Random(0), iterations=None)
+
+
+def test_time_only_budget(extend, check_state):
+    state = extend(2)["state"]
+    start = time.monotonic()
+
+    report = optimize_schedule(
+        state.problem, state, random.Random(0), iterations=None, time_budget=0.2
+    )
+
+    assert time.monotonic() - start >= 0.2
+    assert report["iterations"] > 0
+    assert report["trajectory"][-1][0] == report["iterations"]
+    assert report["best"] <= report["initial"]
+    check_state(state)
+
+
+def test_run_scheduler_with_optimize_time_only(organizer):
+    _, reps_df, preferences, sellers = organizer
+    *_, diagnostics = run_scheduler(
+        preferences, reps_df, sellers, 1, 1,
+        optimize_time=0.1, return_diagnostics=True
+    )
+    assert diagnostics["optimize"]["iterations"] > 0
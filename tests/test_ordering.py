@@ -0,0 +1,48 @@
+import random
+import pytest
+from app.ordering import flexibility, meeting_order
+from app.repair import place_meeting
+from app.scheduler import prepare_problem
+from app.state import ScheduleState
+
+
+@pytest.fixture(scope="module")
+def problem(contested_organizer):
+    _, reps_df, preferences, sellers = contested_organizer
+    return prepare_problem(preferences, reps_df, sellers)
+
+
+def test_input_order_is_unchanged(problem):
+    state = ScheduleState(problem)
+    meetings = problem.meetings_of("planning")
+    assert list(meeting_order(problem, state, meetings)) == meetings
+
+
+def test_unknown_ordering(problem):
+    with pytest.raises(ValueError):
+        list(meeting_order(problem, ScheduleState(problem), [], "alphabetical"))
+
+
+def test_constrained_order_follows_bookings(problem):
+    state = ScheduleState(problem)
+    meetings = problem.meetings_of("planning")
+    rank = {m.id: i for i, m in enumerate(meetings)}
+    rng = random.Random(0)
+
+    static = sorted(meetings, key=lambda m: (flexibility(problem, state, m), rank[m.id]))
+
+    pending = list(meetings)
+    order = []
+
+    for m in meeting_order(problem, state, meetings, "constrained"):
+        # Always the tightest meeting on the live state
+        tightest = min(pending, key=lambda p: (flexibility(problem, state, p), rank[p.id]))
+        assert m is tightest
+
+        pending.remove(m)
+        order.append(m)
+        if place_meeting(problem, state, m, rng):
+            state.record(m, True)
+
+    assert not pending
+    assert order != static
@@ -0,0 +1,28 @@
+import numpy as np
+import pandas as pd
+import pytest
+from app.parsers import _parse_attendees
+
+
+@pytest.mark.parametrize("raw, expected", [
+    (np.nan, []),
+    (None, []),
+    (" - ", []),
+    ("None", []),
+    (",", []),
+    (" Seller A , ,Seller B ", ["Seller A", "Seller B"]),
+    ("K5-6 San Diego", ["K5-6 San Diego"]),
+    (5, ["5"])
+])
+def test_parse_attendees(raw, expected):
+    assert _parse_attendees(pd.Series([raw], dtype=object)).tolist() == [expected]
+
+
+def test_parse_attendees_keeps_row_index():
+    col = pd.Series(["b, c", np.nan, "a", "-"], index=[7, 3, 5, 1])
+    attendees = _parse_attendees(col)
+
+    assert attendees.index.tolist() == [7, 3, 5, 1]
+    assert attendees.tolist() == [["b", "c"], [], ["a"], []]
+    # Empty rows get their own list
+    assert attendees[3] is not attendees[1]
@@ -0,0 +1,108 @@
+import numpy as np
+import pandas as pd
+import pytest
+from app.problem import TimeGrid, compile_problem
+from app.scheduler import run_scheduler
+from app.seller_index import build_seller_index
+from app.utils import power_pairing_blocked
+
+SLOTS = {
+    "Mon": {"8:00": "", "8:30": "", "9:00": "LUNCH", "9:30": "", "10:00": ""},
+    "Tue": {"8:00": "", "8:30": ""}
+}
+
+
+def test_grid_numbers_slots_day_by_day():
+    grid = TimeGrid(SLOTS)
+
+    assert grid.n_slots == 7
+    assert grid.keys[0] == ("Mon", "8:00")
+    assert grid.slot("Tue", "8:30") == 6
+    assert grid.day_bounds == [(0, 5), (5, 7)]
+    assert grid.day_of.tolist() == [0, 0, 0, 0, 0, 1, 1]
+    assert grid.single_slots == [0, 1, 3, 4, 5, 6]
+
+
+@pytest.mark.parametrize("length, expected", [
+    (1, [(0,), (1,), (3,), (4,), (5,), (6,)]),
+    # never across lunch (2) or from one day into the next (4 -> 5)
+    (2, [(0, 1), (3, 4), (5, 6)]),
+    (3, [])
+])
+def test_windows_stay_in_one_day_and_skip_lunch(length, expected):
+    grid = TimeGrid(SLOTS)
+
+    assert grid.windows(length) == expected
+    assert np.flatnonzero(grid.start_mask(length)).tolist() == [w[0] for w in expected]
+
+
+def _sellers():
+    return pd.DataFrame({
+        "district": ["K1", "K1", "K1", "K2"],
+        "name": ["Seller A", "Seller B", "Seller A", "Seller C"],
+        "product_line": ["MRO", "MRO", "SAFETY", "MRO"],
+        "opportunity": [10.0, 30.0, 50.0, 20.0]
+    })
+
+
+def _request(name, session, attendees):
+    return {
+        "request_name": name, "session_type": session, "booth": 1,
+        "total_opportunity": 0.0, "requested_attendees": attendees
+    }
+
+
+def test_compile_interns_names_and_ranks_candidates():
+    reps_df = pd.DataFrame({"Rep Name": ["Leader K1", "Seller A", "Seller B", "Seller C"]})
+    phase1 = {
+        "Acme": [
+            _request("Acme 1", "Strategy", [
+                "Leader K1", {"type": "seller_spot", "district": "K1", "count": 1}
+            ]),
+            _request("Acme 2", "Planning", [
+                "Nobody", {"type": "seller_spot", "district": "k1", "product_line": "mro", "count": 2}
+            ])
+        ],
+        "Bolt": [_request("Bolt 1", "Power Pairing", ["Seller C"])]
+    }
+
+    problem = compile_problem(phase1, reps_df, build_seller_index(_sellers()), [], [])
+    strategy, planning, pairing = problem.meetings
+
+    assert problem.suppliers == ["Acme", "Bolt"]
+    assert (strategy.kind, strategy.fixed, strategy.seats) == ("strategy", [0], 1)
+    # Highest opportunity first, each seller once
+    assert strategy.candidates == [1, 2]
+    assert (planning.candidates, planning.seats, planning.missing) == ([2, 1], 2, ["Nobody"])
+    assert (pairing.supplier, pairing.fixed, pairing.candidates) == (1, [3], [])
+
+    assert problem.meetings_of("planning") == [planning]
+    assert problem.session_shape("strategy") == (2, problem.grid.pair_starts)
+    assert problem.session_shape("planning") == (1, problem.grid.bookable)
+
+
+
+def test_power_pairing_mask_skips_blocked_slots():
+    reps_df = pd.DataFrame({"Rep Name": ["Seller A"]})
+    phase1 = {"Acme": [_request("Acme 1", "Power Pairing", ["Seller A"])]}
+    problem = compile_problem(phase1, reps_df, build_seller_index(_sellers()), [], [])
+    grid = problem.grid
+
+    blocked = [grid.slot(day, slot) for day, slots in power_pairing_blocked.items() for slot in slots]
+    assert blocked
+
+    mask = problem.power_pairing_mask
+    assert not mask[blocked].any()
+    assert not (mask & grid.lunch).any()
+    assert mask.sum() == grid.bookable.sum() - len(blocked)
+    assert problem.session_shape("power pairing") == (1, mask)
+
+
+def test_no_power_pairing_in_blocked_slots(organizer):
+    _, reps_df, preferences, sellers = organizer
+    supplier_sched, _, _, _ = run_scheduler(preferences, reps_df, sellers, 1, 1)
+
+    pairings = supplier_sched[supplier_sched["session_type"] == "Power Pairing"]
+    assert len(pairings)
+    for day, slots in power_pairing_blocked.items():
+        assert not ((pairings["day"] == day) & pairings["timeslot"].isin(slots)).any()
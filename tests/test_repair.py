@@ -0,0 +1,78 @@
+import random
+import pytest
+from app import repair
+from app.repair import repair_schedule
+from app.scheduler import (
+    build_phase3_core_scheduler,
+    extend_with_addons,
+    fill_innovation_sessions_to_capacity,
+    prepare_problem
+)
+
+
+@pytest.fixture(scope="module")
+def unfilled(contested_organizer):
+    """Winning-seed extension of the contested workbook, stopped before pass B."""
+    _, reps_df, preferences, sellers = contested_organizer
+    problem = prepare_problem(preferences, reps_df, sellers)
+    core = build_phase3_core_scheduler(preferences, reps_df, sellers, 0, problem=problem)
+    return problem, lambda: extend_with_addons(core, reps_df, sellers, 0, fill=False)
+
+
+def _snapshot(state):
+    return sorted(
+        (i, list(reps), list(slots)) for i, reps, slots in state.placements()
+    ), [m.copy() for m in state.busy_matrices()]
+
+
+def test_repair_keeps_state_valid(unfilled, check_state):
+    problem, extend = unfilled
+    extended = extend()
+    state = extended["state"]
+    before = state.n_unfulfilled
+
+    stats = repair_schedule(problem, state, random.Random(0))
+
+    assert stats["repaired"] > 0
+    assert state.n_unfulfilled == before - stats["repaired"]
+    check_state(state)
+
+    # Pass B fills around the repaired schedule
+    fill_innovation_sessions_to_capacity(problem, state, extended["rng"])
+    check_state(state)
+
+
+def test_failed_ejection_rolls_back(unfilled, check_state, monkeypatch):
+    problem, extend = unfilled
+    state = extend()["state"]
+    calls = {"rolled_back": 0, "ejected": 0}
+
+    eject_for, book = repair._eject_for, repair._book
+    books = []
+
+    def counting_book(*args):
+        books.append(args)
+        return book(*args)
+
+    def checked_eject_for(problem, state, occ, m, rng):
+        before = _snapshot(state)
+        books.clear()
+
+        if eject_for(problem, state, occ, m, rng):
+            calls["ejected"] += 1
+            return True
+
+        placements, busy = _snapshot(state)
+        assert placements == before[0]
+        assert all((a == b).all() for a, b in zip(busy, before[1]))
+        if books:
+            calls["rolled_back"] += 1
+        return False
+
+    monkeypatch.setattr(repair, "_book", counting_book)
+    monkeypatch.setattr(repair, "_eject_for", checked_eject_for)
+
+    repair_schedule(problem, state, random.Random(0))
+
+    assert calls["ejected"] and calls["rolled_back"]
+    check_state(state)
@@ -0,0 +1,74 @@
+import pytest
+from app import scheduler
+from app.scheduler import build_phase3_core_scheduler, extend_with_addons, materialize_schedules, run_scheduler
+
+
+def _run(organizer, *args, **kwargs):
+    _, reps_df, preferences, sellers = organizer
+    return run_scheduler(preferences, reps_df, sellers, *args, return_diagnostics=True, **kwargs)
+
+
+def _assert_same_schedule(a, b):
+    assert a[0].equals(b[0])
+    assert a[1].equals(b[1])
+    assert a[2] == b[2]
+    assert a[3] == b[3]
+
+
+def test_workers_pick_the_same_seeds(contested_organizer):
+    sequential = _run(contested_organizer, 3, 3, workers=1)
+    parallel = _run(contested_organizer, 3, 3, workers=2)
+
+    assert sequential[4]["core"] == parallel[4]["core"]
+    assert sequential[4]["addon"] == parallel[4]["addon"]
+    _assert_same_schedule(sequential, parallel)
+
+
+def test_anytime_stops_at_the_floor(organizer):
+    # Seed 0 already books everything bookable in the small workbook
+    *_, diagnostics = _run(organizer, None, None, time_budget=0.5, repair=False)
+    search = diagnostics["search"]
+
+    assert search["core_stop"] == "optimal"
+    assert len(diagnostics["core"]) == 1
+    core = diagnostics["core"][0]
+    assert core["total_unfulfilled"] == core["unfulfilled_floor"]
+
+
+def test_anytime_addon_phase_stops_when_optimal(organizer, monkeypatch):
+    monkeypatch.setattr(scheduler, "_addon_is_optimal", lambda d: True)
+
+    *_, diagnostics = _run(organizer, None, None, time_budget=5.0, repair=False)
+
+    assert diagnostics["search"]["addon_stop"] == "optimal"
+    assert len(diagnostics["addon"]) == 1
+    assert diagnostics["search"]["elapsed"] < 5.0
+
+
+def test_anytime_runs_to_the_deadline(contested_organizer):
+    *_, diagnostics = _run(contested_organizer, None, None, time_budget=0.5, repair=False)
+    search = diagnostics["search"]
+
+    assert search["core_stop"] == "deadline"
+    assert search["addon_stop"] == "deadline"
+    assert search["elapsed"] >= 0.5
+    assert len(diagnostics["core"]) > 1
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_anytime_returns_the_selected_seeds(contested_organizer, workers):
+    _, reps_df, preferences, sellers = contested_organizer
+    output = _run(contested_organizer, None, None, time_budget=0.5, workers=workers, repair=False)
+    diagnostics = output[4]
+
+    core_seed = min(diagnostics["core"], key=lambda d: (scheduler._core_key(d), d["seed"]))["seed"]
+    addon_seed = min(diagnostics["addon"], key=lambda d: (scheduler._addon_key(d), d["seed"]))["seed"]
+
+    core = build_phase3_core_scheduler(preferences, reps_df, sellers, core_seed)
+    supplier_sched, rep_sched, summary = materialize_schedules(
+        extend_with_addons(core, reps_df, sellers, addon_seed)
+    )
+
+    assert output[0].equals(supplier_sched)
+    assert output[1].equals(rep_sched)
+    assert output[2] == summary
@@ -0,0 +1,68 @@
+import pytest
+from app.scheduler import run_scheduler
+from app.seller_index import build_seller_index
+
+
+def _per_call_ranking(sellers_opp_df, district, product_line=None):
+    """Names as the phases used to rank them: filter, then sort per call."""
+    candidates = sellers_opp_df[sellers_opp_df["district"].str.upper() == district]
+    if product_line:
+        candidates = candidates[candidates["product_line"] == product_line.upper().strip()]
+    return candidates.sort_values("opportunity", ascending=False, kind="mergesort")
+
+
+def test_index_ranks_like_per_call_sort(organizer):
+    _, _, _, sellers = organizer
+    index = build_seller_index(sellers)
+
+    spots = [(d, None) for d in sellers["district"].unique()] + list(
+        sellers[["district", "product_line"]].drop_duplicates().itertuples(index=False)
+    )
+    assert spots
+
+    for district, product_line in spots:
+        ranked = _per_call_ranking(sellers, district, product_line)
+        first = ranked.drop_duplicates("name")
+
+        found = index.lookup(district, product_line)
+        assert [index.names[i] for i in found.ids] == first["name"].tolist()
+        assert found.opportunity.tolist() == first["opportunity"].tolist()
+
+
+def test_lookup_normalizes_spot_and_misses_empty(organizer):
+    _, _, _, sellers = organizer
+    index = build_seller_index(sellers)
+    district, product_line = sellers.iloc[0][["district", "product_line"]]
+
+    found = index.lookup(f" {district.lower()} ", product_line.lower())
+    assert found.ids.tolist() == index.lookup(district, product_line).ids.tolist()
+    assert len(index.lookup("NO SUCH DISTRICT").ids) == 0
+
+
+def test_no_meeting_books_a_rep_twice(organizer):
+    suppliers_df, reps_df, preferences, sellers = organizer
+
+    # Sellers have several product lines, so the per-call ranking of a
+    # district lists them more than once
+    district = sellers["district"].iloc[0]
+    assert _per_call_ranking(sellers, district)["name"].duplicated().any()
+
+    supplier_sched, rep_sched, _, _ = run_scheduler(preferences, reps_df, sellers, 2, 2)
+
+    for reps in supplier_sched["reps"]:
+        if isinstance(reps, list):
+            assert len(reps) == len(set(reps))
+    assert not rep_sched.duplicated(["rep", "day", "timeslot"]).any()
+
+
+@pytest.mark.parametrize("ordering", ["input", "constrained"])
+def test_planning_pairs_two_different_sellers(organizer, ordering):
+    _, reps_df, preferences, sellers = organizer
+    supplier_sched, _, _, _ = run_scheduler(
+        preferences, reps_df, sellers, 1, 1, ordering=ordering
+    )
+
+    planning = supplier_sched[supplier_sched["session_type"] == "Planning"]
+    assert len(planning)
+    for reps in planning["reps"]:
+        assert len(reps) == len(set(reps))
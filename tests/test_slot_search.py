@@ -0,0 +1,107 @@
+from itertools import combinations
+import numpy as np
+import pytest
+from app.problem import TimeGrid
+from app.slot_search import find_seller_group, first_free, window_starts
+
+
+def _mask(bits):
+    return np.array([c == "1" for c in bits], dtype=bool)
+
+
+def _matrix(*rows):
+    return np.array([_mask(r) for r in rows])
+
+
+@pytest.mark.parametrize("order, free, expected", [
+    ([0, 1, 2, 3], "0011", 2),
+    ([3, 2, 1, 0], "0011", 3),
+    ([1, 0], "0011", None),
+    ([], "1111", None)
+])
+def test_first_free(order, free, expected):
+    assert first_free(order, _mask(free)) == expected
+
+
+@pytest.mark.parametrize("base, sellers, seats, expected", [
+    # no seats: any usable slot will do
+    ("0110", [], 0, ((), "0110")),
+    ("0000", [], 0, None),
+    # one seat: best-ranked seller overlapping base
+    ("0011", ["1100", "0010", "0011"], 1, ((1,), "0010")),
+    ("0011", ["1100", "1000"], 1, None),
+    # two seats: first pair in combinations() order sharing a slot
+    ("1111", ["1000", "0100", "0110", "1001"], 2, ((0, 3), "1000")),
+    ("1111", ["1100", "0011", "0010"], 2, ((1, 2), "0010")),
+    # base prunes the shared slot away
+    ("0111", ["1100", "1001"], 2, None),
+    ("1111", ["1000", "0100", "0010"], 2, None),
+    # three seats
+    ("1111", ["1100", "0110", "0111", "0101"], 3, ((0, 1, 2), "0100")),
+    ("1111", ["1000", "0110", "0111", "0101"], 3, ((1, 2, 3), "0100")),
+    ("1111", ["1100", "0110", "0011"], 3, None),
+    ("1111", ["1111", "1111"], 3, None)
+])
+def test_find_seller_group(base, sellers, seats, expected):
+    seller_free = _matrix(*sellers) if sellers else np.zeros((0, len(base)), dtype=bool)
+    found = find_seller_group(_mask(base), seller_free, seats)
+
+    if expected is None:
+        assert found is None
+    else:
+        picks, common = found
+        assert (picks, common.tolist()) == (expected[0], _mask(expected[1]).tolist())
+
+
+def test_find_seller_group_matches_brute_force():
+    rng = np.random.default_rng(0)
+
+    for _ in range(200):
+        base = rng.random(8) < 0.7
+        seller_free = rng.random((6, 8)) < 0.3
+        seats = int(rng.integers(1, 4))
+
+        expected = None
+        for group in combinations(range(6), seats):
+            common = base & np.logical_and.reduce(seller_free[list(group)])
+            if common.any():
+                expected = (group, common)
+                break
+
+        found = find_seller_group(base, seller_free, seats)
+        if expected is None:
+            assert found is None
+        else:
+            assert found[0] == expected[0]
+            assert found[1].tolist() == expected[1].tolist()
+
+
+# Mon: 0 1 | lunch 2 | 3 4, Tue: 5 6
+GRID = TimeGrid({
+    "Mon": {"8:00": "", "8:30": "", "9:00": "LUNCH", "9:30": "", "10:00": ""},
+    "Tue": {"8:00": "", "8:30": ""}
+})
+
+
+@pytest.mark.parametrize("free, length, expected", [
+    ("1111111", 1, "1101111"),
+    # 1 -> lunch and 4 -> next day are free but not valid starts
+    ("1111111", 2, "1001010"),
+    ("0111111", 2, "0001010"),
+    ("1101101", 2, "1001000"),
+    ("1111111", 3, "0000000"),
+    ("0000000", 2, "0000000")
+])
+def test_window_starts(free, length, expected):
+    starts = GRID.start_mask(length) if length > 1 else GRID.bookable
+    assert window_starts(_mask(free), length, starts).tolist() == _mask(expected).tolist()
+
+
+def test_window_starts_per_row_without_touching_free():
+    free = _matrix("1111111", "1011011", "0001111")
+    before = free.copy()
+
+    ok = window_starts(free, 2, GRID.start_mask(2))
+
+    assert ok.tolist() == [_mask(r).tolist() for r in ("1001010", "0000010", "0001010")]
+    assert (free == before).all()
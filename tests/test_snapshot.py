@@ -0,0 +1,83 @@
+import io
+import json
+import zipfile
+import pandas as pd
+import pytest
+from app.scheduler import run_scheduler
+from app.snapshot import FRAMES, OBJECTS, SNAPSHOT_FORMAT, load_snapshot, snapshot_bytes
+
+
+@pytest.fixture(scope="module")
+def snapshot(organizer):
+    suppliers_df, reps_df, preferences, sellers = organizer
+    supplier_sched, rep_sched, summary, validation = run_scheduler(
+        preferences, reps_df, sellers, 1, 1
+    )
+    return {
+        "suppliers_df": suppliers_df,
+        "reps_df": reps_df,
+        "preferences": preferences,
+        "sellers_opp_df": sellers,
+        "supplier_sched": supplier_sched,
+        "rep_sched": rep_sched,
+        "supplier_summary": summary,
+        "validation": validation
+    }
+
+
+def _round_trip(snapshot):
+    return load_snapshot(io.BytesIO(snapshot_bytes(**snapshot)))
+
+
+def test_round_trips_run_scheduler_output(snapshot):
+    loaded = _round_trip(snapshot)
+
+    for name in FRAMES:
+        pd.testing.assert_frame_equal(loaded[name], snapshot[name])
+    for name in OBJECTS:
+        assert loaded[name] == snapshot[name]
+
+    # List cells stay lists
+    assert any(isinstance(reps, list) for reps in loaded["supplier_sched"]["reps"])
+
+
+def test_round_trips_column_and_index_kinds(snapshot):
+    odd = pd.DataFrame(
+        {
+            "count": [1, 2, 3],
+            "share": [0.5, float("nan"), 1.5],
+            "flag": [True, False, True],
+            "when": pd.to_datetime(["2026-02-23 08:00", "2026-02-24 09:30", None]),
+            "name": ["a", None, "c"],
+            "nullable": pd.array([1, pd.NA, 3], dtype="Int64"),
+            "text": pd.array(["x", pd.NA, "z"], dtype="string"),
+            "reps": [["A", "B"], [], ["C"]]
+        },
+        index=pd.Index([10, 20, 5])
+    )
+    sliced = snapshot["rep_sched"].iloc[::2]
+
+    loaded = _round_trip(dict(snapshot, sellers_opp_df=odd, rep_sched=sliced))
+
+    pd.testing.assert_frame_equal(loaded["sellers_opp_df"], odd)
+    pd.testing.assert_frame_equal(loaded["rep_sched"], sliced)
+
+
+def _archive(files):
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as zf:
+        for name, data in files.items():
+            zf.writestr(name, data)
+    buf.seek(0)
+    return buf
+
+
+@pytest.mark.parametrize("file", [
+    io.BytesIO(b"not a zip file"),
+    _archive({"other.json": "{}"}),
+    _archive({"manifest.json": json.dumps({"format": "something else", "version": 1})}),
+    _archive({"manifest.json": json.dumps({"format": SNAPSHOT_FORMAT, "version": 99})})
+], ids=["bad zip", "no manifest", "wrong format", "wrong version"])
+def test_rejects_other_files(file):
+    with pytest.raises(ValueError):
+        load_snapshot(file)